@@ -8,7 +8,7 @@ from sqlalchemy import engine_from_config, pool
 from sqlalchemy_utils import create_database, database_exists
 
 from alembic import context
-from apps.common.db import Base, engine
+from apps.common.db import Base, get_engine
 from apps.likes.models import Base as LikesBase  # type: ignore
 from apps.posts.models import Base as PostsBase  # type: ignore
 from apps.user.models import Base as UserBase  # type: ignore
@@ -66,7 +66,7 @@ def run_migrations_online() -> None:
     )
 
     if connectable is None:
-        connectable = engine
+        connectable = get_engine()
 
     with connectable.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
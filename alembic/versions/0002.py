@@ -0,0 +1,101 @@
+"""Migration 0002.
+
+Revision ID: 3f9c2d7a8b41
+Revises: 567950aba1b4
+Create Date: 2026-10-18 10:45:12.431907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2d7a8b41"
+down_revision: Union[str, None] = "567950aba1b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+apply_like_counters_function = """
+CREATE FUNCTION apply_like_counters() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE post
+        SET like_count = post.like_count - deltas.likes,
+            dislike_count = post.dislike_count - deltas.dislikes
+        FROM (
+            SELECT post_id,
+                count(*) FILTER (WHERE eval) AS likes,
+                count(*) FILTER (WHERE NOT eval) AS dislikes
+            FROM old_likes
+            GROUP BY post_id
+        ) AS deltas
+        WHERE post.id = deltas.post_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE post
+        SET like_count = post.like_count + deltas.likes,
+            dislike_count = post.dislike_count + deltas.dislikes
+        FROM (
+            SELECT post_id,
+                count(*) FILTER (WHERE eval) AS likes,
+                count(*) FILTER (WHERE NOT eval) AS dislikes
+            FROM new_likes
+            GROUP BY post_id
+        ) AS deltas
+        WHERE post.id = deltas.post_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+fill_like_counters = """
+UPDATE post
+SET like_count = (
+        SELECT count(*) FROM "like" WHERE "like".post_id = post.id AND "like".eval
+    ),
+    dislike_count = (
+        SELECT count(*) FROM "like" WHERE "like".post_id = post.id AND NOT "like".eval
+    )
+"""
+like_counters_triggers = (
+    ("like_counters_insert", "INSERT", "NEW TABLE AS new_likes"),
+    ("like_counters_update", "UPDATE", "OLD TABLE AS old_likes NEW TABLE AS new_likes"),
+    ("like_counters_delete", "DELETE", "OLD TABLE AS old_likes"),
+)
+
+
+def upgrade() -> None:
+    """Perform migrations."""
+    op.add_column(
+        "post",
+        sa.Column("like_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "post",
+        sa.Column("dislike_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(apply_like_counters_function)
+    for trigger_name, trigger_event, transition_tables in like_counters_triggers:
+        op.execute(
+            'CREATE TRIGGER {name} AFTER {event} ON "like" '.format(
+                name=trigger_name,
+                event=trigger_event,
+            )
+            + "REFERENCING {tables} ".format(tables=transition_tables)
+            + "FOR EACH STATEMENT EXECUTE FUNCTION apply_like_counters()",
+        )
+    op.execute(fill_like_counters)
+
+
+def downgrade() -> None:
+    """Cancel migrations."""
+    for trigger_name, _, _ in like_counters_triggers:
+        op.execute(
+            'DROP TRIGGER {name} ON "like"'.format(name=trigger_name),
+        )
+    op.execute("DROP FUNCTION apply_like_counters()")
+    op.drop_column("post", "dislike_count")
+    op.drop_column("post", "like_count")
@@ -0,0 +1,53 @@
+"""Migration 0003.
+
+Revision ID: 8d14e6b0c5a2
+Revises: 3f9c2d7a8b41
+Create Date: 2026-10-18 11:02:47.118204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d14e6b0c5a2"
+down_revision: Union[str, None] = "3f9c2d7a8b41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Perform migrations."""
+    op.create_table(
+        "like_daily",
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("likes", sa.Integer(), nullable=False),
+        sa.Column("dislikes", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ("post_id",),
+            ["post.id"],
+            name=op.f("like_daily_post_id_fkey"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("post_id", "day", name=op.f("like_daily_pkey")),
+    )
+    op.create_index(op.f("like_daily_day_idx"), "like_daily", ["day"])
+    watermark_table = op.create_table(
+        "rollup_watermark",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("last_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name", name=op.f("rollup_watermark_pkey")),
+    )
+    op.bulk_insert(watermark_table, [{"name": "like_daily", "last_id": 0}])
+
+
+def downgrade() -> None:
+    """Cancel migrations."""
+    op.drop_table("rollup_watermark")
+    op.drop_index(op.f("like_daily_day_idx"), table_name="like_daily")
+    op.drop_table("like_daily")
@@ -0,0 +1,84 @@
+"""Migration 0004.
+
+Revision ID: b27e90f4c6d3
+Revises: 8d14e6b0c5a2
+Create Date: 2026-10-18 11:24:09.570318
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b27e90f4c6d3"
+down_revision: Union[str, None] = "8d14e6b0c5a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEDUPLICATION_BATCH_SIZE = 10000
+DEDUPLICATION_INDEX = "like_user_id_post_id_id_idx"
+delete_duplicates_batch = """
+DELETE FROM "like"
+WHERE "like".id >= :first_id AND "like".id < :next_id AND EXISTS (
+    SELECT 1
+    FROM "like" AS newer_like
+    WHERE newer_like.user_id = "like".user_id
+        AND newer_like.post_id = "like".post_id
+        AND newer_like.id > "like".id
+)
+"""
+
+
+def delete_duplicates() -> None:
+    """Delete all likes of user to post, except the newest one.
+
+    Likes are walked by id ranges, range per transaction, duplicates are
+    found by temporary index.
+    """
+    connection = op.get_bind()
+    max_id = connection.execute(sa.text('SELECT max(id) FROM "like"')).scalar()
+    for first_id in range(0, (max_id or 0) + 1, DEDUPLICATION_BATCH_SIZE):
+        connection.execute(
+            sa.text(delete_duplicates_batch),
+            {"first_id": first_id, "next_id": first_id + DEDUPLICATION_BATCH_SIZE},
+        )
+
+
+def upgrade() -> None:
+    """Perform migrations.
+
+    Statements run in autocommit mode, so every batch is committed and
+    indexes are built without blocking writes.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            DEDUPLICATION_INDEX,
+            "like",
+            ["user_id", "post_id", "id"],
+            postgresql_concurrently=True,
+        )
+        delete_duplicates()
+        op.create_index(
+            op.f("like_user_id_key"),
+            "like",
+            ["user_id", "post_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.execute(
+            'ALTER TABLE "like" ADD CONSTRAINT like_user_id_key '
+            + "UNIQUE USING INDEX like_user_id_key",
+        )
+        op.drop_index(
+            DEDUPLICATION_INDEX,
+            table_name="like",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Cancel migrations."""
+    op.drop_constraint(op.f("like_user_id_key"), "like", type_="unique")
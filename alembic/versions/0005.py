@@ -0,0 +1,46 @@
+"""Migration 0005.
+
+Revision ID: e41a7c9d2f05
+Revises: b27e90f4c6d3
+Create Date: 2026-10-18 11:41:36.204817
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e41a7c9d2f05"
+down_revision: Union[str, None] = "b27e90f4c6d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+indexes = (
+    ("post_user_id_idx", "post", "user_id"),
+    ("like_post_id_idx", "like", "post_id"),
+    ("like_created_at_idx", "like", "created_at"),
+)
+
+
+def upgrade() -> None:
+    """Perform migrations."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in indexes:
+            op.create_index(
+                op.f(index_name),
+                table_name,
+                [column_name],
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Cancel migrations."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in indexes:
+            op.drop_index(
+                op.f(index_name),
+                table_name=table_name,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,51 @@
+"""Migration 0006.
+
+Revision ID: 5c0d8e3b7a19
+Revises: e41a7c9d2f05
+Create Date: 2026-10-18 12:03:52.716440
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c0d8e3b7a19"
+down_revision: Union[str, None] = "e41a7c9d2f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Perform migrations."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "post_user_id_created_at_id_idx",
+            "post",
+            ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("post_user_id_idx"),
+            table_name="post",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Cancel migrations."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("post_user_id_idx"),
+            "post",
+            ["user_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "post_user_id_created_at_id_idx",
+            table_name="post",
+            postgresql_concurrently=True,
+        )
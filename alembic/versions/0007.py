@@ -0,0 +1,90 @@
+"""Migration 0007.
+
+Revision ID: 9a6f3e1c0b58
+Revises: 5c0d8e3b7a19
+Create Date: 2026-10-18 12:21:36.904127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a6f3e1c0b58"
+down_revision: Union[str, None] = "5c0d8e3b7a19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+apply_like_daily_changes_function = """
+CREATE FUNCTION apply_like_daily_changes() RETURNS trigger AS $$
+DECLARE
+    rolled_up_id integer;
+BEGIN
+    SELECT last_id INTO rolled_up_id
+    FROM rollup_watermark
+    WHERE name = 'like_daily'
+    FOR SHARE;
+    UPDATE like_daily
+    SET likes = like_daily.likes - deltas.likes,
+        dislikes = like_daily.dislikes - deltas.dislikes
+    FROM (
+        SELECT post_id,
+            (created_at AT TIME ZONE 'UTC')::date AS day,
+            count(*) FILTER (WHERE eval) AS likes,
+            count(*) FILTER (WHERE NOT eval) AS dislikes
+        FROM old_likes
+        WHERE id <= rolled_up_id
+        GROUP BY 1, 2
+    ) AS deltas
+    WHERE like_daily.post_id = deltas.post_id AND like_daily.day = deltas.day;
+    IF TG_OP = 'UPDATE' THEN
+        INSERT INTO like_daily (post_id, day, likes, dislikes)
+        SELECT post_id,
+            (created_at AT TIME ZONE 'UTC')::date,
+            count(*) FILTER (WHERE eval),
+            count(*) FILTER (WHERE NOT eval)
+        FROM new_likes
+        WHERE id <= rolled_up_id
+        GROUP BY 1, 2
+        ON CONFLICT (post_id, day) DO UPDATE
+        SET likes = like_daily.likes + excluded.likes,
+            dislikes = like_daily.dislikes + excluded.dislikes;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+like_daily_triggers = (
+    ("like_daily_update", "UPDATE", "OLD TABLE AS old_likes NEW TABLE AS new_likes"),
+    ("like_daily_delete", "DELETE", "OLD TABLE AS old_likes"),
+)
+
+
+def upgrade() -> None:
+    """Perform migrations.
+
+    Likes, which are already added to daily rollup, are applied to it on
+    update and delete, newer ones are added by refresh as they are. Trigger
+    reads watermark with share lock, so it waits for running refresh and
+    refresh waits for likes transactions, which read the old watermark.
+    """
+    op.execute(apply_like_daily_changes_function)
+    for trigger_name, trigger_event, transition_tables in like_daily_triggers:
+        op.execute(
+            'CREATE TRIGGER {name} AFTER {event} ON "like" '.format(
+                name=trigger_name,
+                event=trigger_event,
+            )
+            + "REFERENCING {tables} ".format(tables=transition_tables)
+            + "FOR EACH STATEMENT EXECUTE FUNCTION apply_like_daily_changes()",
+        )
+
+
+def downgrade() -> None:
+    """Cancel migrations."""
+    for trigger_name, _, _ in like_daily_triggers:
+        op.execute(
+            'DROP TRIGGER {name} ON "like"'.format(name=trigger_name),
+        )
+    op.execute("DROP FUNCTION apply_like_daily_changes()")
@@ -0,0 +1,40 @@
+"""Production server runner.
+
+Run with ``python -m apps``. Server is started on HOST and PORT with
+WORKERS_COUNT processes, using uvloop and httptools, if they are installed.
+
+- Workers create application by factory, so engines and pools are created
+  by lifespan in each worker, nothing is inherited from supervisor process.
+- On SIGTERM workers stop accepting connections, finish in-flight requests
+  within GRACEFUL_SHUTDOWN_TIMEOUT seconds and run lifespan shutdown.
+- Workers exit after WORKER_MAX_REQUESTS requests, if it is positive, and
+  supervisor starts new ones, which needs uvicorn 0.30 at least, as older
+  supervisor does not restart exited workers. Single worker server has no
+  supervisor, so it exits then and has to be restarted by process manager.
+"""
+from importlib.util import find_spec
+
+import uvicorn
+
+from settings import Settings
+
+
+def run_server() -> None:
+    """Run server with settings."""
+    uvicorn.run(
+        'apps.main:create_app',
+        factory=True,
+        host=Settings.HOST,
+        port=Settings.PORT,
+        workers=Settings.WORKERS_COUNT,
+        loop='uvloop' if find_spec('uvloop') else 'asyncio',
+        http='httptools' if find_spec('httptools') else 'h11',
+        limit_max_requests=Settings.WORKER_MAX_REQUESTS or None,
+        timeout_graceful_shutdown=Settings.GRACEFUL_SHUTDOWN_TIMEOUT,
+        log_level=Settings.LOG_LEVEL,
+        use_colors=Settings.LOG_USE_COLORS,
+    )
+
+
+if __name__ == '__main__':
+    run_server()
@@ -1,10 +1,13 @@
 """Authorization apps utilities functionality."""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+from fastapi import status
 from jose import jwt
 from passlib.context import CryptContext
 from pytz import utc
-from typing_extensions import Any, Optional
+from typing_extensions import Any, Callable, Optional
 
 from apps.common.common_types import ModelType
 from apps.common.exceptions import BackendError
@@ -54,9 +57,9 @@ def verify_user(user: Optional[ModelType]) -> None:
         )
 
 
-def verify_password(user: ModelType, password: str) -> None:
+async def verify_password(user: ModelType, password: str) -> None:
     """Verify user password."""
-    if not check_password(password, user.password):
+    if not await password_service.check_password(password, user.password):
         raise BackendError(
             message='Login or password is invalid. Please, try again.',
         )
@@ -65,3 +68,72 @@ def verify_password(user: ModelType, password: str) -> None:
 def check_password(password: str, hashed_pass: str) -> bool:
     """Check user password with password context."""
     return password_context.verify(password, hashed_pass)
+
+
+class PasswordService(object):
+    """Password hashing and verification in worker pool, off the event loop.
+
+    Operations over pending limit are rejected instead of being queued.
+    """
+
+    def __init__(self, executor_type: str, max_workers: int, max_pending: int) -> None:
+        """Initialize class instance."""
+        self._executor_type = executor_type
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._pending = 0
+        self._executor: Optional[Executor] = None
+
+    async def hash_password(self, password: str) -> str:
+        """Get hashed password."""
+        return await self._run(get_hashed_password, password)
+
+    async def check_password(self, password: str, hashed_pass: str) -> bool:
+        """Check user password with password context."""
+        return await self._run(check_password, password, hashed_pass)
+
+    def shutdown(self) -> None:
+        """Shutdown worker pool, if it was started."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, operation: Callable[..., Any], *args: str) -> Any:
+        """Run operation in worker pool.
+
+        Operation is awaited through shield, so cancelled caller does not
+        release its slot, till the operation is finished in worker pool.
+        """
+        if self._pending >= self._max_pending:
+            raise BackendError(
+                message='Too many password operations. Please, try again later.',
+                code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        self._pending += 1
+        operation_future = asyncio.get_running_loop().run_in_executor(
+            self._get_executor(),
+            operation,
+            *args,
+        )
+        operation_future.add_done_callback(self._on_done)
+        return await asyncio.shield(operation_future)
+
+    def _get_executor(self) -> Executor:
+        """Get worker pool, starting it on first use."""
+        if self._executor is None:
+            if self._executor_type == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def _on_done(self, operation_future: asyncio.Future) -> None:
+        """Release pending operation slot."""
+        self._pending -= 1
+
+
+password_service = PasswordService(
+    Settings.PASSWORD_EXECUTOR,
+    max_workers=Settings.PASSWORD_WORKERS,
+    max_pending=Settings.PASSWORD_MAX_PENDING,
+)
@@ -11,7 +11,9 @@ from apps.authorization.auth_utilities import (
     verify_user,
 )
 from apps.authorization.schemas import AuthOut
+from apps.common.base_statements import BoundStatement
 from apps.common.orm_services import statement_executor
+from apps.user.activity import user_activity_buffer
 from apps.user.statements import user_crud_statements
 
 
@@ -26,7 +28,7 @@ class AuthorizationHandlers(object):
         session: AsyncSession,
     ) -> AuthOut:
         """Login user with given credentials."""
-        statement: str = user_crud_statements.read_statement(
+        statement: BoundStatement = user_crud_statements.read_statement(
             obj_data={'username': form_data.username},
         )
         user: Row = await statement_executor.execute_return_statement(
@@ -34,7 +36,8 @@ class AuthorizationHandlers(object):
             statement,
         )
         verify_user(user)
-        verify_password(user, form_data.password)
+        await verify_password(user, form_data.password)
+        user_activity_buffer.record_visit(user.id)
         return AuthOut(
             access_token=create_access_token(user.email),
             refresh_token=create_refresh_token(user.email),
@@ -1,22 +1,57 @@
 """Base routers for admin interface."""
-from fastapi import APIRouter, Depends, Request
+import asyncio
+
+from fastapi import APIRouter, Body, Depends, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Select
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import TYPE_CHECKING, Annotated, Any, Sequence, TypeAlias
+from typing_extensions import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+    TypeAlias,
+)
 
 from apps.common.base_statements import BaseCRUDStatements
 from apps.common.common_types import ModelType, SchemaType
 from apps.common.common_utilities import checkers
+from apps.common.conditional import get_not_modified_response, get_version_headers
+from apps.common.constants import NDJSON_MEDIA_TYPE
+from apps.common.db import async_session_factory
 from apps.common.dependencies import get_async_session
+from apps.common.enum import JSENDStatus
 from apps.common.orm_services import statement_executor as executor
-from apps.common.schemas import JSENDErrorOutSchema, JSENDFailOutSchema, JSENDOutSchema
+from apps.common.pagination import decode_cursor, get_page
+from apps.common.responses import JSENDResponse
+from apps.common.schemas import (
+    BulkCreateIn,
+    BulkCreateOut,
+    JSENDErrorOutSchema,
+    JSENDFailOutSchema,
+    JSENDOutSchema,
+    JSENDPageOutSchema,
+    PaginationIn,
+)
 from apps.common.user_dependencies import get_current_admin_user
 from apps.user.models import User
+from settings import Settings
 
 if TYPE_CHECKING:
     LocalModelType: TypeAlias = ModelType
 else:
     LocalOutSchema: TypeAlias = SchemaType
 
+CreateHook: TypeAlias = Callable[[Any], Awaitable[None]]
+
 
 base_responses = {
     401: {
@@ -32,6 +67,18 @@ base_responses = {
 validation_response = {
     422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
 }
+pagination_response = {
+    400: {'model': JSENDFailOutSchema, 'description': 'Invalid pagination cursor.'},
+}
+
+
+def get_chunk_error_message(error: DBAPIError) -> str:
+    """Get message of failed bulk create chunk."""
+    if Settings.DEBUG:
+        return str(error.orig)
+    if isinstance(error, IntegrityError):
+        return 'Integrity error.'
+    return 'Database error.'
 
 
 class BaseRouterKwargs(object):
@@ -40,7 +87,7 @@ class BaseRouterKwargs(object):
     def __init__(
         self,
         name: str,
-        out_schema: SchemaType,
+        out_schema: Type[SchemaType],
     ) -> None:
         """Initialize BaseRouter instance."""
         self.name = name
@@ -50,10 +97,12 @@ class BaseRouterKwargs(object):
         )
         if TYPE_CHECKING:
             self.response_model = JSENDOutSchema
-            self.response_model_many = JSENDOutSchema
+            self.response_model_many = JSENDPageOutSchema
+            self.response_model_bulk = JSENDOutSchema
         else:
             self.response_model = JSENDOutSchema[out_schema]
-            self.response_model_many = JSENDOutSchema[Sequence[out_schema]]
+            self.response_model_many = JSENDPageOutSchema[Sequence[out_schema]]
+            self.response_model_bulk = JSENDOutSchema[BulkCreateOut[out_schema]]
 
     def get_post_router_kwargs(self) -> dict:
         """Get post router kwargs."""
@@ -75,6 +124,28 @@ class BaseRouterKwargs(object):
             'tags': self.tags,
         }
 
+    def get_bulk_create_router_kwargs(self) -> dict:
+        """Get bulk create router kwargs."""
+        responses: dict = {
+            200: {
+                'description': 'Successful bulk create {name} response'.format(
+                    name=self.name,
+                ),
+            },
+        }
+        responses.update(base_responses)
+        responses.update(validation_response)
+        return {
+            'path': '/admin/bulk/{name}/'.format(name=self.name),
+            'name': 'bulk_create_{name}_admin'.format(name=self.name),
+            'response_model': self.response_model_bulk,
+            'summary': 'Create {name} instances by chunks by admin'.format(
+                name=self.name,
+            ),
+            'responses': responses,
+            'tags': self.tags,
+        }
+
     def get_update_router_kwargs(self) -> dict:
         """Get update router kwargs."""
         responses: dict = {
@@ -121,6 +192,11 @@ class BaseRouterKwargs(object):
                     name=self.name,
                 ),
             },
+            304: {
+                'description': 'Not modified {name} by request conditions'.format(
+                    name=self.name,
+                ),
+            },
         }
         responses.update(base_responses)
         return {
@@ -159,9 +235,12 @@ class BaseRouterKwargs(object):
                 'description': 'Successful {name} list response'.format(
                     name=self.name,
                 ),
+                'content': {NDJSON_MEDIA_TYPE: {}},
             },
         }
         responses.update(base_responses)
+        responses.update(pagination_response)
+        responses.update(validation_response)
         return {
             'path': '/admin/list/{name}/'.format(name=self.name),
             'name': 'read_{name}_list'.format(name=self.name),
@@ -175,23 +254,155 @@ class BaseRouterKwargs(object):
 class BaseInitializer(object):
     """Base initializer class for BaseRouterInitializer."""
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         router: APIRouter,
         in_schemas: tuple[SchemaType, ...],
-        out_schema: SchemaType,
+        out_schema: Type[SchemaType],
         model: ModelType,
+        on_instance_change: Optional[Callable[[int], None]] = None,
+        before_create: Optional[CreateHook] = None,
+        statements: Optional[BaseCRUDStatements] = None,
     ) -> None:
-        """Initialize BaseRouterDecorators instance."""
+        """Initialize BaseRouterDecorators instance.
+
+        'on_instance_change' is called with instance id after the instance
+        is updated or deleted, for dropping cached data. 'before_create' is
+        awaited with every create schema before it is used. 'statements' are
+        model statements with its version columns, base ones by default.
+        """
         self.router = router
         self._in_create_schema = in_schemas[0]
         self._in_update_schema = in_schemas[1]
         self._in_part_update_schema = in_schemas[2]
         self.out_schema = out_schema
-        self.statements = BaseCRUDStatements(model=model)
+        self._out_list_adapter = TypeAdapter(list[out_schema])  # type: ignore
+        self.statements = statements or BaseCRUDStatements(model=model)
         self.model = model
+        self.on_instance_change = on_instance_change
+        self.before_create = before_create
         self._kwargs_generator = BaseRouterKwargs(model.__name__.lower(), out_schema)
 
+    async def stream_instance_list(
+        self,
+        after: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """Stream instances as NDJSON lines, one serialized instance per line."""
+        statement: Select = self.statements.list_statement(after=after)
+        async with async_session_factory() as session:
+            instances: AsyncIterator[Any] = executor.stream_return_statement(
+                session,
+                statement,
+                yield_per=Settings.STREAM_YIELD_PER,
+            )
+            async for instance in instances:
+                output_instance = self.out_schema.model_validate(instance)
+                yield '{line}\n'.format(line=output_instance.model_dump_json())
+
+    async def run_before_create(
+        self,
+        before_create: CreateHook,
+        schemas: Sequence[SchemaType],
+    ) -> None:
+        """Await 'before_create' with schemas, one per password worker at once.
+
+        The hook hashes passwords in worker pool, so pool workers are busy
+        together, while pending operations limit is not exceeded.
+        """
+        pending_schemas = iter(schemas)
+        await asyncio.gather(
+            *[
+                self._run_before_create(before_create, pending_schemas)
+                for _ in range(Settings.PASSWORD_WORKERS)
+            ],
+        )
+
+    async def create_by_chunks(
+        self,
+        session: AsyncSession,
+        schemas: Sequence[SchemaType],
+        bulk_params: BulkCreateIn,
+    ) -> dict:
+        """Create instances chunk by chunk, each chunk in its own transaction."""
+        chunk_results: list[dict] = []
+        created_instances: list[Any] = []
+        for index, start in enumerate(range(0, len(schemas), bulk_params.chunk_size)):
+            chunk_result = await self._create_chunk(
+                session,
+                schemas[start : start + bulk_params.chunk_size],  # noqa: E203
+                bulk_params.returning,
+                created_instances,
+            )
+            chunk_results.append({'index': index, **chunk_result})
+        return {
+            'created': sum(
+                chunk_result['count']
+                for chunk_result in chunk_results
+                if chunk_result['status'] == JSENDStatus.SUCCESS
+            ),
+            'chunks': chunk_results,
+            'instances': created_instances if bulk_params.returning else None,
+        }
+
+    async def _create_chunk(
+        self,
+        session: AsyncSession,
+        chunk: Sequence[SchemaType],
+        returning: bool,
+        created_instances: list[Any],
+    ) -> dict:
+        """Create chunk in transaction, rollback it on database error.
+
+        Constraint violations, too long or invalid values of chunk fail the
+        chunk only, chunks before it stay committed.
+        """
+        try:
+            created_instances.extend(
+                await self._insert_chunk(session, chunk, returning),
+            )
+        except DBAPIError as error:
+            await session.rollback()
+            return {
+                'count': len(chunk),
+                'status': JSENDStatus.FAIL,
+                'message': get_chunk_error_message(error),
+            }
+        return {'count': len(chunk), 'status': JSENDStatus.SUCCESS}
+
+    async def _run_before_create(
+        self,
+        before_create: CreateHook,
+        pending_schemas: Iterator[SchemaType],
+    ) -> None:
+        """Await 'before_create' with pending schemas one after another."""
+        for schema in pending_schemas:
+            await before_create(schema)
+
+    async def _insert_chunk(
+        self,
+        session: AsyncSession,
+        chunk: Sequence[SchemaType],
+        returning: bool,
+    ) -> Sequence[Any]:
+        """Insert chunk with INSERT ... RETURNING or with COPY."""
+        if not returning:
+            await executor.copy_records(
+                session,
+                self.model.__tablename__,
+                [schema.model_dump() for schema in chunk],
+            )
+            return []
+        statement = self.statements.create_many_statement(list(chunk))
+        inserted_instances: Sequence[
+            Any
+        ] | None = await executor.execute_return_statement(
+            session,
+            statement,
+            commit=True,
+            many=True,
+        )
+        return inserted_instances or []
+
 
 class BaseRouterInitializer(BaseInitializer):
     """Base router initializer for admin interface."""
@@ -209,28 +420,57 @@ class BaseRouterInitializer(BaseInitializer):
             schema: Annotated[schema_type, Depends()],
             user: Annotated[User, Depends(get_current_admin_user)],
             session: Annotated[AsyncSession, Depends(get_async_session)],
-        ) -> dict:
+        ) -> JSENDResponse:
             """Create post router."""
-            statement = self.statements.create_statement(schema=schema)
-            created_instance: LocalModelType | Sequence[
-                LocalModelType | None
-            ] | None = await executor.execute_return_statement(
+            if self.before_create:
+                await self.before_create(schema)
+            statement = self.statements.create_statement(schema=schema, core=True)
+            created_instance: Any = await executor.execute_return_schema(
                 session,
                 statement,
+                self.out_schema,
                 commit=True,
             )
-            checked_instance = checkers.check_created_instance(
+            output_instance: schema_type = checkers.check_created_instance(
                 created_instance,
                 self.model.__name__,
             )
-            output_instance: schema_type = self.out_schema.model_validate(
-                checked_instance,
+            return JSENDResponse(
+                {
+                    'data': output_instance,
+                    'message': 'Created {name} with id {id}'.format(
+                        name=self.model.__name__.lower(),
+                        id=output_instance.id,
+                    ),
+                },
             )
+
+    def get_bulk_create_router(self) -> None:
+        """Get bulk create router."""
+        if TYPE_CHECKING:
+            schema_type: TypeAlias = SchemaType
+        else:
+            schema_type = self._in_create_schema
+        bulk_body = Body(min_length=1, max_length=Settings.BULK_CREATE_MAX_ITEMS)
+
+        @self.router.post(**self._kwargs_generator.get_bulk_create_router_kwargs())
+        async def bulk_create_instances(  # noqa: WPS430
+            request: Request,
+            schemas: Annotated[list[schema_type], bulk_body],
+            bulk_params: Annotated[BulkCreateIn, Depends()],
+            user: Annotated[User, Depends(get_current_admin_user)],
+            session: Annotated[AsyncSession, Depends(get_async_session)],
+        ) -> dict:
+            """Create instances by chunks."""
+            if self.before_create:
+                await self.run_before_create(self.before_create, schemas)
+            bulk_result = await self.create_by_chunks(session, schemas, bulk_params)
             return {
-                'data': output_instance,
-                'message': 'Created {name} with id {id}'.format(
+                'data': bulk_result,
+                'message': 'Created {created} of {count} {name} instances'.format(
+                    created=bulk_result['created'],
+                    count=len(schemas),
                     name=self.model.__name__.lower(),
-                    id=output_instance.id,
                 ),
             }
 
@@ -247,26 +487,44 @@ class BaseRouterInitializer(BaseInitializer):
             instance_id: int,
             user: Annotated[User, Depends(get_current_admin_user)],
             session: Annotated[AsyncSession, Depends(get_async_session)],
-        ) -> dict:
+        ) -> Response:
             """Create post router."""
-            statement = self.statements.read_statement(obj_data={'id': instance_id})
-            read_instance: LocalModelType | Sequence[
-                LocalModelType | None
-            ] | None = await executor.execute_return_statement(session, statement)
-            checked_instance = checkers.check_created_instance(
+            not_modified_response = await get_not_modified_response(
+                request,
+                session,
+                self.statements,
+                instance_id,
+            )
+            if not_modified_response:
+                return not_modified_response
+            statement = self.statements.read_statement(
+                obj_data={'id': instance_id},
+                core=True,
+            )
+            read_instance: Any = await executor.execute_return_schema(
+                session,
+                statement,
+                self.out_schema,
+            )
+            output_instance: schema_type = checkers.check_created_instance(
                 read_instance,
                 self.model.__name__,
             )
-            output_instance: schema_type = self.out_schema.model_validate(
-                checked_instance,
-            )
-            return {
-                'data': output_instance,
-                'message': 'Read {name} with id {id}'.format(
-                    name=self.model.__name__.lower(),
-                    id=output_instance.id,
+            return JSENDResponse(
+                {
+                    'data': output_instance,
+                    'message': 'Read {name} with id {id}'.format(
+                        name=self.model.__name__.lower(),
+                        id=output_instance.id,
+                    ),
+                },
+                headers=get_version_headers(
+                    [
+                        getattr(output_instance, key)
+                        for key in self.statements.version_keys
+                    ],
                 ),
-            }
+            )
 
     def get_update_router(self) -> None:
         """Get create router."""
@@ -282,33 +540,34 @@ class BaseRouterInitializer(BaseInitializer):
             schema: Annotated[schema_type, Depends()],
             user: Annotated[User, Depends(get_current_admin_user)],
             session: Annotated[AsyncSession, Depends(get_async_session)],
-        ) -> dict:
+        ) -> JSENDResponse:
             """Create post router."""
             statement = self.statements.update_statement(
                 schema=schema,
                 where_data={'id': instance_id},
+                core=True,
             )
-            updated_instance: LocalModelType | Sequence[
-                LocalModelType | None
-            ] | None = await executor.execute_return_statement(
+            updated_instance: Any = await executor.execute_return_schema(
                 session,
                 statement,
+                self.out_schema,
                 commit=True,
             )
-            checked_instance = checkers.check_created_instance(
+            output_instance: schema_type = checkers.check_created_instance(
                 updated_instance,
                 self.model.__name__,
             )
-            output_instance: schema_type = self.out_schema.model_validate(
-                checked_instance,
+            if self.on_instance_change:
+                self.on_instance_change(instance_id)
+            return JSENDResponse(
+                {
+                    'data': output_instance,
+                    'message': 'Updated {name} with id {id}'.format(
+                        name=self.model.__name__.lower(),
+                        id=output_instance.id,
+                    ),
+                },
             )
-            return {
-                'data': output_instance,
-                'message': 'Updated {name} with id {id}'.format(
-                    name=self.model.__name__.lower(),
-                    id=output_instance.id,
-                ),
-            }
 
     def get_partially_update_router(self) -> None:
         """Get create router."""
@@ -326,33 +585,34 @@ class BaseRouterInitializer(BaseInitializer):
             schema: Annotated[schema_type, Depends()],
             user: Annotated[User, Depends(get_current_admin_user)],
             session: Annotated[AsyncSession, Depends(get_async_session)],
-        ) -> dict:
+        ) -> JSENDResponse:
             """Create post router."""
             statement = self.statements.update_statement(
                 schema=schema,
                 where_data={'id': instance_id},
+                core=True,
             )
-            updated_instance: LocalModelType | Sequence[
-                LocalModelType | None
-            ] | None = await executor.execute_return_statement(
+            updated_instance: Any = await executor.execute_return_schema(
                 session,
                 statement,
+                self.out_schema,
                 commit=True,
             )
-            checked_instance = checkers.check_created_instance(
+            output_instance: schema_type = checkers.check_created_instance(
                 updated_instance,
                 self.model.__name__,
             )
-            output_instance: schema_type = self.out_schema.model_validate(
-                checked_instance,
+            if self.on_instance_change:
+                self.on_instance_change(instance_id)
+            return JSENDResponse(
+                {
+                    'data': output_instance,
+                    'message': 'Updated {name} with id {id}'.format(
+                        name=self.model.__name__.lower(),
+                        id=output_instance.id,
+                    ),
+                },
             )
-            return {
-                'data': output_instance,
-                'message': 'Updated {name} with id {id}'.format(
-                    name=self.model.__name__.lower(),
-                    id=output_instance.id,
-                ),
-            }
 
     def get_delete_router(self) -> None:
         """Get create router."""
@@ -363,17 +623,21 @@ class BaseRouterInitializer(BaseInitializer):
             instance_id: int,
             user: Annotated[User, Depends(get_current_admin_user)],
             session: Annotated[AsyncSession, Depends(get_async_session)],
-        ) -> dict:
+        ) -> JSENDResponse:
             """Create post router."""
             statement = self.statements.delete_statement(obj_data={'id': instance_id})
             await executor.execute_delete_statement(session, statement)
-            return {
-                'data': None,
-                'message': 'Deleted {name} with id {id}'.format(
-                    name=self.model.__name__.lower(),
-                    id=instance_id,
-                ),
-            }
+            if self.on_instance_change:
+                self.on_instance_change(instance_id)
+            return JSENDResponse(
+                {
+                    'data': None,
+                    'message': 'Deleted {name} with id {id}'.format(
+                        name=self.model.__name__.lower(),
+                        id=instance_id,
+                    ),
+                },
+            )
 
     def get_list_router(self) -> None:
         """Get list router."""
@@ -381,11 +645,21 @@ class BaseRouterInitializer(BaseInitializer):
         @self.router.get(**self._kwargs_generator.get_list_router_kwargs())
         async def read_instance_list(  # noqa: WPS430
             request: Request,
+            pagination: Annotated[PaginationIn, Depends()],
             user: Annotated[User, Depends(get_current_admin_user)],
             session: Annotated[AsyncSession, Depends(get_async_session)],
-        ) -> dict:
-            """Get instance list."""
-            statement: str = self.statements.list_statement()
+        ) -> JSENDResponse | StreamingResponse:
+            """Get instance list page or stream whole list as NDJSON."""
+            after_id = decode_cursor(pagination.after) if pagination.after else None
+            if NDJSON_MEDIA_TYPE in request.headers.get('accept', ''):
+                return StreamingResponse(
+                    self.stream_instance_list(after=after_id),
+                    media_type=NDJSON_MEDIA_TYPE,
+                )
+            statement: Select = self.statements.list_statement(
+                limit=pagination.limit + 1,
+                after=after_id,
+            )
             instance_list: Sequence[Any | None] | Sequence[
                 Sequence[Any | None]
             ] | None = await executor.execute_return_statement(
@@ -393,14 +667,23 @@ class BaseRouterInitializer(BaseInitializer):
                 statement,
                 many=True,
             )
-            return {
-                'data': instance_list,
-                'message': 'Got {name} instances list'.format(name=self.model.__name__),
-            }
+            page, next_cursor = get_page(instance_list or [], pagination.limit)
+            return JSENDResponse(
+                {
+                    'data': self._out_list_adapter.validate_python(page),
+                    'message': 'Got {name} instances list'.format(
+                        name=self.model.__name__,
+                    ),
+                    'next_cursor': next_cursor,
+                },
+            )
 
     def initialize_routers(self) -> None:
-        """Initialize all routers."""
+        """Initialize all routers once, router is shared by applications."""
+        if self.router.routes:
+            return
         self.get_create_router()
+        self.get_bulk_create_router()
         self.get_read_router()
         self.get_update_router()
         self.get_partially_update_router()
@@ -1,29 +1,75 @@
 """Project Base SQLAlchemy statements."""
-from sqlalchemy import and_, delete, select, update
-from sqlalchemy.dialects.postgresql import insert
-from typing_extensions import Optional, Type, Union
+from datetime import datetime
+
+from sqlalchemy import (
+    Integer,
+    Select,
+    and_,
+    bindparam,
+    delete,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.sql.base import Executable
+from typing_extensions import Callable, NamedTuple, Optional, Type, Union
 
 from apps.common.common_types import ModelType, SchemaType
 
 
-class BaseCRUDStatements(object):
-    """Base model CRUD statements."""
+class BoundStatement(NamedTuple):
+    """Cached statement template with values to bind on execution."""
+
+    statement: Executable
+    bind_values: dict
+
+
+class BaseStatementTemplates(object):
+    """Cache of model statement templates with bound parameters.
+
+    Templates are built once per operation and column set and reused
+    afterwards, so only values are bound on each call and SQLAlchemy
+    cache key of the statement is memoized. Core templates work with model
+    table and return plain rows instead of ORM instances.
+    """
 
     def __init__(self, *, model: Type[ModelType]) -> None:
         """Initialize class instance."""
         self.model = model
+        self.table = model.__table__
+        self._templates: dict[tuple, Executable] = {}
 
-    def create_statement(
+    def _get_template(
         self,
-        *,
-        schema: Optional[SchemaType] = None,
-        obj_data: Optional[dict] = None,
-    ) -> str:
-        """Create statement for creating and returning model."""
-        obj_data = obj_data if obj_data else {}
-        obj_in_data = schema.model_dump(exclude_unset=True) if schema else {}
+        build_template: Callable[[], Executable],
+        operation: str,
+        *column_keys: tuple[str, ...],
+    ) -> Executable:
+        """Get cached statement template, building it on first use."""
+        template_key = (operation, column_keys)
+        template = self._templates.get(template_key)
+        if template is None:
+            template = build_template()
+            self._templates[template_key] = template
+        return template
+
+    def _build_create_template(
+        self,
+        value_keys: tuple[str, ...],
+        core: bool = False,
+    ) -> Executable:
+        """Build insert statement template with given column set."""
+        if core:
+            return (
+                insert(self.table)
+                .values(self._get_bind_values(value_keys))
+                .returning(*self.table.columns)
+            )
         insert_statement = (
-            insert(self.model).values(**obj_data, **obj_in_data).returning(self.model)
+            insert(self.model)
+            .values(self._get_bind_values(value_keys))
+            .returning(self.model)
         )
         return (
             select(self.model)
@@ -31,6 +77,135 @@ class BaseCRUDStatements(object):
             .execution_options(populate_existing=True)
         )
 
+    def _build_update_template(
+        self,
+        value_keys: tuple[str, ...],
+        where_keys: tuple[str, ...],
+        core: bool = False,
+    ) -> Executable:
+        """Build update statement template with given column sets."""
+        if core:
+            return (
+                update(self.table)
+                .where(and_(*self._get_where_expr(where_keys)))
+                .values(self._get_bind_values(value_keys))
+                .returning(*self.table.columns)
+            )
+        update_statement = (
+            update(self.model)
+            .where(and_(*self._get_where_expr(where_keys)))
+            .values(self._get_bind_values(value_keys))
+            .returning(self.model)
+            .execution_options(synchronize_session='fetch')
+        )
+        return (
+            select(self.model)
+            .from_statement(statement=update_statement)
+            .execution_options(populate_existing=True)
+        )
+
+    def _build_delete_template(
+        self,
+        where_keys: tuple[str, ...],
+        core: bool = False,
+    ) -> Executable:
+        """Build delete statement template with given column set."""
+        if core:
+            return (
+                delete(self.table)
+                .where(*self._get_where_expr(where_keys))
+                .returning(*self.table.columns)
+            )
+        return delete(self.model).where(*self._get_where_expr(where_keys))
+
+    def _build_children_page_template(
+        self,
+        parent_key: str,
+        has_after: bool,
+    ) -> Executable:
+        """Build children page template, newest first, keyset paged if 'has_after'."""
+        created_at = self.table.columns['created_at']
+        row_id = self.table.columns['id']
+        page_statement = select(self.table).where(*self._get_where_expr((parent_key,)))
+        if has_after:
+            page_statement = page_statement.where(
+                tuple_(created_at, row_id)
+                < tuple_(
+                    bindparam('after_created_at', type_=created_at.type),
+                    bindparam('after_id', type_=row_id.type),
+                ),
+            )
+        return page_statement.order_by(created_at.desc(), row_id.desc()).limit(
+            bindparam('limit', type_=Integer),
+        )
+
+    def _get_bind_values(self, value_keys: tuple[str, ...]) -> dict:
+        """Get bound parameters for values or set clause."""
+        return {
+            key: bindparam(
+                'value_{key}'.format(key=key),
+                type_=self.table.columns[key].type,
+            )
+            for key in value_keys
+        }
+
+    def _get_where_expr(self, where_keys: tuple[str, ...]) -> list:
+        """Get where clause expressions with bound parameters."""
+        return [
+            self.table.columns[key]
+            == bindparam(
+                'where_{key}'.format(key=key),
+                type_=self.table.columns[key].type,
+            )
+            for key in where_keys
+        ]
+
+    def _get_bind_params(
+        self,
+        *,
+        values_data: Optional[dict] = None,
+        where_data: Optional[dict] = None,
+    ) -> dict:
+        """Get values of bound parameters for statement template."""
+        bind_params = {
+            'value_{key}'.format(key=key): value_data
+            for key, value_data in (values_data or {}).items()
+        }
+        bind_params.update(
+            ('where_{key}'.format(key=key), value_data)
+            for key, value_data in (where_data or {}).items()
+        )
+        return bind_params
+
+
+class BaseCRUDStatements(BaseStatementTemplates):
+    """Base model CRUD statements.
+
+    'version_keys' are columns, which change on every row change, they are
+    read instead of the row for conditional requests.
+    """
+
+    version_keys: tuple[str, ...] = ('updated_at',)
+
+    def create_statement(
+        self,
+        *,
+        schema: Optional[SchemaType] = None,
+        obj_data: Optional[dict] = None,
+        core: bool = False,
+    ) -> BoundStatement:
+        """Create statement for creating and returning model or its row."""
+        obj_data = obj_data if obj_data else {}
+        obj_in_data = schema.model_dump(exclude_unset=True) if schema else {}
+        values_data = {**obj_data, **obj_in_data}
+        value_keys = tuple(sorted(values_data))
+        template = self._get_template(
+            lambda: self._build_create_template(value_keys, core),
+            'core_create' if core else 'create',
+            value_keys,
+        )
+        return BoundStatement(template, self._get_bind_params(values_data=values_data))
+
     def create_many_statement(
         self,
         schemas: list[SchemaType],
@@ -54,43 +229,60 @@ class BaseCRUDStatements(object):
         *,
         schema: Optional[SchemaType] = None,
         obj_data: Optional[dict] = None,
-    ) -> str:
-        """Create statement for model reading."""
+        core: bool = False,
+    ) -> BoundStatement:
+        """Create statement for model or its row reading."""
         obj_data = obj_data if obj_data else {}
         obj_in_data = schema.model_dump(exclude_unset=True) if schema else {}
-        statement = select(self.model)
-        for key, value_data in {**obj_data, **obj_in_data}.items():
-            statement = statement.where(getattr(self.model, key) == value_data)
-        return statement
+        where_data = {**obj_data, **obj_in_data}
+        where_keys = tuple(sorted(where_data))
+        template = self._get_template(
+            lambda: select(
+                self.table if core else self.model,
+            ).where(*self._get_where_expr(where_keys)),
+            'core_read' if core else 'read',
+            where_keys,
+        )
+        return BoundStatement(template, self._get_bind_params(where_data=where_data))
+
+    def read_version_statement(self, *, obj_data: dict) -> BoundStatement:
+        """Create statement for reading version columns of row."""
+        where_keys = tuple(sorted(obj_data))
+        template = self._get_template(
+            lambda: select(
+                *(self.table.columns[key] for key in self.version_keys),
+            ).where(*self._get_where_expr(where_keys)),
+            'version',
+            where_keys,
+        )
+        return BoundStatement(template, self._get_bind_params(where_data=obj_data))
 
     def update_statement(
         self,
         *,
         schema: Union[SchemaType, dict, None] = None,
         where_data: Optional[dict] = None,
-    ) -> str:
-        """Create statement for updatening and returning model instance."""
+        core: bool = False,
+    ) -> BoundStatement:
+        """Create statement for updatening and returning model instance or row."""
         if isinstance(schema, dict):
             schema_values = schema
         elif schema is None:
             schema_values = {}
         else:
             schema_values = schema.model_dump(exclude_unset=True, exclude_none=True)
-        where_expr = []
-        if where_data:
-            for key, value_data in where_data.items():
-                where_expr.append(getattr(self.model, key) == value_data)
-        update_statement = (
-            update(self.model)
-            .where(and_(*where_expr))
-            .values(**schema_values)
-            .returning(self.model)
-            .execution_options(synchronize_session='fetch')
+        where_data = where_data if where_data else {}
+        value_keys = tuple(sorted(schema_values))
+        where_keys = tuple(sorted(where_data))
+        template = self._get_template(
+            lambda: self._build_update_template(value_keys, where_keys, core),
+            'core_update' if core else 'update',
+            value_keys,
+            where_keys,
         )
-        return (
-            select(self.model)
-            .from_statement(statement=update_statement)
-            .execution_options(populate_existing=True)
+        return BoundStatement(
+            template,
+            self._get_bind_params(values_data=schema_values, where_data=where_data),
         )
 
     def delete_statement(
@@ -98,22 +290,64 @@ class BaseCRUDStatements(object):
         *,
         schema: Optional[SchemaType] = None,
         obj_data: Optional[dict] = None,
-    ) -> str:
-        """Create statement for deleting model."""
+        core: bool = False,
+    ) -> BoundStatement:
+        """Create statement for deleting model, returning deleted row if core."""
         obj_data = obj_data if obj_data else {}
         schema_dict = schema.model_dump(exclude_unset=True) if schema else {}
-        statement = delete(self.model)
-        for key, value_data in {**obj_data, **schema_dict}.items():
-            statement = statement.where(getattr(self.model, key) == value_data)
-        return statement
+        where_data = {**obj_data, **schema_dict}
+        where_keys = tuple(sorted(where_data))
+        template = self._get_template(
+            lambda: self._build_delete_template(where_keys, core),
+            'core_delete' if core else 'delete',
+            where_keys,
+        )
+        return BoundStatement(template, self._get_bind_params(where_data=where_data))
+
+    def children_page_statement(
+        self,
+        *,
+        parent_key: str,
+        parent_id: int,
+        limit: int,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> BoundStatement:
+        """Create statement for page of parent children rows, newest first.
+
+        Rows are ordered by created_at and id and paged by keyset after given
+        created_at and id, so with index on parent key, created_at and id, page
+        cost does not depend on parent children count.
+        """
+        where_keys = (parent_key,)
+        after_keys = ('created_at', 'id') if after else ()
+        template = self._get_template(
+            lambda: self._build_children_page_template(parent_key, bool(after_keys)),
+            'core_children_page',
+            where_keys,
+            after_keys,
+        )
+        bind_values = self._get_bind_params(where_data={parent_key: parent_id})
+        bind_values['limit'] = limit
+        if after is not None:
+            bind_values['after_created_at'] = after[0]
+            bind_values['after_id'] = after[1]
+        return BoundStatement(template, bind_values)
 
     def list_statement(
         self,
         *,
         filters: Optional[dict] = None,
-    ) -> str:
-        """Create statement for read models list."""
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> Select:
+        """Create statement for read models list, keyset paginated by id."""
         select_statement = select(self.model)
         if filters:
             select_statement = select_statement.filter_by(**filters)
+        if after is not None or limit is not None:
+            select_statement = select_statement.order_by(self.model.id)
+        if after is not None:
+            select_statement = select_statement.where(self.model.id > after)
+        if limit is not None:
+            select_statement = select_statement.limit(limit)
         return select_statement.execution_options(populate_existing=True)
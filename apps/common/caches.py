@@ -0,0 +1,66 @@
+"""Project in-process caches."""
+from collections import OrderedDict
+from math import inf
+from time import monotonic
+
+from typing_extensions import Any, Callable, Hashable, Optional
+
+
+class LRUCache(object):
+    """Bounded least recently used cache with entries time to live.
+
+    Cache is per process, so entries may be stale for up to their time to
+    live after changes made by other processes.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None) -> None:
+        """Initialize class instance."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Get cached value, None if it is absent or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= monotonic():
+            self._entries.pop(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(
+        self,
+        key: Hashable,
+        cached_value: Any,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Cache value, evicting least recently used entries over max size."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = inf if ttl is None else monotonic() + ttl
+        self._entries[key] = (cached_value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop entries with values matching predicate."""
+        matched_keys = [
+            key for key, entry in self._entries.items() if predicate(entry[0])
+        ]
+        for key in matched_keys:
+            self._entries.pop(key)
+
+    def get_stats(self) -> dict:
+        """Get cache size and hit/miss counters."""
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
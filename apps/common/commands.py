@@ -0,0 +1,21 @@
+"""Common apps commands.
+
+Run ``python -m apps.common.commands`` on build to write OpenAPI schema
+artifact of current sources, which is loaded on startup instead of schema
+generation.
+"""
+import sys
+from pathlib import Path
+
+from apps.main import create_app
+
+
+def build_openapi_artifact() -> Path:
+    """Generate OpenAPI schema of application and write it as artifact."""
+    return create_app().state.openapi_cache.build_artifact()
+
+
+if __name__ == '__main__':
+    sys.stdout.write(
+        'OpenAPI schema is written to {path}\n'.format(path=build_openapi_artifact()),
+    )
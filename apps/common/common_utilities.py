@@ -1,5 +1,7 @@
 """Common project utilities."""
 from datetime import datetime
+from hashlib import sha256
+from time import time
 
 from fastapi import HTTPException, status
 from jose import jwt
@@ -8,16 +10,19 @@ from sqlalchemy import DATETIME, TypeDecorator
 from typing_extensions import Any, Sequence, Type
 
 from apps.authorization.schemas import TokenPayload
+from apps.common.caches import LRUCache
 from apps.common.exceptions import BackendError
 from settings import Settings
 
 TIME = Type[datetime]
+token_cache = LRUCache(Settings.TOKEN_CACHE_MAX_SIZE)
 
 
 class AwareDateTime(TypeDecorator):
     """Results returned as aware datetimes, not naive ones."""
 
     impl = DATETIME
+    cache_ok = True
 
     @property
     def python_type(
@@ -43,13 +48,20 @@ class AwareDateTime(TypeDecorator):
 
 
 def get_token_data(token: str) -> TokenPayload:
-    """Get token data, using token."""
-    payload = jwt.decode(
-        token,
-        Settings.JWT_SECRET_KEY,
-        algorithms=[Settings.JWT_ALGORITHM],
-    )
-    token_data = TokenPayload(**payload)
+    """Get token data, using token.
+
+    Verified token data is cached by token hash until token expiration.
+    """
+    token_key = sha256(token.encode()).digest()
+    token_data: TokenPayload | None = token_cache.get(token_key)
+    if token_data is None:
+        payload = jwt.decode(
+            token,
+            Settings.JWT_SECRET_KEY,
+            algorithms=[Settings.JWT_ALGORITHM],
+        )
+        token_data = TokenPayload(**payload)
+        token_cache.set(token_key, token_data, ttl=token_data.exp - time())
     if datetime.fromtimestamp(token_data.exp) < datetime.now():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,77 @@
+"""Conditional requests of instances by their version columns.
+
+Instance version is tuple of its version columns values. Weak ETag is hash
+of the version, Last-Modified is sent only, if the version is update times.
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import sha256
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import Optional, Sequence
+
+from apps.common.base_statements import BaseCRUDStatements
+from apps.common.orm_services import statement_executor as executor
+
+CONDITIONAL_HEADERS = ('if-none-match', 'if-modified-since')
+ETAG_LENGTH = 16
+
+
+def get_version_headers(version: Sequence) -> dict[str, str]:
+    """Get ETag and Last-Modified headers of instance version."""
+    version_text = '|'.join(str(version_value) for version_value in version)
+    version_headers = {
+        'ETag': 'W/"{etag}"'.format(
+            etag=sha256(version_text.encode()).hexdigest()[:ETAG_LENGTH],
+        ),
+    }
+    if all(isinstance(version_value, datetime) for version_value in version):
+        version_headers['Last-Modified'] = format_datetime(
+            max(version).astimezone(timezone.utc),
+            usegmt=True,
+        )
+    return version_headers
+
+
+def is_not_modified(request: Request, version_headers: dict[str, str]) -> bool:
+    """Check request conditions, If-None-Match takes precedence, as in RFC 9110."""
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        etags = {etag.strip().removeprefix('W/') for etag in if_none_match.split(',')}
+        return '*' in etags or version_headers['ETag'].removeprefix('W/') in etags
+    if_modified_since = request.headers.get('if-modified-since')
+    last_modified = version_headers.get('Last-Modified')
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since,
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+async def get_not_modified_response(
+    request: Request,
+    session: AsyncSession,
+    statements: BaseCRUDStatements,
+    instance_id: int,
+) -> Optional[Response]:
+    """Get empty 304 response, if instance matches request conditions.
+
+    Only version columns of instance are read, None is returned, if request
+    has no conditions, instance is changed or does not exist.
+    """
+    if not any(header in request.headers for header in CONDITIONAL_HEADERS):
+        return None
+    version = await executor.execute_return_row(
+        session,
+        statements.read_version_statement(obj_data={'id': instance_id}),
+    )
+    if version is None:
+        return None
+    version_headers = get_version_headers(version)
+    if not is_not_modified(request, version_headers):
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=version_headers)
@@ -1,6 +1,8 @@
 """Project constants."""
 from re import compile, escape
 
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
 specials = escape("!#$%&'*+-/=?^_`{|?.")
 
 EMAIL_REGEX = compile(  # noqa: WPS421
@@ -1,9 +1,18 @@
-"""Project db settings."""
-from sqlalchemy import MetaData, create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+"""Project db settings.
+
+Engines are created lazily, so importing models and routers neither loads
+database drivers, nor creates connection pools.
+"""
+from functools import lru_cache
+
+from sqlalchemy import Engine, MetaData, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
+from apps.common.db_routing import ReplicaRouter, RoutingSession
+from apps.monitoring.pool_metrics import InstrumentedAsyncQueuePool, pool_metrics
+from apps.monitoring.query_metrics import query_metrics
 from settings import Settings
 
 postgres_indexes_naming_convention = {
@@ -18,15 +27,85 @@ Base = declarative_base(
     metadata=MetaData(naming_convention=postgres_indexes_naming_convention),
 )
 
-async_engine = create_async_engine(
-    url=Settings.POSTGRES_DSN_ASYNC,
-    echo=Settings.POSTGRES_ECHO,
-)
-engine = create_engine(url=Settings.POSTGRES_DSN, echo=Settings.POSTGRES_ECHO)
+async_engine_kwargs = {
+    'echo': Settings.POSTGRES_ECHO,
+    'pool_size': Settings.POSTGRES_POOL_SIZE,
+    'max_overflow': Settings.POSTGRES_MAX_OVERFLOW,
+    'pool_timeout': Settings.POSTGRES_POOL_TIMEOUT,
+    'pool_recycle': Settings.POSTGRES_POOL_RECYCLE,
+    'pool_pre_ping': Settings.POSTGRES_POOL_PRE_PING,
+    'connect_args': {
+        'statement_cache_size': Settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        'prepared_statement_cache_size': (
+            Settings.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE
+        ),
+    },
+}
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Create primary database async engine once, with its metrics registered."""
+    async_engine = create_async_engine(
+        url=Settings.POSTGRES_DSN_ASYNC,
+        poolclass=InstrumentedAsyncQueuePool,
+        **async_engine_kwargs,
+    )
+    pool_metrics.register(async_engine.pool)
+    query_metrics.register(async_engine.sync_engine)
+    return async_engine
+
+
+@lru_cache
+def get_replica_router() -> ReplicaRouter:
+    """Create read replicas engines and their router once."""
+    replica_router = ReplicaRouter(
+        [
+            create_async_engine(url=replica_dsn, **async_engine_kwargs)
+            for replica_dsn in Settings.POSTGRES_REPLICA_DSNS_ASYNC
+        ],
+        eject_seconds=Settings.POSTGRES_REPLICA_EJECT_SECONDS,
+    )
+    for replica in replica_router.replicas:
+        query_metrics.register(replica.engine.sync_engine)
+    return replica_router
+
 
-async_session_factory = sessionmaker(
-    bind=async_engine,
+@lru_cache
+def get_engine() -> Engine:
+    """Create sync engine once, it is needed by alembic only."""
+    return create_engine(url=Settings.POSTGRES_DSN, echo=Settings.POSTGRES_ECHO)
+
+
+async def dispose_async_engines() -> None:
+    """Close pooled connections of created async engines."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_replica_router.cache_info().currsize:
+        for replica in get_replica_router().replicas:
+            await replica.engine.dispose()
+
+
+async_session_maker = sessionmaker(
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
 )
-session_factory = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+session_maker = sessionmaker(class_=Session, expire_on_commit=False)
+
+
+def async_session_factory() -> AsyncSession:
+    """Create async session, bound to primary engine and read replicas router.
+
+    Engines are created on first session, unless application lifespan has
+    created them already.
+    """
+    return async_session_maker(
+        bind=get_async_engine(),
+        replica_router=get_replica_router(),
+    )
+
+
+def session_factory() -> Session:
+    """Create session, bound to sync engine."""
+    return session_maker(bind=get_engine())
@@ -0,0 +1,141 @@
+"""Read replicas routing for SQLAlchemy sessions."""
+import asyncio
+import logging
+from functools import partial
+from time import monotonic
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ClauseElement, TextClause
+from typing_extensions import Any, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+
+class Replica(object):
+    """Read replica engine with its health state."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize class instance."""
+        self.engine = engine
+        self.ejected_until: float = 0
+
+    @property
+    def is_healthy(self) -> bool:
+        """Check whether replica is not ejected."""
+        return monotonic() >= self.ejected_until
+
+
+class ReplicaRouter(object):
+    """Round-robin choice of healthy read replica."""
+
+    def __init__(self, engines: Sequence[AsyncEngine], eject_seconds: float) -> None:
+        """Initialize class instance."""
+        self.replicas = [Replica(engine) for engine in engines]
+        self._eject_seconds = eject_seconds
+        self._counter = 0
+        for replica in self.replicas:
+            event.listen(
+                replica.engine.sync_engine,
+                'handle_error',
+                partial(self._on_error, replica),
+            )
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """Choose next healthy replica engine, None if there is no one."""
+        healthy_replicas = [replica for replica in self.replicas if replica.is_healthy]
+        if not healthy_replicas:
+            return None
+        self._counter += 1
+        return healthy_replicas[self._counter % len(healthy_replicas)].engine
+
+    def eject(self, replica: Replica) -> None:
+        """Exclude replica from routing for eject period."""
+        replica.ejected_until = monotonic() + self._eject_seconds
+        logger.warning(
+            'Read replica {url} is ejected for {seconds} seconds'.format(
+                url=replica.engine.url.render_as_string(),
+                seconds=self._eject_seconds,
+            ),
+        )
+
+    async def check_health(self) -> None:
+        """Ping every replica, eject failed and restore recovered ones."""
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as connection:
+                    await connection.execute(text('SELECT 1'))
+            except (SQLAlchemyError, OSError):
+                self.eject(replica)
+            else:
+                replica.ejected_until = 0
+
+    async def run_health_checks(self, interval: float) -> None:
+        """Check replicas health periodically."""
+        while True:  # noqa: WPS457
+            await self.check_health()
+            await asyncio.sleep(interval)
+
+    def _on_error(self, replica: Replica, context: ExceptionContext) -> None:
+        """Eject replica on lost or refused connection."""
+        if context.is_disconnect:
+            self.eject(replica)
+
+
+def is_primary_clause(clause: Optional[ClauseElement]) -> bool:
+    """Check whether statement writes or locks rows, or is textual one.
+
+    Textual statement may write, so it is not sent to replicas.
+    """
+    return (
+        getattr(clause, 'is_dml', False)
+        or getattr(clause, '_for_update_arg', None) is not None
+        or isinstance(clause, TextClause)
+    )
+
+
+class RoutingSession(Session):
+    """Session, routing reads to replicas and writes to primary.
+
+    After primary is used once, all following statements of the session go
+    to primary too, so reads see own writes and run in the transaction, which
+    holds the locks.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica_router: Optional[ReplicaRouter] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize class instance."""
+        super().__init__(*args, **kwargs)
+        self._replica_router = replica_router
+        self._uses_primary = False
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: Optional[ClauseElement] = None,
+        for_write: bool = False,
+        **kwargs: Any,
+    ) -> Union[Engine, Any]:
+        """Get replica engine for plain reads and primary for anything else.
+
+        Connection for writes without statement, like COPY, is requested
+        with 'for_write' bind argument. Primary is used for reads as well,
+        when there is no healthy replica.
+        """
+        if for_write or self._flushing or is_primary_clause(clause):
+            self._uses_primary = True
+        replica = None
+        if self._replica_router and not self._uses_primary:
+            replica = self._replica_router.choose()
+        if replica is None:
+            self._uses_primary = True
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        return replica.sync_engine
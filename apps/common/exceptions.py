@@ -16,13 +16,14 @@ class BackendError(Exception):
     }
     """
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         *,
         status: JSENDStatus = JSENDStatus.FAIL,
         data_value: None | int | str | list | dict = None,
         message: str,
         code: int = http_status.HTTP_400_BAD_REQUEST,
+        headers: dict[str, str] | None = None,
     ) -> None:
         """
         Initialize class instance.
@@ -31,11 +32,13 @@ class BackendError(Exception):
         :param data_value: type Message data, if it is.
         :param message: str Message itself.
         :param code: int Http code.
+        :param headers: dict Response headers, if they are.
         """
         self.status = status
         self.data_value = data_value
         self.message = message
         self.code = code
+        self.headers = headers
 
     def __repr__(self) -> str:
         """Represent class instance."""
@@ -13,7 +13,11 @@ from settings import Settings
 
 def backend_error_handler(request: Request, exc: BackendError) -> Response:
     """Return result from Back-end exception."""
-    return JSONResponse(content=exc.dict(), status_code=exc.code)
+    return JSONResponse(
+        content=exc.dict(),
+        status_code=exc.code,
+        headers=exc.headers,
+    )
 
 
 def http_exception_handler(
@@ -0,0 +1,139 @@
+"""OpenAPI schema cache and documentation routers.
+
+Schema generation walks every route and generic out schema, so it is built
+once into artifact, versioned by fingerprint of sources, which generated it.
+"""
+import hashlib
+import logging
+from importlib import metadata
+from pathlib import Path
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from typing_extensions import Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_PATH = Path(__file__).resolve().parents[2]
+OPENAPI_URL = '/openapi.json'
+DOCS_URL = '/docs'
+OAUTH2_REDIRECT_URL = '/docs/oauth2-redirect'
+REDOC_URL = '/redoc'
+
+
+def get_sources_fingerprint() -> str:
+    """Get hash of apps sources and of packages versions, generating schema.
+
+    Settings, changing schema, like limits, are not hashed, so artifact has
+    to be rebuilt, when they are changed.
+    """
+    digest = hashlib.sha256(
+        '{fastapi} {pydantic}'.format(
+            fastapi=metadata.version('fastapi'),
+            pydantic=metadata.version('pydantic'),
+        ).encode(),
+    )
+    source_paths = sorted((PROJECT_PATH / 'apps').rglob('*.py'))
+    source_paths.append(PROJECT_PATH / 'tags_metadata.py')
+    for source_path in source_paths:
+        digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+class OpenAPICache(object):
+    """Application OpenAPI schema, serialized once."""
+
+    def __init__(self, app: FastAPI, artifacts_dir: str) -> None:
+        """Initialize class instance."""
+        self.app = app
+        self.artifacts_dir = Path(artifacts_dir)
+        self._schema_body: Optional[bytes] = None
+
+    def get_artifact_path(self) -> Path:
+        """Get path of schema artifact of current sources."""
+        return self.artifacts_dir / '{fingerprint}.json'.format(
+            fingerprint=get_sources_fingerprint(),
+        )
+
+    def get_body(self) -> bytes:
+        """Get serialized schema, generating it, if it is not loaded or warmed."""
+        if self._schema_body is None:
+            self.warm()
+        return self._schema_body  # type: ignore
+
+    def warm(self) -> None:
+        """Generate and serialize schema, as FastAPI openapi route does."""
+        self._schema_body = JSONResponse(self.app.openapi()).body
+
+    def load_or_warm(self) -> None:
+        """Load schema artifact of current sources or generate schema.
+
+        It is blocking, so it should be run in thread on startup.
+        """
+        artifact_path = self.get_artifact_path()
+        if artifact_path.is_file():
+            self._schema_body = artifact_path.read_bytes()
+            return
+        logger.warning(
+            'OpenAPI schema artifact {path} is not found, generating schema'.format(
+                path=artifact_path,
+            ),
+        )
+        self.warm()
+
+    def build_artifact(self) -> Path:
+        """Generate schema and write it as artifact of current sources."""
+        artifact_path = self.get_artifact_path()
+        artifact_path.parent.mkdir(parents=True, exist_ok=True)
+        artifact_path.write_bytes(self.get_body())
+        return artifact_path
+
+
+openapi_router = APIRouter(include_in_schema=False)
+
+
+@openapi_router.get(OPENAPI_URL, name='read_openapi_schema')
+async def read_openapi_schema(request: Request) -> Response:
+    """Get cached OpenAPI schema."""
+    return Response(
+        request.app.state.openapi_cache.get_body(),
+        media_type='application/json',
+    )
+
+
+@openapi_router.get(DOCS_URL, name='read_swagger_ui', response_class=HTMLResponse)
+async def read_swagger_ui(request: Request) -> HTMLResponse:
+    """Get Swagger UI page."""
+    root_path = request.scope.get('root_path', '').rstrip('/')
+    return get_swagger_ui_html(
+        openapi_url=root_path + OPENAPI_URL,
+        title='{title} - Swagger UI'.format(title=request.app.title),
+        oauth2_redirect_url=root_path + OAUTH2_REDIRECT_URL,
+        init_oauth=request.app.swagger_ui_init_oauth,
+        swagger_ui_parameters=request.app.swagger_ui_parameters,
+    )
+
+
+@openapi_router.get(
+    OAUTH2_REDIRECT_URL,
+    name='read_swagger_ui_oauth2_redirect',
+    response_class=HTMLResponse,
+)
+async def read_swagger_ui_oauth2_redirect(request: Request) -> HTMLResponse:
+    """Get Swagger UI OAuth2 redirect page."""
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@openapi_router.get(REDOC_URL, name='read_redoc', response_class=HTMLResponse)
+async def read_redoc(request: Request) -> HTMLResponse:
+    """Get ReDoc page."""
+    root_path = request.scope.get('root_path', '').rstrip('/')
+    return get_redoc_html(
+        openapi_url=root_path + OPENAPI_URL,
+        title='{title} - ReDoc'.format(title=request.app.title),
+    )
@@ -1,9 +1,13 @@
 """Project SQLAlchemy orm services."""
-from sqlalchemy.engine import ChunkedIteratorResult
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Sequence
+from asyncpg.exceptions import IntegrityConstraintViolationError, PostgresError
+from sqlalchemy.engine import ChunkedIteratorResult, Row
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.sql import Executable, Select
+from typing_extensions import Any, AsyncIterator, Sequence, Type
 
-from apps.common.common_types import ModelType
+from apps.common.base_statements import BoundStatement
+from apps.common.common_types import ModelType, SchemaType
 
 
 class StatementExecutor(object):
@@ -12,26 +16,115 @@ class StatementExecutor(object):
     async def execute_return_statement(
         self,
         session: AsyncSession,
-        statement: str,
+        statement: str | Executable | BoundStatement,
         commit: bool = False,
         many: bool = False,
     ) -> ModelType | Sequence[ModelType] | None:
         """Execute statement with returning data."""
-        alchemy_result: ChunkedIteratorResult = await session.execute(statement)
+        alchemy_result: ChunkedIteratorResult = await self._execute(session, statement)
         if commit:
             await session.commit()
         if many:
             return alchemy_result.scalars().all()
         return alchemy_result.scalar_one_or_none()
 
+    async def execute_return_schema(
+        self,
+        session: AsyncSession,
+        statement: BoundStatement,
+        out_schema: Type[SchemaType],
+        commit: bool = False,
+    ) -> SchemaType | None:
+        """Execute Core statement, validating returned row with out schema.
+
+        Row mapping goes to the schema as is, no ORM instance is built.
+        """
+        alchemy_result = await self._execute(session, statement)
+        row_mapping = alchemy_result.mappings().one_or_none()
+        if commit:
+            await session.commit()
+        if row_mapping is None:
+            return None
+        return out_schema.model_validate(row_mapping)
+
+    async def execute_return_row(
+        self,
+        session: AsyncSession,
+        statement: BoundStatement,
+    ) -> Row | None:
+        """Execute Core statement, returning one row or None."""
+        alchemy_result = await self._execute(session, statement)
+        return alchemy_result.one_or_none()
+
+    async def execute_return_schemas(
+        self,
+        session: AsyncSession,
+        statement: Executable | BoundStatement,
+        out_schema: Type[SchemaType],
+    ) -> list[SchemaType]:
+        """Execute Core statement, validating returned rows with out schema."""
+        alchemy_result = await self._execute(session, statement)
+        return [
+            out_schema.model_validate(row_mapping)
+            for row_mapping in alchemy_result.mappings()
+        ]
+
+    async def stream_return_statement(
+        self,
+        session: AsyncSession,
+        statement: Select,
+        yield_per: int,
+    ) -> AsyncIterator[ModelType]:
+        """Execute statement with server-side cursor, yielding data by chunks."""
+        alchemy_result: AsyncResult = await session.stream(
+            statement.execution_options(yield_per=yield_per),
+        )
+        async for instance in alchemy_result.scalars():
+            yield instance
+
     async def execute_delete_statement(
         self,
         session: AsyncSession,
-        statement: str,
+        statement: str | BoundStatement,
     ) -> None:
         """Execute delete statement."""
-        await session.execute(statement)
+        await self._execute(session, statement)
+        await session.commit()
+
+    async def copy_records(
+        self,
+        session: AsyncSession,
+        table_name: str,
+        records: Sequence[dict],
+    ) -> None:
+        """Copy records to table with COPY protocol and commit."""
+        columns = list(records[0])
+        connection = await session.connection(bind_arguments={'for_write': True})
+        raw_connection = await connection.get_raw_connection()
+        driver_connection: Any = raw_connection.driver_connection
+        try:
+            await driver_connection.copy_records_to_table(
+                table_name,
+                records=[
+                    tuple(record[column] for column in columns) for record in records
+                ],
+                columns=columns,
+            )
+        except IntegrityConstraintViolationError as error:
+            raise IntegrityError('COPY', None, error)
+        except PostgresError as error:
+            raise DBAPIError('COPY', None, error)
         await session.commit()
 
+    async def _execute(
+        self,
+        session: AsyncSession,
+        statement: str | Executable | BoundStatement,
+    ) -> Any:
+        """Execute statement or statement template with its bound values."""
+        if isinstance(statement, BoundStatement):
+            return await session.execute(statement.statement, statement.bind_values)
+        return await session.execute(statement)
+
 
 statement_executor = StatementExecutor()
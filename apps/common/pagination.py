@@ -0,0 +1,75 @@
+"""Keyset (cursor) pagination functionality."""
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from typing_extensions import Any, Optional, Sequence
+
+from apps.common.exceptions import BackendError
+
+INVALID_CURSOR_MESSAGE = 'Invalid pagination cursor.'
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode last seen instance id into opaque cursor."""
+    return _dump_cursor({'id': last_id})
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode opaque cursor into last seen instance id."""
+    return _load_cursor(cursor)['id']
+
+
+def encode_time_cursor(created_at: datetime, last_id: int) -> str:
+    """Encode last seen instance creation time and id into opaque cursor."""
+    return _dump_cursor({'created_at': created_at.isoformat(), 'id': last_id})
+
+
+def decode_time_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode opaque cursor into last seen instance creation time and id."""
+    cursor_data = _load_cursor(cursor)
+    try:
+        created_at = datetime.fromisoformat(str(cursor_data.get('created_at')))
+    except ValueError:
+        raise BackendError(message=INVALID_CURSOR_MESSAGE)
+    if created_at.tzinfo is None:
+        raise BackendError(message=INVALID_CURSOR_MESSAGE)
+    return created_at, cursor_data['id']
+
+
+def get_page(
+    instances: Sequence[Any],
+    limit: int,
+    by_time: bool = False,
+) -> tuple[Sequence[Any], Optional[str]]:
+    """Cut page from instances, fetched with limit + 1, and get next cursor.
+
+    Cursor holds creation time and id of the last instance on page, if
+    'by_time' is set, and only its id otherwise.
+    """
+    if len(instances) <= limit:
+        return instances, None
+    page = instances[:limit]
+    last_instance = page[-1]
+    if by_time:
+        return page, encode_time_cursor(last_instance.created_at, last_instance.id)
+    return page, encode_cursor(last_instance.id)
+
+
+def _dump_cursor(cursor_data: dict) -> str:
+    """Encode cursor data into opaque cursor."""
+    raw_cursor = json.dumps(cursor_data, separators=(',', ':'))
+    return urlsafe_b64encode(raw_cursor.encode()).decode().rstrip('=')
+
+
+def _load_cursor(cursor: str) -> dict:
+    """Decode opaque cursor into cursor data with last seen instance id."""
+    padding = '=' * (-len(cursor) % 4)
+    try:
+        cursor_data = json.loads(urlsafe_b64decode(cursor + padding))
+    except ValueError:
+        raise BackendError(message=INVALID_CURSOR_MESSAGE)
+    last_id = cursor_data.get('id') if isinstance(cursor_data, dict) else None
+    if not isinstance(last_id, int):
+        raise BackendError(message=INVALID_CURSOR_MESSAGE)
+    return cursor_data
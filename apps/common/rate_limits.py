@@ -0,0 +1,114 @@
+"""Token bucket rate limits of clients by route name.
+
+Every client of limited route has bucket of route limit capacity, which is
+refilled with capacity tokens per limit period, and every request takes one
+token. Clients are authenticated users, identified by token subject, or
+client addresses for anonymous requests and requests with invalid tokens.
+"""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from math import ceil
+from time import monotonic
+
+from fastapi import HTTPException, Request, status
+from jose import jwt
+from pydantic import ValidationError
+from typing_extensions import Hashable
+
+from apps.common.common_utilities import get_token_data
+from apps.common.exceptions import BackendError
+from settings import Settings
+
+
+class RateLimitBackend(ABC):
+    """Store of token buckets, shared stores of several workers extend it."""
+
+    @abstractmethod
+    async def take_token(self, key: Hashable, capacity: int, period: float) -> float:
+        """Take token from bucket of key, get seconds to wait, 0 if it is taken."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Token buckets of current process, ordered by last access.
+
+    Bucket, which is idle for limit period, is full again, so buckets idle
+    for longer than the longest period are evicted, as they equal to absent.
+    """
+
+    def __init__(self, max_idle: float) -> None:
+        """Initialize class instance."""
+        self.max_idle = max_idle
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+
+    async def take_token(self, key: Hashable, capacity: int, period: float) -> float:
+        """Take token from bucket of key, get seconds to wait, 0 if it is taken."""
+        now = monotonic()
+        self._evict_idle(now)
+        tokens, updated_at = self._buckets.pop(key, (capacity, now))
+        refill_rate = capacity / period
+        tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / refill_rate
+        self._buckets[key] = (tokens - 1, now)
+        return 0
+
+    def _evict_idle(self, now: float) -> None:
+        """Remove the least recently used buckets, while they are idle too long."""
+        while self._buckets:
+            _, updated_at = next(iter(self._buckets.values()))
+            if now - updated_at < self.max_idle:
+                return
+            self._buckets.popitem(last=False)
+
+
+def get_client_key(request: Request) -> str:
+    """Get token subject of authenticated user or client address."""
+    scheme, _, token = request.headers.get('authorization', '').partition(' ')
+    if scheme.lower() == 'bearer' and token:
+        try:
+            return 'user:{subject}'.format(subject=get_token_data(token).sub)
+        except (jwt.JWTError, ValidationError, HTTPException):
+            pass  # noqa: WPS420
+    return 'address:{host}'.format(host=request.client.host if request.client else '')
+
+
+class RateLimiter(object):
+    """Application dependency, limiting requests of clients to limited routes."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[int, float]],
+        backend: RateLimitBackend,
+    ) -> None:
+        """Initialize class instance."""
+        self.limits = limits
+        self.backend = backend
+
+    async def __call__(self, request: Request) -> None:
+        """Take token of client for route or raise error, if there is no one."""
+        route_name = request.scope['route'].name
+        if route_name not in self.limits:
+            return
+        capacity, period = self.limits[route_name]
+        bucket_key = (route_name, get_client_key(request))
+        retry_after = ceil(await self.backend.take_token(bucket_key, capacity, period))
+        if retry_after:
+            raise BackendError(
+                message='Too many requests, retry after {seconds} seconds.'.format(
+                    seconds=retry_after,
+                ),
+                code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={'Retry-After': str(retry_after)},
+            )
+
+
+rate_limiter = RateLimiter(
+    Settings.RATE_LIMITS,
+    InMemoryRateLimitBackend(
+        max(
+            (period for _, period in Settings.RATE_LIMITS.values()),
+            default=0,
+        ),
+    ),
+)
@@ -0,0 +1,29 @@
+"""Common app responses."""
+import pydantic_core
+from fastapi.responses import Response
+from typing_extensions import Any
+
+from apps.common.enum import JSENDStatus
+
+
+class JSENDResponse(Response):
+    """JSEND success response, serialized without response model validation.
+
+    Content is dict with 'data', 'message' and optional extra fields, like
+    'next_cursor'. Data should be out schemas already, it is serialized by
+    pydantic-core at once, so route response model is only used by OpenAPI.
+    """
+
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:  # noqa: WPS110
+        """Render content, wrapped into JSEND envelope, to JSON."""
+        return pydantic_core.to_json(
+            {
+                'status': JSENDStatus.SUCCESS,
+                'data': None,
+                'message': None,
+                'code': self.status_code,
+                **content,
+            },
+        )
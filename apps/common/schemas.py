@@ -5,6 +5,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import Annotated, Generic, Optional, Sequence, TypeVar, Union
 
 from apps.common.enum import JSENDStatus
+from settings import Settings
 
 SchemaVar = TypeVar('SchemaVar', bound=Union[BaseModel, None, str])
 
@@ -34,6 +35,75 @@ class JSENDOutSchema(BaseModel, Generic[SchemaVar]):
     code: int = Field(default=http_status.HTTP_200_OK)
 
 
+class JSENDPageOutSchema(JSENDOutSchema[SchemaVar], Generic[SchemaVar]):
+    """Output JSEND schema with success status for paginated list."""
+
+    next_cursor: Annotated[
+        Optional[str],
+        Field(description='Cursor for the next page, null on the last page'),
+    ] = None
+
+
+class PaginationIn(BaseInSchema):
+    """Keyset pagination query parameters."""
+
+    limit: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=Settings.PAGINATION_MAX_LIMIT,
+            description='Page size',
+        ),
+    ] = Settings.PAGINATION_DEFAULT_LIMIT
+    after: Annotated[
+        Optional[str],
+        Field(description='Cursor, returned as "next_cursor" with previous page'),
+    ] = None
+
+
+class BulkCreateIn(BaseInSchema):
+    """Bulk create query parameters."""
+
+    chunk_size: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=Settings.BULK_CREATE_MAX_CHUNK_SIZE,
+            description='Instances count, inserted in one transaction',
+        ),
+    ] = Settings.BULK_CREATE_CHUNK_SIZE
+    returning: Annotated[
+        bool,
+        Field(description='Return created instances, otherwise use COPY'),
+    ] = True
+
+
+class BulkChunkOut(BaseOutSchema):
+    """Bulk create chunk result out schema."""
+
+    index: Annotated[int, Field(description='Chunk index', examples=[0])]
+    count: Annotated[int, Field(description='Chunk instances count', examples=[1])]
+    status: Annotated[
+        JSENDStatus,
+        Field(description='Chunk status', examples=[JSENDStatus.SUCCESS]),
+    ]
+    message: Annotated[
+        Optional[str],
+        Field(description='Chunk fail message', examples=[None]),
+    ] = None
+
+
+class BulkCreateOut(BaseOutSchema, Generic[SchemaVar]):
+    """Bulk create result out schema."""
+
+    created: Annotated[int, Field(description='Created instances count')]
+    chunks: Annotated[list[BulkChunkOut], Field(description='Chunk results')]
+    instances: Optional[list[SchemaVar]] = Field(
+        default=None,
+        description='Created instances, if returning was requested',
+    )
+
+
 class JSENDFailOutSchema(JSENDOutSchema):
     """Output JSEND schema with fail status."""
 
@@ -4,16 +4,44 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Annotated, Sequence
+from typing_extensions import Annotated
 
+from apps.common.caches import LRUCache
 from apps.common.common_utilities import checkers, get_token_data
 from apps.common.dependencies import get_async_session
 from apps.common.exceptions import BackendError
 from apps.common.orm_services import statement_executor
+from apps.user.activity import user_activity_buffer
 from apps.user.models import User
+from apps.user.schemas import AuthUserOut
 from apps.user.statements import user_crud_statements
+from settings import Settings
 
 reusable_oauth = OAuth2PasswordBearer(tokenUrl='/login/', scheme_name='JWT')
+user_cache = LRUCache(Settings.USER_CACHE_MAX_SIZE, ttl=Settings.USER_CACHE_TTL)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop cached data of changed or deleted user."""
+    user_cache.invalidate(lambda auth_user: auth_user.id == user_id)
+
+
+async def get_auth_user(email: str, session: AsyncSession) -> AuthUserOut:
+    """Get authenticated user data from cache or database by token subject."""
+    auth_user: AuthUserOut | None = user_cache.get(email)
+    if auth_user is None:
+        read_user_stmt = user_crud_statements.read_statement(
+            obj_data={'email': email},
+            core=True,
+        )
+        auth_user = await statement_executor.execute_return_schema(
+            session,
+            read_user_stmt,
+            AuthUserOut,
+        )
+        auth_user = checkers.check_created_instance(auth_user, 'User')
+        user_cache.set(email, auth_user)
+    return auth_user
 
 
 async def get_user(
@@ -21,7 +49,11 @@ async def get_user(
     session: AsyncSession,
     is_admin: bool = False,
 ) -> User:
-    """Get current avarage or admin user with given token and is_admin flag."""
+    """Get current avarage or admin user with given token and is_admin flag.
+
+    Only authentication data fields of returned user are loaded. Request time
+    of user is recorded to activity buffer, not written to database at once.
+    """
     try:
         token_data = get_token_data(token)
     except (jwt.JWTError, ValidationError):
@@ -30,22 +62,14 @@ async def get_user(
             detail='Credential verification failed',
             headers={'WWW-Authenticate': 'Bearer'},
         )
-    read_user_stmt = user_crud_statements.read_statement(
-        obj_data={'email': token_data.sub},
-    )
-    user: User | Sequence[
-        User | None
-    ] | None = await statement_executor.execute_return_statement(
-        session,
-        read_user_stmt,
-    )
-    checked_user: User = checkers.check_created_instance(user, 'User')
-    if is_admin and not checked_user.is_admin:
+    auth_user = await get_auth_user(token_data.sub, session)
+    if is_admin and not auth_user.is_admin:
         raise BackendError(
             message='User is not admin user',
             code=status.HTTP_403_FORBIDDEN,
         )
-    return checked_user
+    user_activity_buffer.record_request(auth_user.id)
+    return User(**auth_user.model_dump())
 
 
 async def get_current_user(
@@ -1,13 +1,18 @@
 """Likes apps handlers."""
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Sequence
 
+from apps.common.base_statements import BoundStatement
 from apps.common.common_utilities import checkers
 from apps.common.orm_services import statement_executor as executor
-from apps.likes.models import Like
-from apps.likes.schemas import CreateLikeIn, CreateLikeOut
-from apps.likes.statements import like_crud_statements
+from apps.likes.schemas import (
+    CreateLikeIn,
+    CreateLikeOut,
+    DeleteLikeIn,
+    LikeDailyIn,
+    LikeDailyOut,
+)
+from apps.likes.statements import like_crud_statements, like_daily_statements
 from apps.user.models import User
 
 
@@ -21,20 +26,55 @@ class LikeHandlers(object):
         user: User,
         session: AsyncSession,
     ) -> CreateLikeOut:
-        """Create like."""
-        statement: str = like_crud_statements.create_statement(
+        """Create like or update evaluation of existing user like to post."""
+        statement: BoundStatement = like_crud_statements.upsert_statement(
             schema=like,
             obj_data={'user_id': user.id},
         )
-        created_like: Like | Sequence[
-            Like | None
-        ] | None = await executor.execute_return_statement(
+        created_like: CreateLikeOut | None = await executor.execute_return_schema(
             session,
             statement,
+            CreateLikeOut,
             commit=True,
         )
-        checked_like: Like = checkers.check_created_instance(created_like, 'Like')
-        return CreateLikeOut.model_validate(checked_like)
+        return checkers.check_created_instance(created_like, 'Like')
+
+    async def delete_like(
+        self,
+        request: Request,
+        like: DeleteLikeIn,
+        user: User,
+        session: AsyncSession,
+    ) -> CreateLikeOut | None:
+        """Delete user like to post, return deleted like, if there was one."""
+        statement: BoundStatement = like_crud_statements.delete_statement(
+            schema=like,
+            obj_data={'user_id': user.id},
+            core=True,
+        )
+        return await executor.execute_return_schema(
+            session,
+            statement,
+            CreateLikeOut,
+            commit=True,
+        )
+
+    async def read_like_daily(
+        self,
+        request: Request,
+        filters: LikeDailyIn,
+        session: AsyncSession,
+    ) -> list[LikeDailyOut]:
+        """Read daily likes time series from rollup."""
+        return await executor.execute_return_schemas(
+            session,
+            like_daily_statements.series_statement(
+                filters.date_from,
+                filters.date_to,
+                post_id=filters.post_id,
+            ),
+            LikeDailyOut,
+        )
 
 
 like_handlers = LikeHandlers()
@@ -1,5 +1,14 @@
 """Models for likes apps."""
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from apps.common.common_utilities import AwareDateTime
@@ -10,10 +19,16 @@ class Like(Base):
     """Like model."""
 
     __tablename__ = 'like'
+    __table_args__ = (UniqueConstraint('user_id', 'post_id'),)
 
     id = Column(Integer, primary_key=True, nullable=False)
     eval = Column(Boolean, default=False, nullable=False)
-    created_at = Column(AwareDateTime, default=func.now(), nullable=False)
+    created_at = Column(
+        AwareDateTime,
+        default=func.now(),
+        nullable=False,
+        index=True,
+    )
     user_id = Column(
         Integer,
         ForeignKey('user.id', ondelete='CASCADE', onupdate='CASCADE'),
@@ -23,6 +38,7 @@ class Like(Base):
         Integer,
         ForeignKey('post.id', ondelete='CASCADE', onupdate='CASCADE'),
         nullable=False,
+        index=True,
     )
     user = relationship('User', back_populates='likes')
     post = relationship('Post', back_populates='likes')
@@ -43,3 +59,44 @@ class Like(Base):
                 ),
             ),
         )
+
+
+class LikeDaily(Base):
+    """Likes and dislikes of post per day rollup model."""
+
+    __tablename__ = 'like_daily'
+
+    post_id = Column(
+        Integer,
+        ForeignKey('post.id', ondelete='CASCADE', onupdate='CASCADE'),
+        primary_key=True,
+        nullable=False,
+    )
+    day = Column(Date, primary_key=True, nullable=False, index=True)
+    likes = Column(Integer, default=0, nullable=False)
+    dislikes = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        """Represent class instance."""
+        return '{name}(post_id={post_id}, day={day})'.format(
+            name=self.__class__.__name__,
+            post_id=self.post_id,
+            day=self.day,
+        )
+
+
+class RollupWatermark(Base):
+    """Last source row id, processed by rollup refresh, model."""
+
+    __tablename__ = 'rollup_watermark'
+
+    name = Column(String(50), primary_key=True, nullable=False)
+    last_id = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        """Represent class instance."""
+        return '{name}(name={rollup_name}, last_id={last_id})'.format(
+            name=self.__class__.__name__,
+            rollup_name=self.name,
+            last_id=self.last_id,
+        )
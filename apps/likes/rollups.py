@@ -0,0 +1,55 @@
+"""Likes apps rollups refresh."""
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.common.db import async_session_factory
+from apps.likes.statements import like_daily_statements
+from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_like_daily(session: AsyncSession) -> int:
+    """Add likes newer than watermark to daily rollup, return new watermark.
+
+    Watermark row is locked till commit, so refreshes from several workers
+    run one after another. Only likes older than the lag are taken, likes of
+    transactions running longer than the lag may be missed. Updates and
+    deletes of likes, which are already added, are applied by triggers.
+    """
+    last_id: int = await session.scalar(
+        like_daily_statements.lock_watermark_statement(),
+    )
+    upto_id = await session.scalar(
+        like_daily_statements.upper_bound_statement(
+            last_id,
+            timedelta(seconds=Settings.LIKE_DAILY_LAG_SECONDS),
+        ),
+    )
+    if upto_id is None:
+        await session.rollback()
+        return last_id
+    await add_likes_range(session, last_id, upto_id)
+    return upto_id
+
+
+async def add_likes_range(session: AsyncSession, last_id: int, upto_id: int) -> None:
+    """Add likes in id range to daily rollup, move watermark and commit."""
+    await session.execute(like_daily_statements.refresh_statement(last_id, upto_id))
+    await session.execute(like_daily_statements.update_watermark_statement(upto_id))
+    await session.commit()
+
+
+async def run_like_daily_refreshes(interval: float) -> None:
+    """Refresh likes daily rollup periodically."""
+    while True:  # noqa: WPS457
+        async with async_session_factory() as session:
+            try:
+                await refresh_like_daily(session)
+            except (SQLAlchemyError, OSError):
+                logger.exception('Likes daily rollup refresh failed')
+        await asyncio.sleep(interval)
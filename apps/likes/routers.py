@@ -1,12 +1,13 @@
 """Likes apps routers."""
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Annotated
+from typing_extensions import Annotated, Optional
 
 from apps.common.base_routers import BaseRouterInitializer
 from apps.common.dependencies import get_async_session
-from apps.common.schemas import JSENDFailOutSchema, JSENDOutSchema
-from apps.common.user_dependencies import get_current_user
+from apps.common.responses import JSENDResponse
+from apps.common.schemas import JSENDErrorOutSchema, JSENDFailOutSchema, JSENDOutSchema
+from apps.common.user_dependencies import get_current_admin_user, get_current_user
 from apps.likes.handlers import like_handlers
 from apps.likes.models import Like
 from apps.likes.schemas import (
@@ -14,14 +15,19 @@ from apps.likes.schemas import (
     AdminPartiallyUpdateLikeIn,
     CreateLikeIn,
     CreateLikeOut,
+    DeleteLikeIn,
+    LikeDailyIn,
+    LikeDailyOut,
 )
+from apps.likes.statements import like_crud_statements
 from apps.user.models import User
 
 likes_router = APIRouter()
+admin_likes_router = APIRouter()
 
 
 admin_like_router_initializer = BaseRouterInitializer(  # type: ignore
-    router=likes_router,
+    router=admin_likes_router,
     in_schemas=(
         AdminCreateLikeIn,
         AdminCreateLikeIn,
@@ -29,10 +35,9 @@ admin_like_router_initializer = BaseRouterInitializer(  # type: ignore
     ),
     out_schema=CreateLikeOut,
     model=Like,
+    statements=like_crud_statements,
 )
 
-admin_like_router_initializer.initialize_routers()
-
 
 @likes_router.post(
     '/like/',
@@ -50,7 +55,7 @@ async def create_like(
     like: Annotated[CreateLikeIn, Depends()],
     user: Annotated[User, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> dict:
+) -> JSENDResponse:
     """Create post router."""
     created_like: CreateLikeOut = await like_handlers.create_like(
         request,
@@ -58,7 +63,78 @@ async def create_like(
         user,
         session,
     )
+    return JSENDResponse(
+        {
+            'data': created_like,
+            'message': 'Created like with id {id}'.format(id=created_like.id),
+        },
+    )
+
+
+@likes_router.delete(
+    '/like/',
+    name='delete_user_like',
+    response_model=JSENDOutSchema[Optional[CreateLikeOut]],
+    summary='Delete like',
+    responses={
+        200: {'description': 'Successful delete like response'},
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Likes application'],
+)
+async def delete_user_like(
+    request: Request,
+    like: Annotated[DeleteLikeIn, Depends()],
+    user: Annotated[User, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> dict:
+    """**Delete user like** to post.
+
+    Deleting like, which does not exist, is not an error, so it is safe to retry.
+    """
+    deleted_like = await like_handlers.delete_like(request, like, user, session)
+    if deleted_like is None:
+        message = 'There is no like to post with id {id}'
+    else:
+        message = 'Deleted like to post with id {id}'
+    return {
+        'data': deleted_like,
+        'message': message.format(id=like.post_id),
+    }
+
+
+@likes_router.get(
+    '/admin/analytics/likes/daily/',
+    name='read_like_daily',
+    response_model=JSENDOutSchema[list[LikeDailyOut]],  # type: ignore
+    summary='Get posts likes per day for date range by admin',
+    responses={
+        200: {'description': 'Successful get daily likes response'},
+        401: {'description': 'Not authenticated.', 'model': JSENDFailOutSchema},
+        403: {
+            'description': 'User is not an admin user.',
+            'model': JSENDFailOutSchema,
+        },
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+        500: {'description': 'Internal server error.', 'model': JSENDErrorOutSchema},
+    },
+    tags=['Likes application'],
+)
+async def read_like_daily(
+    request: Request,
+    filters: Annotated[LikeDailyIn, Depends()],
+    user: Annotated[User, Depends(get_current_admin_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> dict:
+    """**Get likes and dislikes per post and day** from daily rollup.
+
+    Rollup is refreshed periodically, so the latest likes may be missing.
+    """
+    like_daily = await like_handlers.read_like_daily(request, filters, session)
     return {
-        'data': created_like,
-        'message': 'Created like with id {id}'.format(id=created_like.id),
+        'data': like_daily,
+        'message': 'Got daily likes from {date_from} to {date_to}'.format(
+            date_from=filters.date_from,
+            date_to=filters.date_to,
+        ),
     }
@@ -1,10 +1,11 @@
 """Likes apps schemas."""
-from datetime import datetime
+from datetime import date, datetime
 
-from pydantic import Field
-from typing_extensions import Annotated
+from pydantic import Field, model_validator
+from typing_extensions import Annotated, Optional
 
-from apps.common.schemas import BaseInSchema
+from apps.common.schemas import BaseInSchema, BaseOutSchema
+from settings import Settings
 
 
 class CreateLikeIn(BaseInSchema):
@@ -14,6 +15,12 @@ class CreateLikeIn(BaseInSchema):
     post_id: Annotated[int, Field(examples=[1], description='Post id to evaluate')]
 
 
+class DeleteLikeIn(BaseInSchema):
+    """Like deletion in schema, for deletion by not admin user."""
+
+    post_id: Annotated[int, Field(examples=[1], description='Post id to unlike')]
+
+
 class AdminCreateLikeIn(CreateLikeIn):
     """Like creation in schema for admin user."""
 
@@ -45,3 +52,43 @@ class CreateLikeOut(BaseInSchema):
         int,
         Field(description='Like created to post with id', examples=[2]),
     ]
+
+
+class LikeDailyIn(BaseInSchema):
+    """Daily likes time series filter in schema."""
+
+    date_from: Annotated[
+        date,
+        Field(description='First day of range', examples=['2024-02-01']),
+    ]
+    date_to: Annotated[
+        date,
+        Field(description='Last day of range', examples=['2024-02-29']),
+    ]
+    post_id: Annotated[
+        Optional[int],
+        Field(description='Post id, all posts if not given', examples=[1]),
+    ] = None
+
+    @model_validator(mode='after')
+    def check_range(self) -> 'LikeDailyIn':
+        """Check whether date range is not reversed or too long."""
+        range_days = (self.date_to - self.date_from).days + 1
+        if range_days < 1:
+            raise ValueError('date_to must not be earlier than date_from')
+        if range_days > Settings.LIKE_DAILY_MAX_DAYS:
+            raise ValueError(
+                'Date range must not exceed {days} days'.format(
+                    days=Settings.LIKE_DAILY_MAX_DAYS,
+                ),
+            )
+        return self
+
+
+class LikeDailyOut(BaseOutSchema):
+    """Post likes and dislikes per day out schema."""
+
+    post_id: Annotated[int, Field(description='Post id', examples=[1])]
+    day: Annotated[date, Field(description='Day', examples=['2024-02-10'])]
+    likes: Annotated[int, Field(description='Likes count', examples=[10])]
+    dislikes: Annotated[int, Field(description='Dislikes count', examples=[2])]
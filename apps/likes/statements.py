@@ -1,5 +1,135 @@
 """Likes apps statements."""
-from apps.common.base_statements import BaseCRUDStatements
-from apps.likes.models import Like
+from datetime import date, timedelta
 
-like_crud_statements = BaseCRUDStatements(model=Like)
+from sqlalchemy import Date, cast, func, literal_column, not_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import Executable
+from typing_extensions import Optional
+
+from apps.common.base_statements import BaseCRUDStatements, BoundStatement
+from apps.common.schemas import BaseInSchema
+from apps.likes.models import Like, LikeDaily, RollupWatermark
+
+LIKE_DAILY_ROLLUP = 'like_daily'
+
+
+class LikeCRUDStatements(BaseCRUDStatements):
+    """Like CRUD statements.
+
+    Likes have no update time, so all their changeable columns are versions.
+    """
+
+    version_keys = ('created_at', 'eval', 'post_id', 'user_id')
+
+    def upsert_statement(
+        self,
+        *,
+        schema: BaseInSchema,
+        obj_data: dict,
+    ) -> BoundStatement:
+        """Create statement inserting like or updating evaluation of existing one.
+
+        Returns like row, so like of user to post is set with one statement.
+        """
+        values_data = {**obj_data, **schema.model_dump(exclude_unset=True)}
+        value_keys = tuple(sorted(values_data))
+        template = self._get_template(
+            lambda: self._build_upsert_template(value_keys),
+            'core_upsert',
+            value_keys,
+        )
+        return BoundStatement(template, self._get_bind_params(values_data=values_data))
+
+    def _build_upsert_template(self, value_keys: tuple[str, ...]) -> Executable:
+        """Build like upsert statement template with given column set."""
+        insert_statement = insert(self.table).values(self._get_bind_values(value_keys))
+        return insert_statement.on_conflict_do_update(
+            index_elements=['user_id', 'post_id'],
+            set_={'eval': insert_statement.excluded.eval},
+        ).returning(*self.table.columns)
+
+
+class LikeDailyStatements(object):
+    """Daily likes rollup statements."""
+
+    def __init__(self) -> None:
+        """Initialize class instance."""
+        self.like = Like.__table__
+        self.like_daily = LikeDaily.__table__
+        self.watermark = RollupWatermark.__table__
+
+    def lock_watermark_statement(self) -> Executable:
+        """Create statement locking and reading rollup watermark."""
+        return (
+            select(self.watermark.c.last_id)
+            .where(self.watermark.c.name == LIKE_DAILY_ROLLUP)
+            .with_for_update()
+        )
+
+    def upper_bound_statement(self, last_id: int, lag: timedelta) -> Executable:
+        """Create statement for last like id, old enough to be committed."""
+        return select(func.max(self.like.c.id)).where(
+            self.like.c.id > last_id,
+            self.like.c.created_at <= func.now() - lag,
+        )
+
+    def refresh_statement(self, last_id: int, upto_id: int) -> Executable:
+        """Create statement adding likes in id range to daily rollup."""
+        day = cast(
+            func.timezone(literal_column("'UTC'"), self.like.c.created_at),
+            Date,
+        )
+        new_likes = (
+            select(
+                self.like.c.post_id,
+                day,
+                func.count().filter(self.like.c.eval),
+                func.count().filter(not_(self.like.c.eval)),
+            )
+            .where(self.like.c.id > last_id, self.like.c.id <= upto_id)
+            .group_by(self.like.c.post_id, day)
+        )
+        insert_statement = insert(self.like_daily).from_select(
+            ['post_id', 'day', 'likes', 'dislikes'],
+            new_likes,
+        )
+        return insert_statement.on_conflict_do_update(
+            index_elements=['post_id', 'day'],
+            set_={
+                'likes': self.like_daily.c.likes + insert_statement.excluded.likes,
+                'dislikes': (
+                    self.like_daily.c.dislikes + insert_statement.excluded.dislikes
+                ),
+            },
+        )
+
+    def update_watermark_statement(self, last_id: int) -> Executable:
+        """Create statement moving rollup watermark."""
+        return (
+            update(self.watermark)
+            .where(self.watermark.c.name == LIKE_DAILY_ROLLUP)
+            .values(last_id=last_id)
+        )
+
+    def series_statement(
+        self,
+        date_from: date,
+        date_to: date,
+        post_id: Optional[int] = None,
+    ) -> Executable:
+        """Create statement reading daily likes in date range."""
+        series_statement = select(self.like_daily).where(
+            self.like_daily.c.day.between(date_from, date_to),
+        )
+        if post_id is not None:
+            series_statement = series_statement.where(
+                self.like_daily.c.post_id == post_id,
+            )
+        return series_statement.order_by(
+            self.like_daily.c.post_id,
+            self.like_daily.c.day,
+        )
+
+
+like_crud_statements = LikeCRUDStatements(model=Like)
+like_daily_statements = LikeDailyStatements()
@@ -1,50 +1,190 @@
-"""Main FastAPI module."""
-from fastapi import FastAPI
+"""Main FastAPI module.
+
+Run application with ``python -m apps`` or with
+``uvicorn --factory apps.main:create_app``. Module application is kept for
+``uvicorn apps.main:app`` commands, creating it on import is cheap, as
+routers and database engines are created lazily.
+"""
+import asyncio
+import logging
+import pprint
+from contextlib import asynccontextmanager
+from time import perf_counter
+
+from fastapi import Depends, FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from typing_extensions import AsyncIterator
 
+from apps.authorization.auth_utilities import password_service
 from apps.authorization.routers import authorization_router
+from apps.common.db import dispose_async_engines, get_async_engine, get_replica_router
 from apps.common.exceptions import BackendError
 from apps.common.exceptions_handlers import (
     backend_error_handler,
     http_exception_handler,
     validation_exception_handler,
 )
-from apps.likes.routers import likes_router
-from apps.posts.routers import posts_router
-from apps.user.routers import users_router
+from apps.common.openapi import OpenAPICache, openapi_router
+from apps.common.rate_limits import rate_limiter
+from apps.likes.rollups import run_like_daily_refreshes
+from apps.likes.routers import admin_like_router_initializer, likes_router
+from apps.monitoring.query_metrics import QueryMetricsMiddleware
+from apps.monitoring.route_metrics import RouteMetricsMiddleware
+from apps.monitoring.routers import monitoring_router
+from apps.posts.routers import admin_post_router_initializer, posts_router
+from apps.user.activity import flush_user_activity, run_user_activity_flushes
+from apps.user.routers import admin_user_router_initializer, users_router
 from settings import Settings
 from tags_metadata import metadata
 
-app = FastAPI(openapi_tags=metadata)
+logger = logging.getLogger(__name__)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=Settings.CORS_ALLOW_ORIGINS,
-    allow_credentials=Settings.CORS_ALLOW_CREDENTIALS,
-    allow_methods=Settings.CORS_ALLOW_METHODS,
-    allow_headers=Settings.CORS_ALLOW_HEADERS,
-)
 
+def start_background_tasks(app: FastAPI) -> list[asyncio.Task]:
+    """Start enabled background tasks."""
+    background_tasks = []
+    if Settings.ENABLE_OPENAPI:
+        background_tasks.append(
+            asyncio.create_task(
+                asyncio.to_thread(app.state.openapi_cache.load_or_warm),
+            ),
+        )
+    replica_router = get_replica_router()
+    if replica_router.replicas:
+        background_tasks.append(
+            asyncio.create_task(
+                replica_router.run_health_checks(
+                    Settings.POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL,
+                ),
+            ),
+        )
+    if Settings.LIKE_DAILY_REFRESH_INTERVAL > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                run_like_daily_refreshes(Settings.LIKE_DAILY_REFRESH_INTERVAL),
+            ),
+        )
+    if Settings.USER_ACTIVITY_FLUSH_INTERVAL > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                run_user_activity_flushes(Settings.USER_ACTIVITY_FLUSH_INTERVAL),
+            ),
+        )
+    return background_tasks
 
-app.add_exception_handler(BackendError, backend_error_handler)  # type: ignore
-app.add_exception_handler(
-    StarletteHTTPException,
-    http_exception_handler,  # type: ignore
-)
-app.add_exception_handler(
-    RequestValidationError,
-    validation_exception_handler,  # type: ignore
-)
-app.add_exception_handler(
-    ValidationError,
-    validation_exception_handler,  # type: ignore
-)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create engines and run background tasks during application lifetime."""
+    started_at = perf_counter()
+    get_async_engine()
+    background_tasks = start_background_tasks(app)
+    app.state.startup_timings['lifespan'] = perf_counter() - started_at
+    logger.info(
+        'Application started, {timings}'.format(
+            timings=', '.join(
+                '{phase}: {ms:.1f} ms'.format(phase=phase, ms=duration * 1e3)
+                for phase, duration in app.state.startup_timings.items()
+            ),
+        ),
+    )
+    yield
+    for background_task in background_tasks:
+        background_task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await flush_user_activity()
+    password_service.shutdown()
+    await dispose_async_engines()
+
+
+def add_middlewares(app: FastAPI) -> None:
+    """Add application middlewares, the last added is the outermost."""
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=Settings.CORS_ALLOW_ORIGINS,
+        allow_credentials=Settings.CORS_ALLOW_CREDENTIALS,
+        allow_methods=Settings.CORS_ALLOW_METHODS,
+        allow_headers=Settings.CORS_ALLOW_HEADERS,
+    )
+    app.add_middleware(
+        QueryMetricsMiddleware,
+        server_timing=Settings.SERVER_TIMING_ENABLED,
+    )
+    app.add_middleware(RouteMetricsMiddleware)
+
+
+def add_exception_handlers(app: FastAPI) -> None:
+    """Add application exception handlers."""
+    app.add_exception_handler(BackendError, backend_error_handler)  # type: ignore
+    app.add_exception_handler(
+        StarletteHTTPException,
+        http_exception_handler,  # type: ignore
+    )
+    app.add_exception_handler(
+        RequestValidationError,
+        validation_exception_handler,  # type: ignore
+    )
+    app.add_exception_handler(
+        ValidationError,
+        validation_exception_handler,  # type: ignore
+    )
+
+
+def include_routers(app: FastAPI) -> None:
+    """Build admin routers on first application and include all routers."""
+    admin_router_initializers = (
+        admin_user_router_initializer,
+        admin_post_router_initializer,
+        admin_like_router_initializer,
+    )
+    for router_initializer in admin_router_initializers:
+        router_initializer.initialize_routers()
+    routers = (
+        admin_user_router_initializer.router,
+        users_router,
+        authorization_router,
+        admin_post_router_initializer.router,
+        posts_router,
+        admin_like_router_initializer.router,
+        likes_router,
+        monitoring_router,
+    )
+    for router in routers:
+        app.include_router(router)
+
+
+def create_app() -> FastAPI:
+    """Create application, its database engines are created by lifespan.
+
+    OpenAPI schema and docs are served from cache, if they are enabled, the
+    cache is loaded from artifact or warmed in background on startup.
+    Application creation and lifespan startup durations are kept in
+    'startup_timings' of application state and logged on startup.
+    Requests to routes, limited by RATE_LIMITS, are rate limited.
+    """
+    started_at = perf_counter()
+    if Settings.DEBUG:
+        printer = pprint.PrettyPrinter()
+        printer.pprint(Settings.dict())
+    app = FastAPI(
+        openapi_tags=metadata,
+        openapi_url=None,
+        docs_url=None,
+        redoc_url=None,
+        lifespan=lifespan,
+        dependencies=[Depends(rate_limiter)],
+    )
+    app.state.openapi_cache = OpenAPICache(app, Settings.OPENAPI_SCHEMA_DIR)
+    add_middlewares(app)
+    add_exception_handlers(app)
+    include_routers(app)
+    if Settings.ENABLE_OPENAPI:
+        app.include_router(openapi_router)
+    app.state.startup_timings = {'create_app': perf_counter() - started_at}
+    return app
 
 
-app.include_router(users_router)
-app.include_router(authorization_router)
-app.include_router(posts_router)
-app.include_router(likes_router)
+app = create_app()
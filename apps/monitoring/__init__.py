@@ -0,0 +1 @@
+"""Init module for monitoring apps."""
@@ -0,0 +1,37 @@
+"""Monitoring apps metrics primitives."""
+from bisect import bisect_left
+from itertools import accumulate
+
+from typing_extensions import Sequence
+
+
+class Histogram(object):
+    """Histogram with fixed buckets upper bounds."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initialize class instance."""
+        self.buckets = tuple(sorted(buckets))
+        self.count = 0
+        self.total: float = 0
+        self._bucket_counts = [0 for _ in range(len(self.buckets) + 1)]
+
+    def observe(self, observed_value: float) -> None:
+        """Add observed value to histogram."""
+        self._bucket_counts[bisect_left(self.buckets, observed_value)] += 1
+        self.count += 1
+        self.total += observed_value
+
+    def get_cumulative_counts(self) -> list[tuple[float, int]]:
+        """Get cumulative counts per finite bucket upper bound."""
+        return list(zip(self.buckets, accumulate(self._bucket_counts)))
+
+    def get_snapshot(self) -> dict:
+        """Get cumulative buckets, observations count and sum."""
+        return {
+            'buckets': [
+                {'upper_bound': upper_bound, 'count': bucket_count}
+                for upper_bound, bucket_count in self.get_cumulative_counts()
+            ],
+            'count': self.count,
+            'total': self.total,
+        }
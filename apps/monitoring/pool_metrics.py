@@ -0,0 +1,70 @@
+"""Database connection pool metrics."""
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+from typing_extensions import Any, Optional
+
+from apps.monitoring.metrics import Histogram
+
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+
+class PoolMetrics(object):
+    """Connection pool state, counters and checkout wait time histogram."""
+
+    def __init__(self) -> None:
+        """Initialize class instance."""
+        self.connects = 0
+        self.invalidations = 0
+        self.checkout_timeouts = 0
+        self.checkout_wait = Histogram(CHECKOUT_WAIT_BUCKETS)
+        self._pool: Optional[Pool] = None
+
+    def register(self, pool: Pool) -> None:
+        """Listen pool events."""
+        self._pool = pool
+        event.listen(pool, 'connect', self._on_connect)
+        event.listen(pool, 'invalidate', self._on_invalidate)
+        event.listen(pool, 'soft_invalidate', self._on_invalidate)
+
+    def get_snapshot(self) -> dict:
+        """Get current pool metrics."""
+        pool: Any = self._pool
+        return {
+            'size': pool.size() if pool else 0,
+            'checked_in': pool.checkedin() if pool else 0,
+            'checked_out': pool.checkedout() if pool else 0,
+            'overflow': max(pool.overflow(), 0) if pool else 0,
+            'connects': self.connects,
+            'invalidations': self.invalidations,
+            'checkout_timeouts': self.checkout_timeouts,
+            'checkout_wait': self.checkout_wait.get_snapshot(),
+        }
+
+    def _on_connect(self, *args: Any) -> None:
+        """Count new DBAPI connections."""
+        self.connects += 1
+
+    def _on_invalidate(self, *args: Any) -> None:
+        """Count invalidated connections."""
+        self.invalidations += 1
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool, recording time spent waiting for connection."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Get connection from pool and record checkout wait time."""
+        started_at = perf_counter()
+        try:
+            connection_entry = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.checkout_timeouts += 1
+            raise
+        pool_metrics.checkout_wait.observe(perf_counter() - started_at)
+        return connection_entry
@@ -0,0 +1,221 @@
+"""SQL queries metrics of requests by route name and slow queries log."""
+import logging
+from contextvars import ContextVar
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing_extensions import Any, Optional
+
+from apps.monitoring.route_metrics import get_route_name
+from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+QUERY_STARTED_AT_KEY = 'query_started_at'
+BACKGROUND_ROUTE_NAME = 'background'
+
+
+class QueryLimitExceededError(AssertionError):
+    """Request issued more queries, than allowed in debug assertion mode."""
+
+
+class RequestQueries(object):
+    """Count, total time and slowest statement of queries, issued by request."""
+
+    __slots__ = ('scope', 'count', 'total_time', 'slowest_time', 'slowest_statement')
+
+    def __init__(self, scope: Scope) -> None:
+        """Initialize class instance."""
+        self.scope = scope
+        self.count = 0
+        self.total_time: float = 0
+        self.slowest_time: float = 0
+        self.slowest_statement: Optional[str] = None
+
+    def add(self, statement: str, duration: float) -> None:
+        """Add executed statement and its duration."""
+        self.count += 1
+        self.total_time += duration
+        if duration > self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    def get_server_timing(self) -> str:
+        """Get Server-Timing header value with queries time in milliseconds."""
+        return 'db;dur={duration:.1f};desc="{count} queries"'.format(
+            duration=self.total_time * 1e3,
+            count=self.count,
+        )
+
+
+request_queries: ContextVar[Optional[RequestQueries]] = ContextVar(
+    'request_queries',
+    default=None,
+)
+
+
+class QueryMetrics(object):
+    """Queries counters by route name, slow queries log and queries limit.
+
+    Cursor events are fired inside greenlets, which share context with awaiting
+    task, so queries are attributed to request through context variable.
+    Queries, issued outside of requests, like background tasks ones, are only
+    checked for slowness.
+    """
+
+    def __init__(self, slow_query_threshold: float, max_request_queries: int) -> None:
+        """Initialize class instance.
+
+        Slow queries are not logged, if threshold is not positive, queries count
+        per request is not limited, if maximum is not positive.
+        """
+        self.slow_query_threshold = slow_query_threshold
+        self.max_request_queries = max_request_queries
+        self.queries: dict[str, int] = {}
+        self.durations: dict[str, float] = {}
+
+    def register(self, engine: Engine) -> None:
+        """Listen engine cursor events."""
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def observe_request(self, queries: RequestQueries) -> None:
+        """Add queries of finished request to counters of its route."""
+        route_name = get_route_name(queries.scope)
+        self.queries[route_name] = self.queries.get(route_name, 0) + queries.count
+        self.durations[route_name] = (
+            self.durations.get(route_name, 0) + queries.total_time
+        )
+        if queries.count and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                '{route} route issued {count} queries in {total:.1f} ms, '.format(
+                    route=route_name,
+                    count=queries.count,
+                    total=queries.total_time * 1e3,
+                )
+                + 'slowest in {slowest:.1f} ms: {statement}'.format(
+                    slowest=queries.slowest_time * 1e3,
+                    statement=queries.slowest_statement,
+                ),
+            )
+
+    def render(self) -> str:
+        """Render queries counters in Prometheus text exposition format."""
+        lines = [
+            '# HELP db_queries_total Queries issued by route.',
+            '# TYPE db_queries_total counter',
+        ]
+        lines.extend(
+            'db_queries_total{{route="{route}"}} {count}'.format(
+                route=route_name,
+                count=queries_count,
+            )
+            for route_name, queries_count in sorted(self.queries.items())
+        )
+        lines.extend(
+            [
+                '# HELP db_query_duration_seconds_total Queries time by route.',
+                '# TYPE db_query_duration_seconds_total counter',
+            ],
+        )
+        lines.extend(
+            'db_query_duration_seconds_total{{route="{route}"}} {total}'.format(
+                route=duration_route,
+                total=float(duration),
+            )
+            for duration_route, duration in sorted(self.durations.items())
+        )
+        return '{metrics}\n'.format(metrics='\n'.join(lines))
+
+    def _before_cursor_execute(self, conn: Connection, *args: Any) -> None:
+        """Remember query start time on connection."""
+        conn.info[QUERY_STARTED_AT_KEY] = perf_counter()
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        *args: Any,
+    ) -> None:
+        """Add query to current request queries and log it, if it is slow.
+
+        Raises QueryLimitExceededError, if request exceeds maximum queries
+        count, so N+1 queries fail loudly in debug assertion mode.
+        """
+        duration = perf_counter() - conn.info[QUERY_STARTED_AT_KEY]
+        queries = request_queries.get()
+        if queries is not None:
+            queries.add(statement, duration)
+            if 0 < self.max_request_queries < queries.count:
+                raise QueryLimitExceededError(
+                    '{route} route issued more than {limit} queries'.format(
+                        route=get_route_name(queries.scope),
+                        limit=self.max_request_queries,
+                    ),
+                )
+        if 0 < self.slow_query_threshold <= duration:
+            logger.warning(
+                'Slow query on {route} route took {duration:.1f} ms: {sql}'.format(
+                    route=(
+                        get_route_name(queries.scope)
+                        if queries
+                        else BACKGROUND_ROUTE_NAME
+                    ),
+                    duration=duration * 1e3,
+                    sql=statement,
+                ),
+            )
+
+
+query_metrics = QueryMetrics(
+    slow_query_threshold=Settings.SLOW_QUERY_THRESHOLD,
+    max_request_queries=Settings.MAX_REQUEST_QUERIES,
+)
+
+
+class ServerTimingSend(object):
+    """ASGI send callable, adding request queries time to response headers."""
+
+    __slots__ = ('send', 'queries')
+
+    def __init__(self, send: Send, queries: RequestQueries) -> None:
+        """Initialize class instance."""
+        self.send = send
+        self.queries = queries
+
+    async def __call__(self, message: Message) -> None:
+        """Add Server-Timing header to response start and send message."""
+        if message['type'] == 'http.response.start':
+            MutableHeaders(scope=message).append(
+                'Server-Timing',
+                self.queries.get_server_timing(),
+            )
+        await self.send(message)
+
+
+class QueryMetricsMiddleware(object):
+    """ASGI middleware, collecting SQL queries metrics of HTTP requests."""
+
+    def __init__(self, app: ASGIApp, server_timing: bool = False) -> None:
+        """Initialize class instance."""
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle request with its queries attributed to it."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        queries = RequestQueries(scope)
+        token = request_queries.set(queries)
+        if self.server_timing:
+            send = ServerTimingSend(send, queries)
+        try:  # noqa: WPS501
+            await self.app(scope, receive, send)
+        finally:
+            request_queries.reset(token)
+            query_metrics.observe_request(queries)
@@ -0,0 +1,175 @@
+"""HTTP requests metrics by route name and middleware recording them."""
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from apps.monitoring.metrics import Histogram
+
+REQUEST_DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+UNMATCHED_ROUTE_NAME = 'unmatched'
+PROMETHEUS_MEDIA_TYPE = 'text/plain; version=0.0.4'
+
+
+class RouteMetrics(object):
+    """Requests latency histograms and responses counters by route name.
+
+    Route names are assigned in code, so labels cardinality is bounded, requests,
+    not matched by any route, are labelled as unmatched.
+    """
+
+    def __init__(self) -> None:
+        """Initialize class instance."""
+        self.in_flight = 0
+        self.durations: dict[str, Histogram] = {}
+        self.responses: dict[tuple[str, int], int] = {}
+
+    def observe(self, route_name: str, status_code: int, duration: float) -> None:
+        """Record duration and status code of request, handled by route."""
+        histogram = self.durations.get(route_name)
+        if histogram is None:
+            histogram = Histogram(REQUEST_DURATION_BUCKETS)
+            self.durations[route_name] = histogram
+        histogram.observe(duration)
+        response_key = (route_name, status_code)
+        self.responses[response_key] = self.responses.get(response_key, 0) + 1
+
+    def render(self) -> str:
+        """Render metrics in Prometheus text exposition format."""
+        lines = [
+            '# HELP http_request_duration_seconds Requests latency by route.',
+            '# TYPE http_request_duration_seconds histogram',
+        ]
+        for histogram_route, histogram in sorted(self.durations.items()):
+            lines.extend(self._render_histogram(histogram_route, histogram))
+        lines.extend(
+            [
+                '# HELP http_requests_in_flight Requests being handled.',
+                '# TYPE http_requests_in_flight gauge',
+                'http_requests_in_flight {count}'.format(count=self.in_flight),
+                '# HELP http_responses_total Responses by route and status code.',
+                '# TYPE http_responses_total counter',
+            ],
+        )
+        lines.extend(self._render_responses())
+        return '{metrics}\n'.format(metrics='\n'.join(lines))
+
+    def _render_responses(self) -> list[str]:
+        """Render responses counters by route and status code."""
+        return [
+            'http_responses_total{{route="{route}",status="{status}"}} {count}'.format(
+                route=route_name,
+                status=status_code,
+                count=responses_count,
+            )
+            for (route_name, status_code), responses_count in sorted(
+                self.responses.items(),
+            )
+        ]
+
+    def _render_histogram(self, route_name: str, histogram: Histogram) -> list[str]:
+        """Render cumulative buckets, sum and count of route latency histogram."""
+        route_label = 'route="{route}"'.format(route=route_name)
+        cumulative_counts = [
+            ('{bound}'.format(bound=float(upper_bound)), bucket_count)
+            for upper_bound, bucket_count in histogram.get_cumulative_counts()
+        ]
+        cumulative_counts.append(('+Inf', histogram.count))
+        lines = [
+            'http_request_duration_seconds_bucket{{{route},le="{le}"}} {count}'.format(
+                route=route_label,
+                le=upper_bound,
+                count=bucket_count,
+            )
+            for upper_bound, bucket_count in cumulative_counts
+        ]
+        lines.append(
+            'http_request_duration_seconds_sum{{{route}}} {total}'.format(
+                route=route_label,
+                total=float(histogram.total),
+            ),
+        )
+        lines.append(
+            'http_request_duration_seconds_count{{{route}}} {count}'.format(
+                route=route_label,
+                count=histogram.count,
+            ),
+        )
+        return lines
+
+
+route_metrics = RouteMetrics()
+
+
+def get_route_name(scope: Scope) -> str:
+    """Get name of route, matched by router, or unmatched route name.
+
+    API routes are set in scope, other routes, like OpenAPI docs ones, set only
+    endpoint, named as route by default.
+    """
+    route = scope.get('route')
+    if route is not None:
+        return route.name
+    return getattr(scope.get('endpoint'), '__name__', UNMATCHED_ROUTE_NAME)
+
+
+class StatusRecordingSend(object):
+    """ASGI send callable, remembering status code of response.
+
+    Status code is 500, if response is not started, since then exception is
+    propagated to server error middleware.
+    """
+
+    __slots__ = ('send', 'status_code')
+
+    def __init__(self, send: Send) -> None:
+        """Initialize class instance."""
+        self.send = send
+        self.status_code = 500
+
+    async def __call__(self, message: Message) -> None:
+        """Remember response status code and send message."""
+        if message['type'] == 'http.response.start':
+            self.status_code = message['status']
+        await self.send(message)
+
+
+class RouteMetricsMiddleware(object):
+    """ASGI middleware, recording HTTP requests metrics by route name.
+
+    Route is set in request scope by router while matching, so its name is read
+    after request is handled.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize class instance."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle request and record its duration, status code and route."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        recording_send = StatusRecordingSend(send)
+        route_metrics.in_flight += 1
+        started_at = perf_counter()
+        try:  # noqa: WPS501
+            await self.app(scope, receive, recording_send)
+        finally:
+            route_metrics.in_flight -= 1
+            route_metrics.observe(
+                get_route_name(scope),
+                recording_send.status_code,
+                perf_counter() - started_at,
+            )
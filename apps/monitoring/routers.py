@@ -0,0 +1,113 @@
+"""Monitoring apps routers."""
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
+from typing_extensions import Annotated, Any
+
+from apps.common.common_utilities import token_cache
+from apps.common.schemas import JSENDErrorOutSchema, JSENDFailOutSchema, JSENDOutSchema
+from apps.common.user_dependencies import get_current_admin_user, user_cache
+from apps.monitoring.pool_metrics import pool_metrics
+from apps.monitoring.query_metrics import query_metrics
+from apps.monitoring.route_metrics import PROMETHEUS_MEDIA_TYPE, route_metrics
+from apps.monitoring.schemas import (
+    CachesStatsOut,
+    PoolMetricsOut,
+    UserActivityBufferOut,
+)
+from apps.user.activity import user_activity_buffer
+from apps.user.models import User
+
+monitoring_router = APIRouter()
+admin_responses: dict[int | str, dict[str, Any]] = {
+    401: {'description': 'Not authenticated.', 'model': JSENDFailOutSchema},
+    403: {
+        'description': 'User is not an admin user.',
+        'model': JSENDFailOutSchema,
+    },
+    500: {'description': 'Internal server error.', 'model': JSENDErrorOutSchema},
+}
+
+
+@monitoring_router.get(
+    '/admin/monitoring/pool/',
+    name='read_pool_metrics',
+    response_model=JSENDOutSchema[PoolMetricsOut],
+    summary='Get database connection pool metrics by admin',
+    responses={
+        200: {'description': 'Successful get pool metrics response'},
+        **admin_responses,
+    },
+    tags=['Monitoring application'],
+)
+async def read_pool_metrics(
+    request: Request,
+    user: Annotated[User, Depends(get_current_admin_user)],
+) -> dict:
+    """Get database connection pool metrics."""
+    return {
+        'data': pool_metrics.get_snapshot(),
+        'message': 'Got database connection pool metrics',
+    }
+
+
+@monitoring_router.get(
+    '/admin/monitoring/caches/',
+    name='read_caches_stats',
+    response_model=JSENDOutSchema[CachesStatsOut],
+    summary='Get in-process caches statistics by admin',
+    responses={
+        200: {'description': 'Successful get caches statistics response'},
+        **admin_responses,
+    },
+    tags=['Monitoring application'],
+)
+async def read_caches_stats(
+    request: Request,
+    user: Annotated[User, Depends(get_current_admin_user)],
+) -> dict:
+    """Get in-process caches statistics of current process."""
+    return {
+        'data': {
+            'user': user_cache.get_stats(),
+            'token': token_cache.get_stats(),
+        },
+        'message': 'Got in-process caches statistics',
+    }
+
+
+@monitoring_router.get(
+    '/admin/monitoring/user-activity/',
+    name='read_user_activity_buffer_stats',
+    response_model=JSENDOutSchema[UserActivityBufferOut],
+    summary='Get user activity write-behind buffer statistics by admin',
+    responses={
+        200: {'description': 'Successful get user activity buffer response'},
+        **admin_responses,
+    },
+    tags=['Monitoring application'],
+)
+async def read_user_activity_buffer_stats(
+    request: Request,
+    user: Annotated[User, Depends(get_current_admin_user)],
+) -> dict:
+    """Get user activity write-behind buffer statistics of current process."""
+    return {
+        'data': user_activity_buffer.get_stats(),
+        'message': 'Got user activity buffer statistics',
+    }
+
+
+@monitoring_router.get(
+    '/metrics',
+    name='read_metrics',
+    response_class=PlainTextResponse,
+    summary='Get HTTP requests and queries metrics in Prometheus text format',
+    responses={200: {'description': 'Successful get metrics response'}},
+    tags=['Monitoring application'],
+)
+async def read_metrics(request: Request) -> PlainTextResponse:
+    """Get requests and queries metrics of current process for Prometheus."""
+    return PlainTextResponse(
+        route_metrics.render() + query_metrics.render(),
+        media_type=PROMETHEUS_MEDIA_TYPE,
+    )
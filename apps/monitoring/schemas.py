@@ -0,0 +1,103 @@
+"""Monitoring apps schemas."""
+from pydantic import Field
+from typing_extensions import Annotated
+
+from apps.common.schemas import BaseOutSchema
+
+
+class HistogramBucketOut(BaseOutSchema):
+    """Histogram bucket out schema."""
+
+    upper_bound: Annotated[
+        float,
+        Field(description='Bucket upper bound, in seconds', examples=[0.01]),
+    ]
+    count: Annotated[
+        int,
+        Field(description='Observations less or equal to upper bound', examples=[7]),
+    ]
+
+
+class HistogramOut(BaseOutSchema):
+    """Histogram out schema."""
+
+    buckets: Annotated[
+        list[HistogramBucketOut],
+        Field(description='Cumulative histogram buckets'),
+    ]
+    count: Annotated[int, Field(description='Observations count', examples=[10])]
+    total: Annotated[
+        float,
+        Field(description='Observations sum, in seconds', examples=[0.1]),
+    ]
+
+
+class PoolMetricsOut(BaseOutSchema):
+    """Database connection pool metrics out schema."""
+
+    size: Annotated[int, Field(description='Pool size', examples=[5])]
+    checked_in: Annotated[
+        int,
+        Field(description='Idle connections in pool', examples=[4]),
+    ]
+    checked_out: Annotated[
+        int,
+        Field(description='Connections in use', examples=[1]),
+    ]
+    overflow: Annotated[
+        int,
+        Field(description='Connections opened over pool size', examples=[0]),
+    ]
+    connects: Annotated[
+        int,
+        Field(description='New connections opened', examples=[5]),
+    ]
+    invalidations: Annotated[
+        int,
+        Field(description='Connections invalidated', examples=[0]),
+    ]
+    checkout_timeouts: Annotated[
+        int,
+        Field(description='Connection checkouts timed out', examples=[0]),
+    ]
+    checkout_wait: Annotated[
+        HistogramOut,
+        Field(description='Time spent waiting for connection checkout'),
+    ]
+
+
+class CacheStatsOut(BaseOutSchema):
+    """In-process cache statistics out schema."""
+
+    size: Annotated[int, Field(description='Cached entries', examples=[10])]
+    max_size: Annotated[int, Field(description='Max cached entries', examples=[1024])]
+    hits: Annotated[int, Field(description='Cache hits', examples=[990])]
+    misses: Annotated[int, Field(description='Cache misses', examples=[10])]
+
+
+class CachesStatsOut(BaseOutSchema):
+    """Project in-process caches statistics out schema."""
+
+    user: Annotated[
+        CacheStatsOut,
+        Field(description='Authenticated users cache statistics'),
+    ]
+    token: Annotated[
+        CacheStatsOut,
+        Field(description='Verified JWT data cache statistics'),
+    ]
+
+
+class UserActivityBufferOut(BaseOutSchema):
+    """User activity write-behind buffer statistics out schema."""
+
+    size: Annotated[
+        int,
+        Field(description='Users with not written activity times', examples=[10]),
+    ]
+    flushes: Annotated[int, Field(description='Successful flushes', examples=[60])]
+    failed_flushes: Annotated[int, Field(description='Failed flushes', examples=[0])]
+    flush_latency: Annotated[
+        HistogramOut,
+        Field(description='Time spent writing buffer to database'),
+    ]
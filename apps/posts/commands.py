@@ -0,0 +1,52 @@
+"""Posts apps commands.
+
+Run ``python -m apps.posts.commands --chunk-size 1000`` to rebuild posts
+like and dislike counters from likes table.
+"""
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import func, select
+
+from apps.common.db import async_session_factory
+from apps.posts.models import Post
+from apps.posts.statements import post_crud_statements
+
+
+async def reconcile_like_counters(chunk_size: int) -> int:
+    """Rebuild posts like counters by id ranges, range per transaction.
+
+    Likes, written concurrently with range rebuilding, may be miscounted,
+    so it is better to run it when likes are not written heavily.
+    """
+    async with async_session_factory() as session:
+        last_id = await session.scalar(
+            select(func.max(Post.id)),
+            bind_arguments={'for_write': True},
+        )
+        for first_id in range(1, (last_id or 0) + 1, chunk_size):
+            await session.execute(
+                post_crud_statements.reconcile_counters_statement(
+                    first_id,
+                    first_id + chunk_size - 1,
+                ),
+            )
+            await session.commit()
+    return last_id or 0
+
+
+def main() -> None:
+    """Parse arguments and rebuild like counters."""
+    parser = argparse.ArgumentParser(
+        description='Rebuild posts like and dislike counters.',
+    )
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    last_id = asyncio.run(reconcile_like_counters(parser.parse_args().chunk_size))
+    sys.stdout.write(
+        'Rebuilt like counters of posts up to id {id}\n'.format(id=last_id),
+    )
+
+
+if __name__ == '__main__':
+    main()
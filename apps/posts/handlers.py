@@ -1,11 +1,13 @@
 """Posts apps handlers."""
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Sequence
+from typing_extensions import Optional, Sequence
 
+from apps.common.base_statements import BoundStatement
 from apps.common.common_utilities import checkers
 from apps.common.orm_services import statement_executor as executor
-from apps.posts.models import Post
+from apps.common.pagination import decode_time_cursor, get_page
+from apps.common.schemas import PaginationIn
 from apps.posts.schemas import CreatePostIn, CreatePostOut
 from apps.posts.statements import post_crud_statements
 from apps.user.models import User
@@ -22,19 +24,39 @@ class PostHandlers(object):
         session: AsyncSession,
     ) -> CreatePostOut:
         """Create post."""
-        statement: str = post_crud_statements.create_statement(
+        statement: BoundStatement = post_crud_statements.create_statement(
             schema=post,
             obj_data={'user_id': user.id},
+            core=True,
         )
-        created_post: Post | Sequence[
-            Post | None
-        ] | None = await executor.execute_return_statement(
+        created_post: CreatePostOut | None = await executor.execute_return_schema(
             session,
             statement,
+            CreatePostOut,
             commit=True,
         )
-        checked_post: Post = checkers.check_created_instance(created_post, 'Post')
-        return CreatePostOut.model_validate(checked_post)
+        return checkers.check_created_instance(created_post, 'Post')
+
+    async def read_user_posts(
+        self,
+        request: Request,
+        user_id: int,
+        pagination: PaginationIn,
+        session: AsyncSession,
+    ) -> tuple[Sequence[CreatePostOut], Optional[str]]:
+        """Read page of user posts, newest first, and next page cursor."""
+        statement: BoundStatement = post_crud_statements.children_page_statement(
+            parent_key='user_id',
+            parent_id=user_id,
+            limit=pagination.limit + 1,
+            after=decode_time_cursor(pagination.after) if pagination.after else None,
+        )
+        posts = await executor.execute_return_schemas(
+            session,
+            statement,
+            CreatePostOut,
+        )
+        return get_page(posts, pagination.limit, by_time=True)
 
 
 post_handlers = PostHandlers()
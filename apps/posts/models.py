@@ -1,5 +1,5 @@
 """Models for posts apps."""
-from sqlalchemy import Column, ForeignKey, Integer, String, func
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from apps.common.common_utilities import AwareDateTime
@@ -25,6 +25,16 @@ class Post(Base):
         ForeignKey('user.id', ondelete='CASCADE', onupdate='CASCADE'),
         nullable=False,
     )
+    like_count = Column(Integer, default=0, server_default='0', nullable=False)
+    dislike_count = Column(Integer, default=0, server_default='0', nullable=False)
+    __table_args__ = (
+        Index(
+            'post_user_id_created_at_id_idx',
+            user_id,
+            created_at.desc(),
+            id.desc(),
+        ),
+    )
     user = relationship('User', back_populates='posts')
     likes = relationship('Like', back_populates='post')
 
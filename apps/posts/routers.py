@@ -1,11 +1,17 @@
 """Posts apps routers."""
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Annotated
+from typing_extensions import Annotated, Sequence
 
 from apps.common.base_routers import BaseRouterInitializer
 from apps.common.dependencies import get_async_session
-from apps.common.schemas import JSENDFailOutSchema, JSENDOutSchema
+from apps.common.responses import JSENDResponse
+from apps.common.schemas import (
+    JSENDFailOutSchema,
+    JSENDOutSchema,
+    JSENDPageOutSchema,
+    PaginationIn,
+)
 from apps.common.user_dependencies import get_current_user
 from apps.posts.handlers import post_handlers
 from apps.posts.models import Post
@@ -15,20 +21,21 @@ from apps.posts.schemas import (
     CreatePostIn,
     CreatePostOut,
 )
+from apps.posts.statements import post_crud_statements
 from apps.user.models import User
 
 posts_router = APIRouter()
+admin_posts_router = APIRouter()
 
 
 admin_post_router_initializer = BaseRouterInitializer(  # type: ignore
-    router=posts_router,
+    router=admin_posts_router,
     in_schemas=(AdminCreatePostIn, AdminCreatePostIn, AdminPartiallyUpdatePostIn),
     out_schema=CreatePostOut,
     model=Post,
+    statements=post_crud_statements,
 )
 
-admin_post_router_initializer.initialize_routers()
-
 
 @posts_router.post(
     '/post/',
@@ -46,7 +53,7 @@ async def create_post(
     post: Annotated[CreatePostIn, Depends()],
     user: Annotated[User, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> dict:
+) -> JSENDResponse:
     """Create post router."""
     created_post: CreatePostOut = await post_handlers.create_post(
         request,
@@ -54,7 +61,47 @@ async def create_post(
         user,
         session,
     )
-    return {
-        'data': created_post,
-        'message': 'Created post with id {id}'.format(id=created_post.id),
-    }
+    return JSENDResponse(
+        {
+            'data': created_post,
+            'message': 'Created post with id {id}'.format(id=created_post.id),
+        },
+    )
+
+
+@posts_router.get(
+    '/user/{user_id}/posts/',
+    name='read_user_posts',
+    response_model=JSENDPageOutSchema[Sequence[CreatePostOut]],  # type: ignore
+    summary='Get user posts',
+    responses={
+        200: {'description': 'Successful get user posts response'},
+        400: {'model': JSENDFailOutSchema, 'description': 'Invalid pagination cursor.'},
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Posts application'],
+)
+async def read_user_posts(
+    request: Request,
+    user_id: int,
+    pagination: Annotated[PaginationIn, Depends()],
+    user: Annotated[User, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> JSENDResponse:
+    """**Get user posts page**, newest first.
+
+    Next page is requested with "next_cursor" of the page as "after".
+    """
+    posts, next_cursor = await post_handlers.read_user_posts(
+        request,
+        user_id,
+        pagination,
+        session,
+    )
+    return JSENDResponse(
+        {
+            'data': posts,
+            'message': 'Got posts of user with id {id}'.format(id=user_id),
+            'next_cursor': next_cursor,
+        },
+    )
@@ -40,3 +40,5 @@ class CreatePostOut(BaseOutSchema):
     created_at: Annotated[datetime, Field(description='Post created at')]
     updated_at: Annotated[datetime, Field(description='Post updated at')]
     user_id: Annotated[int, Field(description='Post created user id')]
+    like_count: Annotated[int, Field(description='Post likes count')]
+    dislike_count: Annotated[int, Field(description='Post dislikes count')]
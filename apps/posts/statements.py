@@ -1,5 +1,40 @@
 """Posts apps query statements."""
+from sqlalchemy import func, not_, select, update
+from sqlalchemy.sql import ColumnElement, Executable
+from sqlalchemy.sql.selectable import ScalarSelect
+
 from apps.common.base_statements import BaseCRUDStatements
+from apps.likes.models import Like
 from apps.posts.models import Post
 
-post_crud_statements = BaseCRUDStatements(model=Post)
+
+class PostCRUDStatements(BaseCRUDStatements):
+    """Post CRUD statements.
+
+    Like counters are changed without update time, so they are versions too.
+    """
+
+    version_keys = ('updated_at', 'like_count', 'dislike_count')
+
+    def reconcile_counters_statement(self, first_id: int, last_id: int) -> Executable:
+        """Create statement rebuilding like counters of posts in id range."""
+        return (
+            update(self.table)
+            .where(self.table.c.id.between(first_id, last_id))
+            .values(
+                like_count=self._get_likes_count(Like.__table__.c.eval),
+                dislike_count=self._get_likes_count(not_(Like.__table__.c.eval)),
+                updated_at=self.table.c.updated_at,
+            )
+        )
+
+    def _get_likes_count(self, condition: ColumnElement) -> ScalarSelect:
+        """Get post likes count subquery with given condition."""
+        return (
+            select(func.count())
+            .where(Like.__table__.c.post_id == self.table.c.id, condition)
+            .scalar_subquery()
+        )
+
+
+post_crud_statements = PostCRUDStatements(model=Post)
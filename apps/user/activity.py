@@ -0,0 +1,121 @@
+"""User apps activity times write-behind buffer."""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from time import perf_counter
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from apps.common.db import async_session_factory
+from apps.monitoring.metrics import Histogram
+from apps.user.statements import ActivityRow, user_crud_statements
+
+logger = logging.getLogger(__name__)
+FLUSH_CHUNK_SIZE = 5000
+FLUSH_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+
+class UserActivityBuffer(object):
+    """Latest request and visit times of users, written to database in batches.
+
+    Times are kept in process memory till flush, so times recorded after the
+    last flush of killed process are lost.
+    """
+
+    def __init__(self) -> None:
+        """Initialize class instance."""
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.flush_latency = Histogram(FLUSH_LATENCY_BUCKETS)
+        self._request_times: dict[int, datetime] = {}
+        self._visit_times: dict[int, datetime] = {}
+
+    def record_request(self, user_id: int) -> None:
+        """Record authenticated request of user at current time."""
+        self._request_times[user_id] = datetime.now(timezone.utc)
+
+    def record_visit(self, user_id: int) -> None:
+        """Record visit, that is login, of user at current time."""
+        self._visit_times[user_id] = datetime.now(timezone.utc)
+
+    def get_stats(self) -> dict:
+        """Get buffer size and flushes statistics."""
+        return {
+            'size': len(self._request_times.keys() | self._visit_times.keys()),
+            'flushes': self.flushes,
+            'failed_flushes': self.failed_flushes,
+            'flush_latency': self.flush_latency.get_snapshot(),
+        }
+
+    async def flush(self) -> int:
+        """Write recorded times to database, return count of written users.
+
+        Times are taken out of buffer before writing, so times recorded during
+        flush go to the next one. Times of failed flush are put back.
+        """
+        request_times = self._request_times
+        visit_times = self._visit_times
+        self._request_times = {}
+        self._visit_times = {}
+        activity_rows = [
+            (user_id, request_times.get(user_id), visit_times.get(user_id))
+            for user_id in sorted(request_times.keys() | visit_times.keys())
+        ]
+        if not activity_rows:
+            return 0
+        started_at = perf_counter()
+        try:
+            await self._write(activity_rows)
+        except asyncio.CancelledError:
+            self._restore(request_times, visit_times)
+            raise
+        except (SQLAlchemyError, OSError):
+            self.failed_flushes += 1
+            self._restore(request_times, visit_times)
+            raise
+        self.flushes += 1
+        self.flush_latency.observe(perf_counter() - started_at)
+        return len(activity_rows)
+
+    async def _write(self, activity_rows: list[ActivityRow]) -> None:
+        """Update users times in chunks, in one transaction.
+
+        Rows are sorted by user id, so concurrent flushes of several processes
+        lock users rows in the same order.
+        """
+        async with async_session_factory() as session:
+            for chunk_start in range(0, len(activity_rows), FLUSH_CHUNK_SIZE):
+                chunk_end = chunk_start + FLUSH_CHUNK_SIZE
+                await session.execute(
+                    user_crud_statements.update_activity_statement(
+                        activity_rows[chunk_start:chunk_end],
+                    ),
+                )
+            await session.commit()
+
+    def _restore(
+        self,
+        request_times: dict[int, datetime],
+        visit_times: dict[int, datetime],
+    ) -> None:
+        """Put not written times back, keeping times recorded meanwhile."""
+        self._request_times = {**request_times, **self._request_times}
+        self._visit_times = {**visit_times, **self._visit_times}
+
+
+user_activity_buffer = UserActivityBuffer()
+
+
+async def flush_user_activity() -> None:
+    """Flush user activity buffer, logging failure."""
+    try:
+        await user_activity_buffer.flush()
+    except (SQLAlchemyError, OSError):
+        logger.exception('User activity flush failed')
+
+
+async def run_user_activity_flushes(interval: float) -> None:
+    """Flush user activity buffer periodically."""
+    while True:  # noqa: WPS457
+        await asyncio.sleep(interval)
+        await flush_user_activity()
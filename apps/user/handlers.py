@@ -1,11 +1,10 @@
 """User apps handlers."""
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Sequence
 
+from apps.common.base_statements import BoundStatement
 from apps.common.common_utilities import checkers
 from apps.common.orm_services import statement_executor as executor
-from apps.user.models import User
 from apps.user.schemas import CreateUserIn, CreateUserOut
 from apps.user.statements import user_crud_statements
 
@@ -20,23 +19,23 @@ class UserHandlers(object):
         session: AsyncSession,
     ) -> CreateUserOut:
         """Create user with given data."""
-        statement: str = user_crud_statements.create_statement(
+        await user.hash_password()
+        statement: BoundStatement = user_crud_statements.create_statement(
             obj_data={
                 'username': user.username,
                 'email': user.email,
                 'password': user.password,
                 'is_active': True,
             },
+            core=True,
         )
-        created_user: User | Sequence[
-            User | None
-        ] | None = await executor.execute_return_statement(
+        created_user: CreateUserOut | None = await executor.execute_return_schema(
             session,
             statement,
+            CreateUserOut,
             commit=True,
         )
-        checked_user: User = checkers.check_created_instance(created_user, 'User')
-        return CreateUserOut.model_validate(checked_user)
+        return checkers.check_created_instance(created_user, 'User')
 
 
 user_handlers = UserHandlers()
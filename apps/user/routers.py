@@ -5,7 +5,9 @@ from typing_extensions import Annotated
 
 from apps.common.base_routers import BaseRouterInitializer
 from apps.common.dependencies import get_async_session
+from apps.common.responses import JSENDResponse
 from apps.common.schemas import JSENDFailOutSchema, JSENDOutSchema
+from apps.common.user_dependencies import invalidate_cached_user
 from apps.user.handlers import user_handlers
 from apps.user.models import User
 from apps.user.schemas import (
@@ -16,18 +18,21 @@ from apps.user.schemas import (
     CreateUserIn,
     CreateUserOut,
 )
+from apps.user.statements import user_crud_statements
 
 users_router = APIRouter()
+admin_users_router = APIRouter()
 
 admin_user_router_initializer = BaseRouterInitializer(  # type: ignore
-    router=users_router,
+    router=admin_users_router,
     in_schemas=(CreateAdminUserIn, AdminUserIn, AdminPartiallyUserIn),
     out_schema=AdminUserOut,
     model=User,
+    on_instance_change=invalidate_cached_user,
+    before_create=CreateUserIn.hash_password,
+    statements=user_crud_statements,
 )
 
-admin_user_router_initializer.initialize_routers()
-
 
 @users_router.post(
     '/user/',
@@ -44,7 +49,7 @@ async def create_user(
     request: Request,
     user: Annotated[CreateUserIn, Depends()],
     session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> dict:
+) -> JSENDResponse:
     """**Create user record**.
 
     **Input**:
@@ -67,7 +72,9 @@ async def create_user(
         user=user,
         session=session,
     )
-    return {
-        'data': created_user,
-        'message': 'Created user with id {id}'.format(id=created_user.id),
-    }
+    return JSENDResponse(
+        {
+            'data': created_user,
+            'message': 'Created user with id {id}'.format(id=created_user.id),
+        },
+    )
@@ -2,10 +2,16 @@
 from datetime import datetime
 from re import fullmatch
 
-from pydantic import Field, computed_field, field_validator, model_validator
-from typing_extensions import Annotated
-
-from apps.authorization.auth_utilities import get_hashed_password
+from pydantic import (
+    Field,
+    PrivateAttr,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+from typing_extensions import Annotated, Optional
+
+from apps.authorization.auth_utilities import password_service
 from apps.authorization.schemas import UserOut
 from apps.common.constants import EMAIL_REGEX
 from apps.common.schemas import BaseInSchema, BaseOutSchema
@@ -38,10 +44,20 @@ class CreateUserIn(BaseInSchema):
         Field(exclude=True, examples=['111'], description='User password recheck'),
     ]
 
+    _hashed_password: Optional[str] = PrivateAttr(default=None)
+
     @computed_field
     def password(self) -> str:
-        """Hash password."""
-        return get_hashed_password(self.password_check)
+        """Get password hash, made with 'hash_password'."""
+        if self._hashed_password is None:
+            raise ValueError('Password is not hashed yet')
+        return self._hashed_password
+
+    async def hash_password(self) -> None:
+        """Hash password in password service worker pool."""
+        self._hashed_password = await password_service.hash_password(
+            self.password_check,
+        )
 
     @field_validator('email')
     @classmethod
@@ -61,6 +77,21 @@ class CreateUserIn(BaseInSchema):
         return self
 
 
+class AuthUserOut(BaseOutSchema):
+    """Authenticated user data, cached between requests."""
+
+    id: Annotated[int, Field(description='User id', examples=[1])]
+    email: Annotated[str, Field(description='User email', examples=['a@a.com'])]
+    is_active: Annotated[
+        bool,
+        Field(description='User "is_active" status', examples=[True]),
+    ]
+    is_admin: Annotated[
+        bool,
+        Field(description='User "is_admin" status', examples=[True]),
+    ]
+
+
 class CreateUserOut(BaseOutSchema):
     """User creation out schema."""
 
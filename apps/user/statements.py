@@ -1,5 +1,50 @@
 """Statements for db data manipulation for user apps."""
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, Integer, Update, cast, column, func, update, values
+from typing_extensions import Optional, TypeAlias
+
 from apps.common.base_statements import BaseCRUDStatements
 from apps.user.models import User
 
-user_crud_statements = BaseCRUDStatements(model=User)
+ActivityRow: TypeAlias = tuple[int, Optional[datetime], Optional[datetime]]
+
+
+class UserCRUDStatements(BaseCRUDStatements):
+    """User CRUD statements."""
+
+    version_keys = ('updated_at', 'last_request_at', 'last_visit_at')
+
+    def update_activity_statement(self, activity_rows: list[ActivityRow]) -> Update:
+        """Create statement setting users last request and visit times.
+
+        Rows are user id, last request and last visit times, missing times are
+        None. Values are cast to type of users times columns, as column of None
+        values only has no type. Aware times are bound as they are, so session
+        time zone does not matter. Times are only moved forward, so statements
+        may run in any order.
+        """
+        activity = values(
+            column('id', Integer),
+            column('last_request_at', TIMESTAMP(timezone=True)),
+            column('last_visit_at', TIMESTAMP(timezone=True)),
+            name='activity',
+        ).data(activity_rows)
+        return (
+            update(self.table)
+            .where(self.table.c.id == activity.c.id)
+            .values(
+                last_request_at=func.greatest(
+                    self.table.c.last_request_at,
+                    cast(activity.c.last_request_at, TIMESTAMP(timezone=True)),
+                ),
+                last_visit_at=func.greatest(
+                    self.table.c.last_visit_at,
+                    cast(activity.c.last_visit_at, TIMESTAMP(timezone=True)),
+                ),
+                updated_at=self.table.c.updated_at,
+            )
+        )
+
+
+user_crud_statements = UserCRUDStatements(model=User)
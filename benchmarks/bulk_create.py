@@ -0,0 +1,117 @@
+"""Benchmark of bulk create endpoint throughput.
+
+Run with ``python -m benchmarks.bulk_create --posts 100000`` against
+disposable migrated database from settings. Admin user is inserted and
+logged in, then posts are created through admin bulk create endpoint with
+COPY and with INSERT ... RETURNING, through httpx ASGI transport with
+application lifespan running. Throughput in rows per second is written for
+every mode, COPY one is expected to be 50k rows per second at least. Admin
+user is deleted with its posts at the end.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from apps.authorization.auth_utilities import get_hashed_password
+from apps.common.db import async_session_factory
+from apps.main import create_app
+from benchmarks.endpoints import PHRASE, get_auth_headers
+
+TARGET_ROWS_PER_SECOND = 50000
+REQUEST_TIMEOUT = 600
+
+INSERT_ADMIN_SQL = """
+    INSERT INTO "user" (username, password, email, is_active, is_admin)
+    VALUES (:username, :password, :username || '@example.com', true, true)
+    RETURNING id
+"""
+
+
+async def execute_sql(sql: str, bind_values: dict) -> int:
+    """Execute statement on primary, commit and get its scalar result."""
+    async with async_session_factory() as session:
+        sql_result = await session.scalar(text(sql), bind_values)
+        await session.commit()
+    return sql_result
+
+
+async def measure_bulk_create(
+    client: AsyncClient,
+    body: bytes,
+    bulk_params: dict,
+) -> float:
+    """Create posts from body by bulk create endpoint, get rows per second."""
+    started_at = time.perf_counter()
+    response = await client.post(
+        '/admin/bulk/post/',
+        content=body,
+        params=bulk_params,
+        headers={'Content-Type': 'application/json'},
+        timeout=REQUEST_TIMEOUT,
+    )
+    elapsed_time = time.perf_counter() - started_at
+    response.raise_for_status()
+    return response.json()['data']['created'] / elapsed_time
+
+
+async def run_benchmark(
+    client: AsyncClient,
+    admin_id: int,
+    arguments: argparse.Namespace,
+) -> None:
+    """Create posts with COPY and with RETURNING, write throughput."""
+    body = json.dumps(
+        [
+            {'message': 'bulk post {index}'.format(index=index), 'user_id': admin_id}
+            for index in range(arguments.posts)
+        ],
+    ).encode()
+    for returning in (False, True):
+        rows_per_second = await measure_bulk_create(
+            client,
+            body,
+            {'chunk_size': arguments.chunk_size, 'returning': returning},
+        )
+        sys.stdout.write(
+            '{mode}: {rows:.0f} rows/s{note}\n'.format(
+                mode='RETURNING' if returning else 'COPY',
+                rows=rows_per_second,
+                note=(
+                    ''
+                    if returning or rows_per_second >= TARGET_ROWS_PER_SECOND
+                    else ', below target'
+                ),
+            ),
+        )
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    """Insert admin, benchmark bulk create and delete admin with posts."""
+    username = 'bulk{stamp}'.format(stamp=int(time.time()))
+    admin_id = await execute_sql(
+        INSERT_ADMIN_SQL,
+        {'username': username, 'password': get_hashed_password(PHRASE)},
+    )
+    app = create_app()
+    try:  # noqa: WPS501
+        async with app.router.lifespan_context(app):
+            async with AsyncClient(
+                transport=ASGITransport(app=app),
+                base_url='http://benchmark',
+            ) as client:
+                client.headers.update(await get_auth_headers(client, username))
+                await run_benchmark(client, admin_id, arguments)
+    finally:
+        await execute_sql('DELETE FROM "user" WHERE id = :id', {'id': admin_id})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Bulk create benchmark.')
+    parser.add_argument('--posts', type=int, default=100000)
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
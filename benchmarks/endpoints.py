@@ -0,0 +1,282 @@
+"""Load benchmark of endpoints through in-process ASGI transport.
+
+Run with ``python -m benchmarks.endpoints --output results.json`` against
+disposable migrated database from settings. Synthetic users, posts and likes
+are seeded and committed, then every endpoint is requested at each
+concurrency level through httpx ASGI transport, with application lifespan
+running. Latency percentiles and throughput per endpoint and concurrency are
+written as JSON, so runs before and after changes can be compared. Run with
+``MAX_REQUEST_QUERIES`` set, to get endpoints issuing more queries, than
+expected, like N+1 ones, failed with errors. Run with ``RATE_LIMITS`` set
+to empty JSON object, as login and like endpoints are requested faster, than
+default limits allow.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timezone
+
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy import text
+from typing_extensions import Awaitable, Callable, Iterator, TypeAlias
+
+from apps.authorization.auth_utilities import get_hashed_password
+from apps.common.db import async_session_factory
+from apps.main import create_app
+
+Scenario: TypeAlias = Callable[[AsyncClient, int], Awaitable[Response]]
+
+USERS_COUNT = 1000
+POSTS_COUNT = 20000
+LIKES_COUNT = 100000
+PHRASE = 'benchmark'
+
+SEED_SQL = """
+    WITH bench_users AS (
+        INSERT INTO "user" (username, password, email, is_active, is_admin)
+        SELECT :prefix || '_' || number, :hashed_phrase,
+            :prefix || '.' || number || '@example.com', true, number = 0
+        FROM generate_series(0, :users_count - 1) AS number
+        RETURNING id
+    ), first_user AS (
+        SELECT min(id) AS id FROM bench_users
+    ), bench_posts AS (
+        INSERT INTO post (message, user_id)
+        SELECT 'benchmark post', first_user.id + number % :users_count
+        FROM first_user, generate_series(0, :posts_count - 1) AS number
+        RETURNING id
+    ), first_post AS (
+        SELECT min(id) AS id FROM bench_posts
+    ), bench_likes AS (
+        INSERT INTO "like" (eval, user_id, post_id)
+        SELECT number % 3 <> 0,
+            first_user.id + number % :users_count,
+            first_post.id + (number / :users_count) % :posts_count
+        FROM first_user, first_post, generate_series(0, :likes_count - 1) AS number
+    )
+    SELECT first_user.id, first_post.id FROM first_user, first_post
+"""
+
+
+async def seed_data(prefix: str) -> dict:
+    """Insert and commit synthetic data, return ids of the first user and post.
+
+    The first user is admin, all users have the same password.
+    """
+    async with async_session_factory() as session:
+        seeded_ids = await session.execute(
+            text(SEED_SQL),
+            {
+                'prefix': prefix,
+                'hashed_phrase': get_hashed_password(PHRASE),
+                'users_count': USERS_COUNT,
+                'posts_count': POSTS_COUNT,
+                'likes_count': LIKES_COUNT,
+            },
+            bind_arguments={'for_write': True},
+        )
+        first_user_id, first_post_id = seeded_ids.one()
+        await session.commit()
+    return {'prefix': prefix, 'user_id': first_user_id, 'post_id': first_post_id}
+
+
+async def get_auth_headers(client: AsyncClient, username: str) -> dict:
+    """Login user and get authorization headers with access token."""
+    response = await client.post(
+        '/login/',
+        data={'username': username, 'password': PHRASE},
+    )
+    response.raise_for_status()
+    return {
+        'Authorization': 'Bearer {token}'.format(
+            token=response.json()['access_token'],
+        ),
+    }
+
+
+async def get_scenarios(client: AsyncClient, seeded: dict) -> dict[str, Scenario]:
+    """Login seeded admin and user and get request of each endpoint by name.
+
+    Requests get their index, so created instances are unique and deleted
+    posts are taken from the end of seeded posts, not used by other requests.
+    """
+    prefix = seeded['prefix']
+    post_id = seeded['post_id']
+    admin_headers = await get_auth_headers(client, '{prefix}_0'.format(prefix=prefix))
+    user_headers = await get_auth_headers(client, '{prefix}_1'.format(prefix=prefix))
+    return {
+        'login': lambda client, index: client.post(
+            '/login/',
+            data={'username': '{prefix}_1'.format(prefix=prefix), 'password': PHRASE},
+        ),
+        'create_user': lambda client, index: client.post(
+            '/user/',
+            params={
+                'username': '{prefix}_new_{index}'.format(prefix=prefix, index=index),
+                'email': '{prefix}.new.{index}@example.com'.format(
+                    prefix=prefix,
+                    index=index,
+                ),
+                'password': PHRASE,
+                'password_re_check': PHRASE,
+            },
+        ),
+        'create_post': lambda client, index: client.post(
+            '/post/',
+            params={'message': 'benchmark post {index}'.format(index=index)},
+            headers=user_headers,
+        ),
+        'create_like': lambda client, index: client.post(
+            '/like/',
+            params={'post_id': post_id + index % POSTS_COUNT, 'eval': index % 2 == 0},
+            headers=user_headers,
+        ),
+        'read_user_posts': lambda client, index: client.get(
+            '/user/{id}/posts/'.format(id=seeded['user_id'] + index % USERS_COUNT),
+            headers=user_headers,
+        ),
+        'create_post_admin': lambda client, index: client.post(
+            '/admin/post/',
+            params={'message': 'admin post', 'user_id': seeded['user_id']},
+            headers=admin_headers,
+        ),
+        'read_post_admin': lambda client, index: client.get(
+            '/admin/post/{id}/'.format(id=post_id + index % POSTS_COUNT),
+            headers=admin_headers,
+        ),
+        'update_post_admin': lambda client, index: client.put(
+            '/admin/post/{id}/'.format(id=post_id + index % POSTS_COUNT),
+            params={'message': 'updated post', 'user_id': seeded['user_id']},
+            headers=admin_headers,
+        ),
+        'partially_update_post_admin': lambda client, index: client.patch(
+            '/admin/post/{id}/'.format(id=post_id + index % POSTS_COUNT),
+            params={'message': 'patched post'},
+            headers=admin_headers,
+        ),
+        'read_post_list_admin': lambda client, index: client.get(
+            '/admin/list/post/',
+            headers=admin_headers,
+        ),
+        'delete_post_admin': lambda client, index: client.delete(
+            '/admin/post/{id}/'.format(id=post_id + POSTS_COUNT - 1 - index),
+            headers=admin_headers,
+        ),
+    }
+
+
+def get_percentiles(samples: list[tuple[float, int]]) -> dict:
+    """Get nearest rank latency percentiles of samples, in milliseconds."""
+    latencies = sorted(sample[0] for sample in samples)
+    last_rank = len(latencies) - 1
+    ranks = {
+        percent: min(len(latencies) * percent // 100, last_rank)
+        for percent in (50, 95, 99)
+    }
+    return {
+        'p{percent}_ms'.format(percent=percent): latencies[rank] * 1e3
+        for percent, rank in ranks.items()
+    }
+
+
+class EndpointsBenchmark(object):
+    """Runner of endpoints requests at several concurrency levels."""
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        requests_count: int,
+        concurrency_levels: list[int],
+    ) -> None:
+        """Initialize class instance."""
+        self.client = client
+        self.requests_count = requests_count
+        self.concurrency_levels = concurrency_levels
+
+    async def run(self, scenarios: dict[str, Scenario]) -> dict:
+        """Run every scenario at every concurrency level, get results by name."""
+        return {
+            name: [
+                await self.run_level(
+                    scenario,
+                    concurrency,
+                    range(
+                        level * self.requests_count,
+                        (level + 1) * self.requests_count,
+                    ),
+                )
+                for level, concurrency in enumerate(self.concurrency_levels)
+            ]
+            for name, scenario in scenarios.items()
+        }
+
+    async def run_level(
+        self,
+        scenario: Scenario,
+        concurrency: int,
+        indexes: range,
+    ) -> dict:
+        """Run requests with given concurrency, get latencies and throughput."""
+        samples: list[tuple[float, int]] = []
+        pending_indexes = iter(indexes)
+        started_at = time.perf_counter()
+        await asyncio.gather(
+            *[
+                self._run_requests(scenario, pending_indexes, samples)
+                for _ in range(concurrency)
+            ],
+        )
+        return {
+            'concurrency': concurrency,
+            'requests': len(indexes),
+            'errors': sum(sample[1] >= 400 for sample in samples),
+            **get_percentiles(samples),
+            'throughput_rps': len(indexes) / (time.perf_counter() - started_at),
+        }
+
+    async def _run_requests(
+        self,
+        scenario: Scenario,
+        pending_indexes: Iterator[int],
+        samples: list[tuple[float, int]],
+    ) -> None:
+        """Request endpoint while there are pending indexes, record samples."""
+        for index in pending_indexes:
+            started_at = time.perf_counter()
+            response = await scenario(self.client, index)
+            samples.append((time.perf_counter() - started_at, response.status_code))
+
+
+async def main(requests_count: int, concurrency_levels: list[int]) -> dict:
+    """Seed data and benchmark every endpoint at every concurrency level."""
+    started_at = datetime.now(timezone.utc)
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        seeded = await seed_data('bench{stamp}'.format(stamp=int(time.time())))
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url='http://benchmark',
+        ) as client:
+            scenarios = await get_scenarios(client, seeded)
+            return {
+                'started_at': started_at.isoformat(),
+                'requests_per_level': requests_count,
+                'endpoints': await EndpointsBenchmark(
+                    client,
+                    requests_count,
+                    concurrency_levels,
+                ).run(scenarios),
+            }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Endpoints load benchmark.')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--output', type=argparse.FileType('w'), default=sys.stdout)
+    arguments = parser.parse_args()
+    benchmark_results = asyncio.run(main(arguments.requests, arguments.concurrency))
+    json.dump(benchmark_results, arguments.output, indent=2)
+    arguments.output.write('\n')
@@ -0,0 +1,112 @@
+"""Benchmark of daily likes time series reading.
+
+Run with ``python -m benchmarks.like_daily --likes 10000000`` against
+disposable migrated database from settings. Synthetic likes, spread over a
+year, are inserted and rolled up in one transaction, which is rolled back
+at the end. Compares raw aggregate query over likes table with reading of
+the same month from daily rollup, as admin endpoint does.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+from datetime import date
+from time import perf_counter
+
+from sqlalchemy import Date, Executable, cast, func, literal_column, not_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.common.db import async_session_factory
+from apps.likes.models import Like
+from apps.likes.statements import like_daily_statements
+from apps.main import create_app  # noqa: F401
+
+POSTS_COUNT = 1000
+REPEATS = 5
+MAX_LIKE_ID = 2**31 - 1
+DATE_FROM = date(2024, 3, 1)
+DATE_TO = date(2024, 3, 31)
+
+FILL_LIKES_SQL = """
+    WITH benchmark_user AS (
+        INSERT INTO "user" (username, password, email, is_active, is_admin)
+        VALUES ('like_daily_benchmark', '', 'like_daily@example.com', true, false)
+        RETURNING id
+    ), benchmark_posts AS (
+        INSERT INTO post (message, user_id)
+        SELECT 'benchmark', benchmark_user.id
+        FROM benchmark_user, generate_series(1, :posts_count)
+        RETURNING id
+    ), first_post AS (
+        SELECT min(id) AS id FROM benchmark_posts
+    )
+    INSERT INTO "like" (eval, created_at, user_id, post_id)
+    SELECT number % 3 <> 0,
+        TIMESTAMP WITH TIME ZONE '2024-01-01 00:00:00+00'
+            + (number % 366) * INTERVAL '1 day' + (number % 86400) * INTERVAL '1 s',
+        benchmark_user.id,
+        first_post.id + number % :posts_count
+    FROM benchmark_user, first_post, generate_series(1, :likes_count) AS number
+"""
+
+
+def get_raw_aggregate_statement() -> Executable:
+    """Create aggregate statement over likes table, as before rollup."""
+    like = Like.__table__
+    day = cast(func.timezone(literal_column("'UTC'"), like.c.created_at), Date)
+    aggregate_statement = select(
+        like.c.post_id,
+        day,
+        func.count().filter(like.c.eval),
+        func.count().filter(not_(like.c.eval)),
+    )
+    return aggregate_statement.where(day.between(DATE_FROM, DATE_TO)).group_by(
+        like.c.post_id,
+        day,
+    )
+
+
+async def measure(session: AsyncSession, statement: Executable) -> float:
+    """Get median time of statement execution with rows fetching, in ms."""
+    timings = []
+    for _ in range(REPEATS):
+        started_at = perf_counter()
+        await session.execute(statement)
+        timings.append((perf_counter() - started_at) * 1e3)
+    return statistics.median(timings)
+
+
+async def fill_likes(session: AsyncSession, likes_count: int) -> None:
+    """Insert synthetic likes and roll them up."""
+    await session.execute(
+        text(FILL_LIKES_SQL),
+        {'posts_count': POSTS_COUNT, 'likes_count': likes_count},
+        bind_arguments={'for_write': True},
+    )
+    await session.execute(like_daily_statements.refresh_statement(0, MAX_LIKE_ID))
+    await session.execute(text('ANALYZE "like", like_daily'))
+
+
+async def main(likes_count: int) -> None:
+    """Fill likes, run benchmark and rollback."""
+    async with async_session_factory() as session:
+        await fill_likes(session, likes_count)
+        raw_time = await measure(session, get_raw_aggregate_statement())
+        rollup_time = await measure(
+            session,
+            like_daily_statements.series_statement(DATE_FROM, DATE_TO),
+        )
+        await session.rollback()
+    sys.stdout.write(
+        'likes: {count}, raw aggregate: {raw:.1f} ms, rollup: {rollup:.1f} ms\n'.format(
+            count=likes_count,
+            raw=raw_time,
+            rollup=rollup_time,
+        ),
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Daily likes rollup benchmark.')
+    parser.add_argument('--likes', type=int, default=10000000)
+    asyncio.run(main(parser.parse_args().likes))
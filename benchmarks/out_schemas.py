@@ -0,0 +1,99 @@
+"""Benchmark of RETURNING rows conversion to out schemas.
+
+Run with ``python -m benchmarks.out_schemas`` against migrated database
+from settings. Compares client CPU time per create and read request of ORM
+statements, hydrating instances before schema validation, with Core
+statements, validating row mappings directly. Everything is done in one
+transaction, which is rolled back at the end.
+"""
+import asyncio
+import sys
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import Any, Awaitable, Callable
+
+from apps.common.db import async_session_factory
+from apps.common.orm_services import statement_executor as executor
+from apps.main import create_app  # noqa: F401
+from apps.user.schemas import CreateUserOut
+from apps.user.statements import user_crud_statements
+
+ITERATIONS = 1000
+
+
+async def create_with_orm(session: AsyncSession, index: int) -> None:
+    """Create user with ORM statement and validate instance with schema."""
+    statement = user_crud_statements.create_statement(obj_data=get_user_data(index))
+    created_user: Any = await executor.execute_return_statement(session, statement)
+    CreateUserOut.model_validate(created_user)
+
+
+async def create_with_core(session: AsyncSession, index: int) -> None:
+    """Create user with Core statement and validate row with schema."""
+    statement = user_crud_statements.create_statement(
+        obj_data=get_user_data(index),
+        core=True,
+    )
+    await executor.execute_return_schema(session, statement, CreateUserOut)
+
+
+async def read_with_orm(session: AsyncSession, index: int) -> None:
+    """Read user with ORM statement and validate instance with schema."""
+    statement = user_crud_statements.read_statement(
+        obj_data={'username': get_user_data(index)['username']},
+    )
+    read_user: Any = await executor.execute_return_statement(session, statement)
+    CreateUserOut.model_validate(read_user)
+
+
+async def read_with_core(session: AsyncSession, index: int) -> None:
+    """Read user with Core statement and validate row with schema."""
+    statement = user_crud_statements.read_statement(
+        obj_data={'username': get_user_data(index)['username']},
+        core=True,
+    )
+    await executor.execute_return_schema(session, statement, CreateUserOut)
+
+
+def get_user_data(index: int) -> dict:
+    """Get benchmark user data, username is used as password too."""
+    username = 'benchmark_user_{index}'.format(index=index)
+    return {
+        'username': username,
+        'email': '{username}@example.com'.format(username=username),
+        'password': username,
+    }
+
+
+async def measure(
+    session: AsyncSession,
+    run: Callable[[AsyncSession, int], Awaitable[None]],
+    start: int,
+) -> float:
+    """Get client CPU time per request in microseconds."""
+    started_at = time.process_time()
+    for index in range(start, start + ITERATIONS):
+        await run(session, index)
+    return (time.process_time() - started_at) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    """Run benchmark and write results table."""
+    sys.stdout.write('{0:<8}{1:>16}{2:>16}\n'.format('op', 'orm, us', 'core, us'))
+    async with async_session_factory() as session:
+        create_timings = (
+            await measure(session, create_with_orm, 0),
+            await measure(session, create_with_core, ITERATIONS),
+        )
+        read_timings = (
+            await measure(session, read_with_orm, 0),
+            await measure(session, read_with_core, ITERATIONS),
+        )
+        await session.rollback()
+    sys.stdout.write('{0:<8}{1:>16.1f}{2:>16.1f}\n'.format('create', *create_timings))
+    sys.stdout.write('{0:<8}{1:>16.1f}{2:>16.1f}\n'.format('read', *read_timings))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
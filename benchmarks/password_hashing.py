@@ -0,0 +1,85 @@
+"""Benchmark of event loop stalls during login burst.
+
+Run with ``python -m benchmarks.password_hashing``. Probe coroutine stands
+for unrelated endpoint, waiting for short sleep in loop, while burst of
+password checks runs inline on event loop or in password service pool.
+Probe latency over expected sleep is what any other request on the worker
+waits additionally.
+"""
+import asyncio
+import sys
+from time import perf_counter
+
+from typing_extensions import Awaitable, Callable
+
+from apps.authorization.auth_utilities import (
+    check_password,
+    get_hashed_password,
+    password_service,
+)
+
+BURST_SIZE = 16
+PROBE_INTERVAL = 0.005
+PHRASE = 'benchmark'
+hashed_phrase = get_hashed_password(PHRASE)
+
+
+async def check_inline() -> None:
+    """Check password on event loop, like before password service."""
+    check_password(PHRASE, hashed_phrase)
+
+
+async def check_in_pool() -> None:
+    """Check password in password service pool."""
+    await password_service.check_password(PHRASE, hashed_phrase)
+
+
+async def probe(latencies: list[float], burst_done: asyncio.Event) -> None:
+    """Record extra latency of short sleeps until burst is done."""
+    while not burst_done.is_set():
+        started_at = perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append(perf_counter() - started_at - PROBE_INTERVAL)
+
+
+def get_percentile(latencies: list[float], percent: int) -> float:
+    """Get nearest rank percentile of latencies, in milliseconds."""
+    sorted_latencies = sorted(latencies)
+    rank = len(sorted_latencies) * percent // 100
+    return sorted_latencies[min(rank, len(sorted_latencies) - 1)] * 1e3
+
+
+async def measure(login: Callable[[], Awaitable[None]]) -> tuple[float, ...]:
+    """Get probe p50 and p99 extra latency and burst time, in milliseconds."""
+    latencies: list[float] = []
+    burst_done = asyncio.Event()
+    probe_task = asyncio.create_task(probe(latencies, burst_done))
+    await asyncio.sleep(PROBE_INTERVAL)
+    started_at = perf_counter()
+    await asyncio.gather(*[login() for _ in range(BURST_SIZE)])
+    burst_time = (perf_counter() - started_at) * 1e3
+    burst_done.set()
+    await probe_task
+    return get_percentile(latencies, 50), get_percentile(latencies, 99), burst_time
+
+
+async def main() -> None:
+    """Run benchmark and write results table."""
+    sys.stdout.write(
+        '{0:<8}{1:>16}{2:>16}{3:>16}\n'.format(
+            'mode',
+            'p50, ms',
+            'p99, ms',
+            'burst, ms',
+        ),
+    )
+    for mode, login in (('inline', check_inline), ('pool', check_in_pool)):
+        timings = await measure(login)
+        sys.stdout.write(
+            '{0:<8}{1:>16.1f}{2:>16.1f}{3:>16.1f}\n'.format(mode, *timings),
+        )
+    password_service.shutdown()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
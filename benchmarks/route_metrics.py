@@ -0,0 +1,91 @@
+"""Benchmark of route metrics middleware overhead.
+
+Run with ``python -m benchmarks.route_metrics``, no database is needed.
+Requests are sent straight to trivial ASGI application, which sets matched
+route in scope and responds, with and without RouteMetricsMiddleware, so
+difference of their times is the middleware overhead per request. The script
+exits with error status, if overhead is not under the budget.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from apps.monitoring.route_metrics import RouteMetricsMiddleware
+
+REPEATS = 5
+OVERHEAD_BUDGET_US = 50
+ROUTE_NAME = 'benchmark_route'
+
+
+class BenchmarkRoute(object):
+    """Route, as router sets it in request scope."""
+
+    name = ROUTE_NAME
+
+
+benchmark_route = BenchmarkRoute()
+response_start = {'type': 'http.response.start', 'status': 200, 'headers': []}
+response_body = {'type': 'http.response.body', 'body': b'[]'}
+
+
+async def trivial_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """Match benchmark route and send empty JSON array."""
+    scope['route'] = benchmark_route
+    await send(response_start)
+    await send(response_body)
+
+
+async def receive_nothing() -> Message:
+    """Receive disconnect, request body is not read."""
+    return {'type': 'http.disconnect'}
+
+
+async def send_nowhere(message: Message) -> None:
+    """Drop sent message."""
+
+
+async def measure(app: ASGIApp, requests_count: int) -> float:
+    """Get median time per request in microseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        started_at = perf_counter()
+        for _ in range(requests_count):
+            await app(
+                {'type': 'http', 'method': 'GET', 'path': '/'},
+                receive_nothing,
+                send_nowhere,
+            )
+        timings.append((perf_counter() - started_at) / requests_count * 1e6)
+    return statistics.median(timings)
+
+
+async def main(requests_count: int) -> float:
+    """Run benchmark, write results and get overhead per request."""
+    bare_time = await measure(trivial_app, requests_count)
+    middleware_time = await measure(
+        RouteMetricsMiddleware(trivial_app),
+        requests_count,
+    )
+    overhead = middleware_time - bare_time
+    sys.stdout.write(
+        'requests: {count}, bare: {bare:.2f} us, with middleware: '.format(
+            count=requests_count,
+            bare=bare_time,
+        )
+        + '{middleware:.2f} us, overhead: {overhead:.2f} us\n'.format(
+            middleware=middleware_time,
+            overhead=overhead,
+        ),
+    )
+    return overhead
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Route metrics overhead benchmark.')
+    parser.add_argument('--requests', type=int, default=100000)
+    overhead = asyncio.run(main(parser.parse_args().requests))
+    sys.exit(0 if overhead < OVERHEAD_BUDGET_US else 1)
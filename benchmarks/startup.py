@@ -0,0 +1,82 @@
+"""Benchmark of application worker startup.
+
+Run with ``python -m benchmarks.startup --runs 10``, no database is needed.
+Every run starts fresh interpreter, as autoscaled worker does, which imports
+application, creates it and runs lifespan startup and shutdown, with
+background tasks disabled. Median durations of whole run and of its phases
+are written in milliseconds, interpreter phase is the rest of the run, spent
+in process start and exit.
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+
+from typing_extensions import Any
+
+worker_environment = {
+    'LIKE_DAILY_REFRESH_INTERVAL': '0',
+    'USER_ACTIVITY_FLUSH_INTERVAL': '0',
+}
+
+
+async def run_lifespan(app: Any) -> None:
+    """Start application and shut it down at once."""
+    async with app.router.lifespan_context(app):
+        await asyncio.sleep(0)
+
+
+def boot_worker() -> dict:
+    """Import, create and start application, get phases durations in seconds."""
+    started_at = time.perf_counter()
+    main_module = importlib.import_module('apps.main')
+    imports_time = time.perf_counter() - started_at
+    app = main_module.create_app()
+    asyncio.run(run_lifespan(app))
+    return {'imports': imports_time, **app.state.startup_timings}
+
+
+def run_worker() -> dict:
+    """Boot worker in new interpreter, get its phases and total durations."""
+    started_at = time.perf_counter()
+    worker = subprocess.run(  # noqa: S603
+        [sys.executable, '-m', 'benchmarks.startup', '--worker'],
+        capture_output=True,
+        check=True,
+        env={**os.environ, **worker_environment},
+    )
+    total_time = time.perf_counter() - started_at
+    phases = json.loads(worker.stdout)
+    return {
+        'interpreter': total_time - sum(phases.values()),
+        **phases,
+        'total': total_time,
+    }
+
+
+def main(runs_count: int) -> None:
+    """Boot workers and write median durations of phases."""
+    runs = [run_worker() for _ in range(runs_count)]
+    for phase in runs[0]:
+        sys.stdout.write(
+            '{phase}: {duration:.1f} ms\n'.format(
+                phase=phase,
+                duration=statistics.median(run[phase] for run in runs) * 1e3,
+            ),
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Worker startup benchmark.')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--worker', action='store_true')
+    arguments = parser.parse_args()
+    if arguments.worker:
+        json.dump(boot_worker(), sys.stdout)
+    else:
+        main(arguments.runs)
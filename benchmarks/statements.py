@@ -0,0 +1,103 @@
+"""Microbenchmark of CRUD statements construction and compilation.
+
+Run with ``python -m benchmarks.statements``. Compares per call cost of
+building statements from scratch with cached statement templates, both
+through compiled cache lookup (as engine does) and with full compilation.
+"""
+import sys
+import timeit
+
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.sql import ClauseElement
+from typing_extensions import Callable, cast
+
+from apps.common.base_statements import BaseCRUDStatements, BoundStatement
+from apps.likes.models import Like
+from apps.main import create_app  # noqa: F401
+
+ITERATIONS = 5000
+dialect = asyncpg_dialect()
+
+operations: dict[str, Callable[[BaseCRUDStatements], BoundStatement]] = {
+    'create': lambda crud: crud.create_statement(
+        obj_data={'eval': True, 'post_id': 1, 'user_id': 1},
+    ),
+    'read': lambda crud: crud.read_statement(obj_data={'id': 1}),
+    'update': lambda crud: crud.update_statement(
+        schema={'eval': False},
+        where_data={'id': 1},
+    ),
+    'delete': lambda crud: crud.delete_statement(obj_data={'id': 1}),
+}
+
+
+def run_cached_compile(bound: BoundStatement, compiled_cache: dict) -> None:
+    """Get compiled statement from cache by statement cache key."""
+    statement = cast(ClauseElement, bound.statement)
+    elem_cache_key = statement._generate_cache_key()  # noqa: WPS437
+    if elem_cache_key is None:
+        run_full_compile(bound)
+        return
+    compiled = compiled_cache.get(elem_cache_key.key)
+    if compiled is None:
+        compiled = statement.compile(dialect=dialect)
+        compiled_cache[elem_cache_key.key] = compiled
+    compiled.construct_params(bound.bind_values)
+
+
+def run_full_compile(bound: BoundStatement) -> None:
+    """Compile statement without compiled cache."""
+    statement = cast(ClauseElement, bound.statement)
+    statement.compile(dialect=dialect).construct_params(bound.bind_values)
+
+
+def measure(run: Callable[[], None]) -> float:
+    """Get time per call in microseconds."""
+    run()
+    return timeit.timeit(run, number=ITERATIONS) / ITERATIONS * 1e6
+
+
+def measure_operation(
+    operation: Callable[[BaseCRUDStatements], BoundStatement],
+    cached_crud: BaseCRUDStatements,
+    compiled_cache: dict,
+) -> tuple[float, ...]:
+    """Measure operation with fresh statements and with statement templates."""
+    return (
+        measure(
+            lambda: run_cached_compile(
+                operation(BaseCRUDStatements(model=Like)),
+                compiled_cache,
+            ),
+        ),
+        measure(lambda: run_cached_compile(operation(cached_crud), compiled_cache)),
+        measure(lambda: run_full_compile(operation(BaseCRUDStatements(model=Like)))),
+        measure(lambda: run_full_compile(operation(cached_crud))),
+    )
+
+
+def main() -> None:
+    """Run benchmark and write results table."""
+    cached_crud = BaseCRUDStatements(model=Like)
+    compiled_cache: dict = {}
+    sys.stdout.write(
+        '{0:<8}{1:>22}{2:>22}{3:>22}{4:>22}\n'.format(
+            'op',
+            'fresh+cache, us',
+            'template+cache, us',
+            'fresh+compile, us',
+            'template+compile, us',
+        ),
+    )
+    for name, operation in operations.items():
+        timings = measure_operation(operation, cached_crud, compiled_cache)
+        sys.stdout.write(
+            '{0:<8}{1:>22.1f}{2:>22.1f}{3:>22.1f}{4:>22.1f}\n'.format(
+                name,
+                *timings,
+            ),
+        )
+
+
+if __name__ == '__main__':
+    main()
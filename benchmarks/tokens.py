@@ -0,0 +1,47 @@
+"""Microbenchmark of access token verification.
+
+Run with ``python -m benchmarks.tokens``. Compares per call cost of full
+python-jose decode with validation of token payload and of verified token
+data cache hit.
+"""
+import sys
+import timeit
+
+from jose import jwt
+
+from apps.authorization.auth_utilities import create_access_token
+from apps.authorization.schemas import TokenPayload
+from apps.common.common_utilities import get_token_data, token_cache
+from settings import Settings
+
+ITERATIONS = 20000
+
+
+def decode_token(token: str) -> TokenPayload:
+    """Verify and decode token without cache, like before caching."""
+    return TokenPayload(
+        **jwt.decode(
+            token,
+            Settings.JWT_SECRET_KEY,
+            algorithms=[Settings.JWT_ALGORITHM],
+        ),
+    )
+
+
+def main() -> None:
+    """Run benchmark and write results."""
+    token = create_access_token('benchmark@example.com')
+    get_token_data(token)
+    decode_time = timeit.timeit(lambda: decode_token(token), number=ITERATIONS)
+    cached_time = timeit.timeit(lambda: get_token_data(token), number=ITERATIONS)
+    sys.stdout.write(
+        'decode: {decode:.1f} us, cache hit: {cached:.1f} us, hits: {hits}\n'.format(
+            decode=decode_time / ITERATIONS * 1e6,
+            cached=cached_time / ITERATIONS * 1e6,
+            hits=token_cache.hits,
+        ),
+    )
+
+
+if __name__ == '__main__':
+    main()
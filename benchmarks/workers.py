@@ -0,0 +1,123 @@
+"""Benchmark of server throughput with one and several workers.
+
+Run with ``python -m benchmarks.workers --workers 4 --path /metrics``. Server
+is started by ``python -m apps`` runner on free port, with one worker and
+with given workers count and background tasks disabled. It is loaded by
+several client processes over keep-alive connections for given duration,
+and throughput of each run is written. Database is needed only for paths,
+which read it.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess  # noqa: S404
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+
+READY_TIMEOUT = 30
+server_environment = {
+    'LIKE_DAILY_REFRESH_INTERVAL': '0',
+    'USER_ACTIVITY_FLUSH_INTERVAL': '0',
+}
+
+
+def get_free_port() -> int:
+    """Get port, which is free now."""
+    with socket.socket() as free_socket:
+        free_socket.bind(('127.0.0.1', 0))
+        return free_socket.getsockname()[1]
+
+
+def start_server(workers_count: int, port: int) -> subprocess.Popen:
+    """Start server by runner and wait until it responds."""
+    server = subprocess.Popen(  # noqa: S603
+        [sys.executable, '-m', 'apps'],
+        env={
+            **os.environ,
+            **server_environment,
+            'HOST': '127.0.0.1',
+            'PORT': str(port),
+            'WORKERS_COUNT': str(workers_count),
+        },
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + READY_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            httpx.get('http://127.0.0.1:{port}/'.format(port=port))
+        except httpx.TransportError:
+            time.sleep(0.1)
+        else:
+            return server
+    server.terminate()
+    raise RuntimeError('Server is not started in time')
+
+
+async def request_until(client: httpx.AsyncClient, url: str, deadline: float) -> int:
+    """Request url sequentially until deadline, count responses."""
+    responses_count = 0
+    while time.monotonic() < deadline:
+        response = await client.get(url)
+        response.raise_for_status()
+        responses_count += 1
+    return responses_count
+
+
+async def load(url: str, concurrency: int, duration: float) -> int:
+    """Request url by concurrent connections until deadline, count responses."""
+    deadline = time.monotonic() + duration
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=concurrency),
+    ) as client:
+        responses_counts = await asyncio.gather(
+            *[request_until(client, url, deadline) for _ in range(concurrency)],
+        )
+    return sum(responses_counts)
+
+
+def run_client(url: str, concurrency: int, duration: float) -> int:
+    """Load url from client process, get responses count."""
+    return asyncio.run(load(url, concurrency, duration))
+
+
+def measure_throughput(workers_count: int, arguments: argparse.Namespace) -> float:
+    """Start server with workers count, load it and get responses per second."""
+    port = get_free_port()
+    server = start_server(workers_count, port)
+    url = 'http://127.0.0.1:{port}{path}'.format(port=port, path=arguments.path)
+    try:  # noqa: WPS501
+        with ProcessPoolExecutor(max_workers=arguments.clients) as executor:
+            clients = [
+                executor.submit(
+                    run_client,
+                    url,
+                    arguments.concurrency,
+                    arguments.duration,
+                )
+                for _ in range(arguments.clients)
+            ]
+            return sum(client.result() for client in clients) / arguments.duration
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Server workers benchmark.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--path', default='/metrics')
+    parser.add_argument('--clients', type=int, default=4)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10)
+    arguments = parser.parse_args()
+    for workers_count in sorted({1, arguments.workers}):
+        sys.stdout.write(
+            'workers: {count}, throughput: {throughput:.0f} rps\n'.format(
+                count=workers_count,
+                throughput=measure_throughput(workers_count, arguments),
+            ),
+        )
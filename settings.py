@@ -6,6 +6,7 @@ from pydantic import Extra, Field, PostgresDsn, field_validator
 from pydantic_core.core_schema import ValidationInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from sqlalchemy.engine import URL
+from typing_extensions import Literal
 
 
 def _build_db_dsn(values_dict: dict, async_dsn: bool = False) -> URL:
@@ -41,16 +42,67 @@ class MainSettings(BaseSettings):
     POSTGRES_PORT: int = Field(default=5432)
     POSTGRES_DSN: PostgresDsn | None = Field(default=None)
     POSTGRES_DSN_ASYNC: PostgresDsn | None = Field(default=None)
+    POSTGRES_POOL_SIZE: int = Field(default=5)
+    POSTGRES_MAX_OVERFLOW: int = Field(default=10)
+    POSTGRES_POOL_TIMEOUT: float = Field(default=30)
+    POSTGRES_POOL_RECYCLE: int = Field(default=-1)
+    POSTGRES_POOL_PRE_PING: bool = Field(default=False)
+    POSTGRES_STATEMENT_CACHE_SIZE: int = Field(default=100)
+    POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: int = Field(default=100)
+    POSTGRES_REPLICA_DSNS_ASYNC: list[str] = Field(default=[])
+    POSTGRES_REPLICA_EJECT_SECONDS: int = Field(default=30)
+    POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL: int = Field(default=10)
+
+    # QUERY METRICS SETTINGS
+    SLOW_QUERY_THRESHOLD: float = Field(default=0.5)
+    MAX_REQUEST_QUERIES: int = Field(default=0)
+    SERVER_TIMING_ENABLED: bool = Field(default=False)
+
+    # RATE LIMITS SETTINGS
+    RATE_LIMITS: dict[str, tuple[int, float]] = Field(
+        default={'login': (10, 60), 'create_like': (60, 60)},
+    )
 
     # BACK-END SETTINGS
     DEBUG: bool = Field(default=False)
     ENABLE_OPENAPI: bool = Field(default=False)
+    OPENAPI_SCHEMA_DIR: str = Field(default='openapi')
     HOST: str = Field(default='127.0.0.1')
     PORT: int = Field(default=8000)
     WORKERS_COUNT: int = Field(default=1)
+    WORKER_MAX_REQUESTS: int = Field(default=0)
+    GRACEFUL_SHUTDOWN_TIMEOUT: int = Field(default=30)
     TRUSTED_HOSTS: list[str] = Field(default=['*'])
     DATETIME_FORMAT: str = Field('%Y-%m-%d %H:%M:%S')  # noqa WPS323
 
+    # PAGINATION SETTINGS
+    PAGINATION_DEFAULT_LIMIT: int = Field(default=50)
+    PAGINATION_MAX_LIMIT: int = Field(default=500)
+    STREAM_YIELD_PER: int = Field(default=1000)
+
+    # BULK CREATE SETTINGS
+    BULK_CREATE_CHUNK_SIZE: int = Field(default=1000)
+    BULK_CREATE_MAX_CHUNK_SIZE: int = Field(default=5000)
+    BULK_CREATE_MAX_ITEMS: int = Field(default=100000)
+
+    # CACHE SETTINGS
+    USER_CACHE_MAX_SIZE: int = Field(default=1024)
+    USER_CACHE_TTL: int = Field(default=60)
+    TOKEN_CACHE_MAX_SIZE: int = Field(default=4096)
+
+    # PASSWORD HASHING SETTINGS
+    PASSWORD_EXECUTOR: Literal['thread', 'process'] = Field(default='thread')
+    PASSWORD_WORKERS: int = Field(default=2)
+    PASSWORD_MAX_PENDING: int = Field(default=64)
+
+    # ROLLUPS SETTINGS
+    LIKE_DAILY_REFRESH_INTERVAL: int = Field(default=60)
+    LIKE_DAILY_LAG_SECONDS: int = Field(default=60)
+    LIKE_DAILY_MAX_DAYS: int = Field(default=366)
+
+    # USER ACTIVITY SETTINGS
+    USER_ACTIVITY_FLUSH_INTERVAL: int = Field(default=10)
+
     # ONE-TIME TOKEN SETTINGS
     TOKEN_LIFE_TIME: int = Field(default=3600)
 
@@ -94,9 +146,3 @@ def get_settings() -> MainSettings:
 
 
 Settings: MainSettings = get_settings()
-
-if Settings.DEBUG:
-    import pprint  # noqa WPS400
-
-    printer = pprint.PrettyPrinter()
-    printer.pprint(Settings.dict())
@@ -17,4 +17,8 @@ metadata = [
         'name': 'Users application',
         'description': "Available endpoints from 'users' app",
     },
+    {
+        'name': 'Monitoring application',
+        'description': "Available endpoints from 'monitoring' app",
+    },
 ]
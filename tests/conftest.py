@@ -0,0 +1,46 @@
+"""Project tests fixtures.
+
+Install test dependencies with ``poetry install --with test`` and run tests
+with ``python -m pytest``. Tests writing to Postgres use migrated database
+from settings, they are skipped, if it is not available.
+"""
+import pytest
+from sqlalchemy import URL, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+from typing_extensions import AsyncIterator, cast
+
+from settings import Settings
+
+USER_TABLE_SQL = text("SELECT to_regclass('\"user\"')")
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests with asyncio only."""
+    return 'asyncio'
+
+
+@pytest.fixture
+async def connection() -> AsyncIterator[AsyncConnection]:
+    """Get connection to database from settings in transaction rolled back after test.
+
+    Test is skipped, if database is not available or not migrated.
+    """
+    engine = create_async_engine(
+        cast(URL, Settings.POSTGRES_DSN_ASYNC),
+        poolclass=NullPool,
+    )
+    try:
+        db_connection = await engine.connect()
+    except (OSError, DBAPIError) as error:
+        await engine.dispose()
+        pytest.skip('Database is not available: {error}'.format(error=error))
+    async with db_connection:
+        if await db_connection.scalar(USER_TABLE_SQL) is None:
+            pytest.skip('Database is not migrated')
+        async with db_connection.begin() as transaction:
+            yield db_connection
+            await transaction.rollback()
+    await engine.dispose()
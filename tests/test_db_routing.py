@@ -0,0 +1,124 @@
+"""Read replicas routing tests with two SQLite databases."""
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, event, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from typing_extensions import AsyncIterator
+
+from apps.common.db_routing import ReplicaRouter, RoutingSession
+
+pytestmark = pytest.mark.anyio
+
+item_table = Table('item', MetaData(), Column('id', Integer, primary_key=True))
+
+
+async def create_engine(database_path: Path, executed: list[str]) -> AsyncEngine:
+    """Create engine of database with item table, logging its statements."""
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///{path}'.format(path=database_path),
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(item_table.metadata.create_all)
+    event.listen(
+        engine.sync_engine,
+        'before_cursor_execute',
+        lambda *args: executed.append(database_path.stem),
+    )
+    return engine
+
+
+@pytest.fixture
+def executed() -> list[str]:
+    """Get names of databases, which executed statements, in order."""
+    return []
+
+
+@pytest.fixture
+async def replica_router(
+    tmp_path: Path,
+    executed: list[str],
+) -> AsyncIterator[ReplicaRouter]:
+    """Get router of one replica."""
+    replica = await create_engine(tmp_path / 'replica.db', executed)
+    yield ReplicaRouter([replica], eject_seconds=30)
+    await replica.dispose()
+
+
+@pytest.fixture
+async def session(
+    tmp_path: Path,
+    executed: list[str],
+    replica_router: ReplicaRouter,
+) -> AsyncIterator[AsyncSession]:
+    """Get session of primary database and replica router."""
+    primary = await create_engine(tmp_path / 'primary.db', executed)
+    executed.clear()
+    async with AsyncSession(
+        bind=primary,
+        sync_session_class=RoutingSession,
+        replica_router=replica_router,
+    ) as routing_session:
+        yield routing_session
+    await primary.dispose()
+
+
+async def test_reads_go_to_replica(session: AsyncSession, executed: list[str]) -> None:
+    """Plain reads are executed by replica."""
+    await session.execute(select(item_table))
+    await session.execute(select(item_table.c.id))
+    assert executed == ['replica', 'replica']
+
+
+async def test_writes_stick_to_primary(
+    session: AsyncSession,
+    executed: list[str],
+) -> None:
+    """Reads after write are executed by primary."""
+    await session.execute(select(item_table))
+    await session.execute(insert(item_table).values(id=1))
+    await session.execute(select(item_table))
+    assert executed == ['replica', 'primary', 'primary']
+
+
+async def test_locking_reads_go_to_primary(
+    session: AsyncSession,
+    executed: list[str],
+) -> None:
+    """Reads with lock and reads after them are executed by primary."""
+    await session.execute(select(item_table).with_for_update())
+    await session.execute(select(item_table))
+    assert executed == ['primary', 'primary']
+
+
+async def test_textual_statements_go_to_primary(
+    session: AsyncSession,
+    executed: list[str],
+) -> None:
+    """Textual statements and reads after them are executed by primary."""
+    await session.execute(text('DELETE FROM item'))
+    await session.execute(select(item_table))
+    assert executed == ['primary', 'primary']
+
+
+async def test_for_write_goes_to_primary(
+    session: AsyncSession,
+    executed: list[str],
+) -> None:
+    """Reads with 'for_write' bind argument are executed by primary."""
+    await session.execute(select(item_table), bind_arguments={'for_write': True})
+    await session.execute(select(item_table))
+    assert executed == ['primary', 'primary']
+
+
+async def test_primary_is_kept_after_replica_recovery(
+    session: AsyncSession,
+    executed: list[str],
+    replica_router: ReplicaRouter,
+) -> None:
+    """Session, which read from primary without replicas, keeps primary."""
+    replica_router.eject(replica_router.replicas[0])
+    await session.execute(select(item_table))
+    replica_router.replicas[0].ejected_until = 0
+    await session.execute(select(item_table))
+    assert executed == ['primary', 'primary']
@@ -0,0 +1,108 @@
+"""Daily likes rollup tests, run against migrated Postgres."""
+import pytest
+from fastapi import Request
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from typing_extensions import AsyncIterator, Optional
+
+from apps.likes.handlers import like_handlers
+from apps.likes.models import LikeDaily
+from apps.likes.rollups import refresh_like_daily
+from apps.likes.schemas import CreateLikeIn, DeleteLikeIn
+from apps.posts.models import Post
+from apps.user.models import User
+from settings import Settings
+
+pytestmark = pytest.mark.anyio
+
+request = Request({'type': 'http'})
+LIKE_CHANGES = (
+    (True, (1, 0)),
+    (False, (0, 1)),
+    (None, (0, 0)),
+)
+
+
+@pytest.fixture
+async def session(
+    connection: AsyncConnection,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[AsyncSession]:
+    """Get session, which commits to savepoints, rollup refresh has no lag."""
+    monkeypatch.setattr(Settings, 'LIKE_DAILY_LAG_SECONDS', 0)
+    async with AsyncSession(
+        bind=connection,
+        join_transaction_mode='create_savepoint',
+    ) as db_session:
+        yield db_session
+
+
+@pytest.fixture
+async def user(connection: AsyncConnection) -> User:
+    """Get user, who likes post."""
+    stamp = id(connection)
+    insert_result = await connection.execute(
+        insert(User).returning(User.id),
+        {
+            'username': 'rollup{stamp}'.format(stamp=stamp),
+            'password': 'not hashed',
+            'email': 'rollup{stamp}@example.com'.format(stamp=stamp),
+        },
+    )
+    return User(id=insert_result.scalar_one())
+
+
+@pytest.fixture
+async def post_id(connection: AsyncConnection, user: User) -> int:
+    """Get id of post, which is liked."""
+    insert_result = await connection.execute(
+        insert(Post).returning(Post.id),
+        {'message': 'rollup post', 'user_id': user.id},
+    )
+    return insert_result.scalar_one()
+
+
+async def vote(
+    session: AsyncSession,
+    user: User,
+    post_id: int,
+    like: Optional[bool],
+) -> None:
+    """Like or dislike post, updating evaluation of existing like, or unlike it."""
+    if like is None:
+        delete_in = DeleteLikeIn(post_id=post_id)
+        await like_handlers.delete_like(request, delete_in, user, session)
+    else:
+        like_in = CreateLikeIn(eval=like, post_id=post_id)
+        await like_handlers.create_like(request, like_in, user, session)
+
+
+async def refresh_and_count(session: AsyncSession, post_id: int) -> tuple:
+    """Refresh rollup and get likes and dislikes of post from it."""
+    await refresh_like_daily(session)
+    count_statement = select(LikeDaily.likes, LikeDaily.dislikes).where(
+        LikeDaily.post_id == post_id,
+    )
+    return tuple((await session.execute(count_statement)).one())
+
+
+async def test_rollup_follows_like_changes(
+    session: AsyncSession,
+    user: User,
+    post_id: int,
+) -> None:
+    """Rolled up like is moved on evaluation change and removed on unlike."""
+    for like, expected_count in LIKE_CHANGES:
+        await vote(session, user, post_id, like)
+        assert await refresh_and_count(session, post_id) == expected_count
+
+
+async def test_rollup_adds_changed_like_once(
+    session: AsyncSession,
+    user: User,
+    post_id: int,
+) -> None:
+    """Like changed before refresh is added with its last evaluation."""
+    await vote(session, user, post_id, like=True)
+    await vote(session, user, post_id, like=False)
+    assert await refresh_and_count(session, post_id) == (0, 1)
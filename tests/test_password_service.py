@@ -0,0 +1,48 @@
+"""Password service tests, hashing is replaced with operation test releases."""
+import asyncio
+from threading import Event
+
+import pytest
+
+from apps.authorization import auth_utilities
+from apps.common.exceptions import BackendError
+
+pytestmark = pytest.mark.anyio
+
+OPERATION_TIMEOUT = 5
+
+
+@pytest.fixture
+def release(monkeypatch: pytest.MonkeyPatch) -> Event:
+    """Get event, which lets hashing in worker pool finish."""
+    release_event = Event()
+
+    def wait_release(password: str) -> str:  # noqa: WPS430
+        release_event.wait(OPERATION_TIMEOUT)
+        return password
+
+    monkeypatch.setattr(auth_utilities, 'get_hashed_password', wait_release)
+    return release_event
+
+
+async def test_cancelled_operation_keeps_pending_slot(release: Event) -> None:
+    """Slot of cancelled caller is released, when worker finishes operation."""
+    password_service = auth_utilities.PasswordService(
+        'thread',
+        max_workers=1,
+        max_pending=1,
+    )
+    cancelled_task = asyncio.create_task(password_service.hash_password('first'))
+    await asyncio.sleep(0)
+    cancelled_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled_task
+    with pytest.raises(BackendError, match='Too many password operations'):
+        await password_service.hash_password('second')
+    release.set()
+    for _ in range(OPERATION_TIMEOUT * 100):
+        await asyncio.sleep(0.01)
+        if not password_service._pending:  # noqa: WPS437
+            break
+    assert await password_service.hash_password('third') == 'third'
+    password_service.shutdown()
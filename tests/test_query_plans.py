@@ -0,0 +1,158 @@
+"""Hot lookups query plans tests, run against migrated Postgres.
+
+Synthetic users, posts and likes are inserted in test transaction, which is
+rolled back at the end. Plans of CRUD statements, used for hot lookups and
+foreign keys cascades, are got with ``EXPLAIN (FORMAT JSON)``, and test
+fails with sequentially scanned tables, if any of them falls back to
+sequential scan.
+"""
+import json
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import ClauseElement, Executable, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from typing_extensions import Any, cast
+
+from apps.common.base_statements import BoundStatement
+from apps.likes.statements import like_crud_statements
+from apps.posts.statements import post_crud_statements
+from apps.user.statements import user_crud_statements
+
+pytestmark = pytest.mark.anyio
+
+USERS_COUNT = 1000
+POSTS_COUNT = 10000
+LIKES_COUNT = 200000
+PAGE_LIMIT = 50
+LOOKUP_EMAIL = 'query_plans_1@example.com'
+
+FILL_SQL = """
+    WITH plan_users AS (
+        INSERT INTO "user" (username, password, email, is_active, is_admin)
+        SELECT 'query_plans_' || number, '', 'query_plans_' || number || '@example.com',
+            true, false
+        FROM generate_series(1, :users_count) AS number
+        RETURNING id
+    ), first_user AS (
+        SELECT min(id) AS id FROM plan_users
+    ), plan_posts AS (
+        INSERT INTO post (message, user_id)
+        SELECT 'query plans', first_user.id + number % :users_count
+        FROM first_user, generate_series(1, :posts_count) AS number
+        RETURNING id
+    ), first_post AS (
+        SELECT min(id) AS id FROM plan_posts
+    )
+    INSERT INTO "like" (eval, created_at, user_id, post_id)
+    SELECT number % 3 <> 0,
+        TIMESTAMP WITH TIME ZONE '2024-01-01 00:00:00+00' + number * INTERVAL '1 s',
+        first_user.id + number % :users_count,
+        first_post.id + (number / :users_count) % :posts_count
+    FROM first_user, first_post, generate_series(1, :likes_count) AS number
+"""
+
+
+class Explain(Executable, ClauseElement):
+    """Plan of statement in JSON format, which is not executed."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement) -> None:
+        """Explain given statement."""
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def compile_explain(element: Explain, compiler: SQLCompiler, **kwargs: Any) -> str:
+    """Compile explain of statement, with statement parameters bound."""
+    return 'EXPLAIN (FORMAT JSON) {sql}'.format(
+        sql=compiler.process(element.statement, **kwargs),
+    )
+
+
+def get_hot_lookups(
+    user_id: int,
+    post_id: int,
+) -> dict[str, Executable | BoundStatement]:
+    """Get statements of hot lookups by their names."""
+    like_table = like_crud_statements.table
+    return {
+        'user by email': user_crud_statements.read_statement(
+            obj_data={'email': LOOKUP_EMAIL},
+        ),
+        'posts of user page': post_crud_statements.children_page_statement(
+            parent_key='user_id',
+            parent_id=user_id,
+            limit=PAGE_LIMIT,
+            after=(datetime(2030, 1, 1, tzinfo=timezone.utc), post_id),
+        ),
+        'post by id': post_crud_statements.read_statement(obj_data={'id': post_id}),
+        'likes of post': like_crud_statements.list_statement(
+            filters={'post_id': post_id},
+        ),
+        'likes of user': like_crud_statements.list_statement(
+            filters={'user_id': user_id},
+        ),
+        'like of user to post': like_crud_statements.delete_statement(
+            obj_data={'user_id': user_id, 'post_id': post_id},
+            core=True,
+        ),
+        'likes by created at': select(like_table).where(
+            like_table.c.created_at.between(
+                datetime(2024, 1, 2, tzinfo=timezone.utc),
+                datetime(2024, 1, 2, 1, tzinfo=timezone.utc),
+            ),
+        ),
+    }
+
+
+def find_sequential_scans(plan: dict) -> list[str]:
+    """Get names of relations, scanned sequentially by plan node or subplans."""
+    scans = [plan['Relation Name']] if plan['Node Type'] == 'Seq Scan' else []
+    for subplan in plan.get('Plans', []):
+        scans.extend(find_sequential_scans(subplan))
+    return scans
+
+
+async def fill_data(connection: AsyncConnection) -> tuple[int, int]:
+    """Insert and analyze synthetic data, return ids of user and post to look up."""
+    await connection.execute(
+        text(FILL_SQL),
+        {
+            'users_count': USERS_COUNT,
+            'posts_count': POSTS_COUNT,
+            'likes_count': LIKES_COUNT,
+        },
+    )
+    await connection.execute(text('ANALYZE "user", post, "like"'))
+    lookup_ids = await connection.execute(
+        text('SELECT max(user_id), max(post_id) FROM "like"'),
+    )
+    return tuple(lookup_ids.one())
+
+
+async def get_sequential_scans(
+    connection: AsyncConnection,
+    statement: Executable | BoundStatement,
+) -> list[str]:
+    """Get tables, scanned sequentially by plan of statement."""
+    if not isinstance(statement, BoundStatement):
+        statement = BoundStatement(statement, {})
+    plans = await connection.scalar(
+        Explain(cast(ClauseElement, statement.statement)),
+        statement.bind_values,
+    )
+    return find_sequential_scans(json.loads(plans)[0]['Plan'])
+
+
+async def test_hot_lookups_use_indexes(connection: AsyncConnection) -> None:
+    """No hot lookup falls back to sequential scan."""
+    lookups = get_hot_lookups(*await fill_data(connection))
+    sequential_scans = {
+        name: await get_sequential_scans(connection, statement)
+        for name, statement in lookups.items()
+    }
+    assert not any(sequential_scans.values()), sequential_scans
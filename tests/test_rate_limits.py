@@ -0,0 +1,123 @@
+"""Rate limits tests, time of buckets is set by test."""
+import pytest
+from fastapi import Depends, FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from apps.authorization.auth_utilities import create_access_token
+from apps.common import rate_limits
+from apps.main import add_exception_handlers
+
+pytestmark = pytest.mark.anyio
+
+REFILL_STEPS = (
+    (0, 0),
+    (0, 0),
+    (0, 30),
+    (15, 15),
+    (15, 0),
+    (600, 0),
+    (0, 0),
+    (0, 30),
+)
+
+
+class Clock(object):
+    """Monotonic time, which moves only, when test moves it."""
+
+    def __init__(self) -> None:
+        """Initialize class instance."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Get current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Get clock of rate limits buckets."""
+    test_clock = Clock()
+    monkeypatch.setattr(rate_limits, 'monotonic', test_clock)
+    return test_clock
+
+
+async def read_nothing() -> dict:
+    """Get empty response body."""
+    return {}
+
+
+def get_request(authorization: str = '') -> Request:
+    """Get request from client address with authorization header."""
+    return Request(
+        {
+            'type': 'http',
+            'headers': [(b'authorization', authorization.encode())],
+            'client': ('10.0.0.1', 50000),
+        },
+    )
+
+
+async def test_bucket_refill(clock: Clock) -> None:
+    """Empty bucket gets capacity tokens per period, but not over capacity."""
+    backend = rate_limits.InMemoryRateLimitBackend(max_idle=60)
+    for elapsed, retry_after in REFILL_STEPS:
+        clock.now += elapsed
+        assert await backend.take_token('client', 2, 60) == retry_after
+
+
+async def test_idle_buckets_are_evicted(clock: Clock) -> None:
+    """Buckets idle for max idle time are removed, recently used are kept."""
+    backend = rate_limits.InMemoryRateLimitBackend(max_idle=60)
+    await backend.take_token('idle', 1, 60)
+    clock.now += 30
+    await backend.take_token('active', 1, 60)
+    clock.now += 30
+    await backend.take_token('new', 1, 60)
+    assert list(backend._buckets) == ['active', 'new']  # noqa: WPS437
+
+
+def test_client_key_is_token_subject() -> None:
+    """Authenticated user is identified by token subject."""
+    request = get_request(
+        'Bearer {token}'.format(token=create_access_token(subject=42)),
+    )
+    assert rate_limits.get_client_key(request) == 'user:42'
+
+
+@pytest.mark.parametrize('authorization', ['', 'Bearer', 'Bearer invalid', 'Basic a'])
+def test_client_key_is_address(authorization: str) -> None:
+    """Anonymous user and user with invalid token are identified by address."""
+    assert rate_limits.get_client_key(get_request(authorization)) == 'address:10.0.0.1'
+
+
+async def test_limited_route_fails(clock: Clock) -> None:
+    """Request over limit returns JSEND fail with Retry-After header."""
+    app = FastAPI(
+        dependencies=[
+            Depends(
+                rate_limits.RateLimiter(
+                    {'limited': (1, 60)},
+                    rate_limits.InMemoryRateLimitBackend(60),
+                ),
+            ),
+        ],
+    )
+    app.get('/limited/', name='limited')(read_nothing)
+    app.get('/free/', name='free')(read_nothing)
+    add_exception_handlers(app)
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url='http://test',
+    ) as client:
+        assert (await client.get('/limited/')).status_code == 200
+        clock.now += 1
+        response = await client.get('/limited/')
+        assert (await client.get('/free/')).status_code == 200
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '59'
+    assert response.json() == {
+        'status': 'fail',
+        'data': None,
+        'message': 'Too many requests, retry after 59 seconds.',
+        'code': 429,
+    }
@@ -0,0 +1,75 @@
+"""User activity flush tests, writing ones run against migrated Postgres."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import Row, insert, select
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from apps.user import activity
+from apps.user.models import User
+from apps.user.statements import user_crud_statements
+
+pytestmark = pytest.mark.anyio
+
+PAST = datetime(2000, 1, 1, tzinfo=timezone.utc)
+FUTURE = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+
+def test_activity_statement_casts_to_timestamptz() -> None:
+    """Times are bound and cast as type of users times columns."""
+    statement = user_crud_statements.update_activity_statement([(1, PAST, None)])
+    sql = str(statement.compile(dialect=asyncpg.dialect()))
+    assert 'DATETIME' not in sql
+    assert 'WITHOUT TIME ZONE' not in sql
+    assert sql.count('AS TIMESTAMP WITH TIME ZONE') == 2
+
+
+async def get_user_times(connection: AsyncConnection, user_id: int) -> Row:
+    """Get request, visit and update times of user."""
+    times_statement = select(
+        User.last_request_at,
+        User.last_visit_at,
+        User.updated_at,
+    ).where(User.id == user_id)
+    return (await connection.execute(times_statement)).one()
+
+
+@pytest.fixture
+async def user_id(connection: AsyncConnection) -> int:
+    """Get id of user, who made request long ago and will visit in future."""
+    stamp = id(connection)
+    insert_result = await connection.execute(
+        insert(User).returning(User.id),
+        {
+            'username': 'activity{stamp}'.format(stamp=stamp),
+            'password': 'not hashed',
+            'email': 'activity{stamp}@example.com'.format(stamp=stamp),
+            'last_request_at': PAST,
+            'last_visit_at': FUTURE,
+        },
+    )
+    return insert_result.scalar_one()
+
+
+async def test_flush_moves_times_forward_only(
+    connection: AsyncConnection,
+    user_id: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Flush sets the later of recorded and stored times and keeps updated_at."""
+    stored_times = await get_user_times(connection, user_id)
+    monkeypatch.setattr(
+        activity,
+        'async_session_factory',
+        lambda: AsyncSession(bind=connection, join_transaction_mode='create_savepoint'),
+    )
+    buffer = activity.UserActivityBuffer()
+    buffer.record_request(user_id)
+    buffer.record_visit(user_id)
+    assert await buffer.flush() == 1
+    flushed_times = await get_user_times(connection, user_id)
+    assert flushed_times.last_request_at > PAST
+    assert flushed_times.last_visit_at == FUTURE
+    assert flushed_times.updated_at == stored_times.updated_at
+    assert buffer.get_stats()['failed_flushes'] == 0